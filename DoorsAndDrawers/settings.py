@@ -30,6 +30,28 @@ if getattr(sys, 'frozen', False):
     os.makedirs(LOG_DIR, exist_ok=True)
 else:
     LOG_DIR = os.path.join(BASE_DIR, 'logs')
+LOG_MAX_BYTES = 10 * 1024 * 1024  # app.log is rotated and gzipped above this size
+LOG_BACKUP_COUNT = 5  # Rotated logs kept
+HTTP_LOG_SAMPLE_RATE = 1.0  # Share of successful requests logged; errors are always logged
+SLOW_REQUEST_SECONDS = 1.0  # Requests at least this slow are logged to slow_requests.log with their SQL
+
+# Background PDF rendering
+if getattr(sys, 'frozen', False):
+    PDF_JOB_DIR = os.path.join(BASE_PATH, '_internal', 'pdf_jobs')
+    PDF_CACHE_DIR = os.path.join(BASE_PATH, '_internal', 'pdf_cache')
+else:
+    PDF_JOB_DIR = os.path.join(BASE_DIR, 'pdf_jobs')
+    PDF_CACHE_DIR = os.path.join(BASE_DIR, 'pdf_cache')
+PDF_WORKERS = 2  # Worker processes converting HTML to PDF
+PDF_JOB_TTL = 3600  # Seconds a finished PDF stays available for download
+PDF_CACHE_MAX_BYTES = 256 * 1024 * 1024  # Oldest cached PDFs are evicted above this size
+PDF_CACHE_GRACE_SECONDS = 60  # Cached PDFs used this recently are never evicted
+PDF_BATCH_LIMIT = 500  # Most orders or quotes printed in one batch
+
+# Cutting stock optimizer
+CUT_BOARD_LENGTH = '96'  # Inches of each board rails and stiles are cut from
+CUT_KERF = '0.125'  # Inches lost to the saw blade per cut
+CUT_OPTIMIZE_SECONDS = 2  # Time budget of the improvement pass
 
 
 # Quick-start development settings - unsuitable for production
@@ -60,7 +82,9 @@ MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'core.middleware.RequestResponseLoggingMiddleware',
+    'core.middleware.ServerTimingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'core.middleware.DraftOrderCookieMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
@@ -72,10 +96,18 @@ ROOT_URLCONF = 'DoorsAndDrawers.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates, also timing renders for ServerTimingMiddleware
+        'BACKEND': 'core.instrumentation.TimedDjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
+            # Compile each template once per process, also when DEBUG is on;
+            # the autoreloader clears the cache when a template file changes
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -95,9 +127,39 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            # Take the write lock when a transaction starts, so concurrent writers
+            # wait on busy_timeout instead of failing to upgrade a read lock.
+            # This applies to every atomic() block, so keep read-only queries out of them.
+            'transaction_mode': 'IMMEDIATE',
+        },
     }
 }
 
+# In-process caches. {% cache %} fragments go to 'template_fragments'; their
+# keys include the catalog version, so a catalog write retires them
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'template_fragments': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'template-fragments',
+        'TIMEOUT': None,
+        'OPTIONS': {'MAX_ENTRIES': 500},
+    },
+}
+
+# Run on every new SQLite connection by core.db.configure_sqlite, in this order
+SQLITE_PRAGMAS = {
+    'busy_timeout': 5000,  # Milliseconds to wait for a lock before "database is locked"
+    'journal_mode': 'WAL',  # Readers and the writer no longer block each other
+    'synchronous': 'NORMAL',  # Durable with WAL; only checkpoints fsync
+    'cache_size': -65536,  # Page cache per connection, in KiB when negative (64 MiB)
+    'mmap_size': 268435456,  # Read the database through a 256 MiB memory map
+    'temp_store': 'MEMORY',  # Temporary tables and sort files stay in memory
+}
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -110,23 +172,24 @@ LOGGING = {
             'format': '{levelname} {message}',
             'style': '{',
         },
-        'http_detailed': {
-            'format': '[{asctime}] {levelname} HTTP {message}',
-            'style': '{',
-        },
     },
     'handlers': {
+        # Request threads only queue records; a listener thread writes them
         'file': {
             'level': 'DEBUG',
-            'class': 'logging.FileHandler',
+            'class': 'core.log_handlers.QueuedRotatingFileHandler',
             'filename': os.path.join(LOG_DIR, 'app.log'),
+            'maxBytes': LOG_MAX_BYTES,
+            'backupCount': LOG_BACKUP_COUNT,
             'formatter': 'verbose',
         },
-        'http_file': {
-            'level': 'INFO',
-            'class': 'logging.FileHandler',
-            'filename': os.path.join(BASE_DIR, 'logs', 'app.log'),
-            'formatter': 'http_detailed',
+        'slow_request_file': {
+            'level': 'WARNING',
+            'class': 'core.log_handlers.QueuedRotatingFileHandler',
+            'filename': os.path.join(LOG_DIR, 'slow_requests.log'),
+            'maxBytes': LOG_MAX_BYTES,
+            'backupCount': LOG_BACKUP_COUNT,
+            'formatter': 'verbose',
         },
     },
     'root': {
@@ -137,7 +200,7 @@ LOGGING = {
         'django': {
             'handlers': ['file'],
             'level': 'INFO',
-            'propagate': True,
+            'propagate': False,
         },
         'django.request': {
             'handlers': ['file'],
@@ -150,14 +213,19 @@ LOGGING = {
             'propagate': False,
         },
         'core.middleware': {
-            'handlers': ['http_file'],
+            'handlers': ['file'],
             'level': 'INFO',
             'propagate': False,
         },
+        'core.slow_requests': {
+            'handlers': ['slow_request_file'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
         'DoorsAndDrawers': {
             'handlers': ['file'],
             'level': 'DEBUG',
-            'propagate': True,
+            'propagate': False,
         },
     },
 }
@@ -195,5 +263,7 @@ SESSION_ENGINE = 'django.contrib.sessions.backends.db'  # Store sessions in data
 SESSION_COOKIE_AGE = 1800  # 30 minutes in seconds
 SESSION_COOKIE_SECURE = False  # Set to True in production with HTTPS
 SESSION_COOKIE_HTTPONLY = True  # Prevent JavaScript access to session cookie
-SESSION_SAVE_EVERY_REQUEST = True  # Update session on every request
+SESSION_SAVE_EVERY_REQUEST = False  # Only write the session when it changes
 SESSION_EXPIRE_AT_BROWSER_CLOSE = False  # Keep session alive until cookie age expires
+DRAFT_ORDER_MAX_AGE = 7 * 24 * 3600  # Seconds an unfinished order or quote is kept after its last change
+CACHE_VERSION_CHECK_SECONDS = 1.0  # Catalog and settings changes made by other processes show up within this time
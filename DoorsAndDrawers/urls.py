@@ -16,7 +16,7 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from core.views import settings, door_settings, drawer_settings
+from core.views.line_item import settings
 
 urlpatterns = [
     path('', include('core.urls')),
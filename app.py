@@ -4,6 +4,7 @@ Production deployment script using Waitress WSGI server.
 Run this script to start the Django application in production mode.
 """
 
+import multiprocessing
 import os
 import sys
 import webbrowser
@@ -26,6 +27,8 @@ import os
 
 
 if __name__ == '__main__':
+    # Needed for the PDF worker processes in the frozen build
+    multiprocessing.freeze_support()
 
     print("Starting DoorsAndDrawers application with Waitress...")
     print("Server will be available at: http://localhost:8080")
@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        # Register the cache invalidation signal handlers
+        from . import signals  # noqa: F401
+
+        # Tune every new SQLite connection
+        from django.db.backends.signals import connection_created
+        from .db import configure_sqlite
+        connection_created.connect(configure_sqlite, dispatch_uid='core_configure_sqlite')
@@ -0,0 +1,27 @@
+"""
+SQLite connection tuning, applied to every new database connection.
+"""
+import re
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+# PRAGMAs settings.SQLITE_PRAGMAS may set
+SQLITE_PRAGMA_NAMES = ('busy_timeout', 'journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'temp_store')
+
+PRAGMA_VALUE_PATTERN = re.compile(r'^-?\w+$')
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    """
+    connection_created handler running the PRAGMAs of settings.SQLITE_PRAGMAS,
+    in order, on each new SQLite connection.
+    """
+    if connection.vendor != 'sqlite':
+        return
+
+    for name, value in getattr(settings, 'SQLITE_PRAGMAS', {}).items():
+        if name not in SQLITE_PRAGMA_NAMES or not PRAGMA_VALUE_PATTERN.match(str(value)):
+            raise ImproperlyConfigured(f"Unsupported SQLite PRAGMA {name} = {value!r}")
+        # Runs on the raw connection so query instrumentation does not see it
+        connection.connection.execute(f'PRAGMA {name} = {value}')
@@ -3,6 +3,7 @@ from .order import BaseOrderForm, OrderForm, QuoteForm
 from .door import DoorForm
 from .drawer import DrawerForm
 from .generic import GenericItemForm
+from .price_revision import PriceRevisionForm
 
 __all__ = [
     'CustomerForm',
@@ -14,4 +15,5 @@ __all__ = [
     'DoorForm',
     'DrawerForm',
     'GenericItemForm',
+    'PriceRevisionForm',
 ] 
\ No newline at end of file
@@ -1,7 +1,6 @@
 from django import forms
 from ..models.customer import Customer, CustomerDefaults
-from ..models.door import WoodStock, EdgeProfile, PanelRise, Style
-from ..models.drawer import DrawerWoodStock, DrawerEdgeType, DrawerBottomSize
+from .fields import CatalogChoiceField
 
 class PhoneNumberWidget(forms.TextInput):
     def value_from_datadict(self, data, files, name):
@@ -135,23 +134,23 @@ class CustomerForm(forms.ModelForm):
 
 class CustomerDoorDefaultsForm(forms.Form):
     """Form for managing customer door defaults"""
-    wood_stock = forms.ModelChoiceField(
-        queryset=WoodStock.objects.all(),
+    wood_stock = CatalogChoiceField(
+        'wood_stock',
         required=False,
         label="Default Wood Stock"
     )
-    edge_profile = forms.ModelChoiceField(
-        queryset=EdgeProfile.objects.all(),
+    edge_profile = CatalogChoiceField(
+        'edge_profile',
         required=False,
         label="Default Edge Profile"
     )
-    panel_rise = forms.ModelChoiceField(
-        queryset=PanelRise.objects.all(),
+    panel_rise = CatalogChoiceField(
+        'panel_rise',
         required=False,
         label="Default Panel Rise"
     )
-    style = forms.ModelChoiceField(
-        queryset=Style.objects.all(),
+    style = CatalogChoiceField(
+        'style',
         required=False,
         label="Default Style"
     )
@@ -197,18 +196,18 @@ class CustomerDoorDefaultsForm(forms.Form):
 
 class CustomerDrawerDefaultsForm(forms.Form):
     """Form for managing customer drawer defaults"""
-    wood_stock = forms.ModelChoiceField(
-        queryset=DrawerWoodStock.objects.all(),
+    wood_stock = CatalogChoiceField(
+        'drawer_wood_stock',
         required=False,
         label="Default Wood Stock"
     )
-    edge_type = forms.ModelChoiceField(
-        queryset=DrawerEdgeType.objects.all(),
+    edge_type = CatalogChoiceField(
+        'drawer_edge_type',
         required=False,
         label="Default Edge Type"
     )
-    bottom = forms.ModelChoiceField(
-        queryset=DrawerBottomSize.objects.all(),
+    bottom = CatalogChoiceField(
+        'drawer_bottom_size',
         required=False,
         label="Default Bottom Size"
     )
@@ -1,32 +1,31 @@
 from django import forms
 from django.forms import ModelForm
-from ..models.door import (
-    DoorLineItem, WoodStock, EdgeProfile, 
-    PanelRise, Style, RailDefaults
-)
+from ..models.door import DoorLineItem
+from ..services.settings_cache import get_rail_defaults
+from .fields import CatalogChoiceField
 from decimal import Decimal
 
 class DoorForm(ModelForm):
     """Form for creating and editing door line items."""
     
-    # Override the foreign key fields to use ModelChoiceField with proper ordering
-    wood_stock = forms.ModelChoiceField(
-        queryset=WoodStock.objects.all().order_by('name'),
+    # Override the foreign key fields to serve their choices from the catalog cache
+    wood_stock = CatalogChoiceField(
+        'wood_stock',
         empty_label="Select Wood Type"
     )
     
-    edge_profile = forms.ModelChoiceField(
-        queryset=EdgeProfile.objects.all().order_by('name'),
+    edge_profile = CatalogChoiceField(
+        'edge_profile',
         empty_label="Select Edge Profile"
     )
     
-    panel_rise = forms.ModelChoiceField(
-        queryset=PanelRise.objects.all().order_by('name'),
+    panel_rise = CatalogChoiceField(
+        'panel_rise',
         empty_label="Select Panel Rise"
     )
     
-    style = forms.ModelChoiceField(
-        queryset=Style.objects.all().order_by('name'),
+    style = CatalogChoiceField(
+        'style',
         empty_label="Select Style"
     )
     
@@ -112,7 +111,7 @@ class DoorForm(ModelForm):
         super().__init__(*args, **kwargs)
         
         # Get rail defaults
-        rail_defaults = RailDefaults.objects.first()
+        rail_defaults = get_rail_defaults()
         
         # Set initial values for rail dimensions from defaults
         if rail_defaults:
@@ -1,9 +1,15 @@
 from django import forms
 from ..models.drawer import DrawerLineItem
+from .fields import CatalogChoiceField
 
 class DrawerForm(forms.ModelForm):
     """Form for creating and editing drawers"""
     
+    # Serve the catalog choices from the catalog cache
+    wood_stock = CatalogChoiceField('drawer_wood_stock')
+    edge_type = CatalogChoiceField('drawer_edge_type')
+    bottom = CatalogChoiceField('drawer_bottom_size')
+    
     class Meta:
         model = DrawerLineItem
         fields = [
@@ -0,0 +1,90 @@
+from django import forms
+from django.forms.utils import flatatt
+from django.utils.choices import BaseChoiceIterator
+from django.utils.html import format_html, format_html_join
+
+from ..services.catalog_cache import CATALOG_MODELS, get_catalog
+
+
+class CatalogChoiceIterator(BaseChoiceIterator):
+    """Iterate over a catalog table's choices from the in-memory catalog."""
+
+    def __init__(self, field):
+        self.field = field
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        yield from get_catalog().choices(self.field.catalog_key)
+
+    def __len__(self):
+        return (
+            len(get_catalog().choices(self.field.catalog_key))
+            + (1 if self.field.empty_label is not None else 0)
+        )
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(get_catalog().choices(self.field.catalog_key))
+
+
+def _option_tags(catalog_key):
+    """Build ``(value, label, unselected <option> tag)`` for every row of a catalog table."""
+    def build(catalog):
+        return tuple(
+            (str(pk), label, format_html('<option value="{}">{}</option>', pk, label))
+            for pk, label in catalog.choices(catalog_key)
+        )
+    return build
+
+
+class CatalogSelect(forms.Select):
+    """
+    Select for a CatalogChoiceField that renders the catalog's <option> tags
+    once per catalog snapshot, rather than through a template per option on
+    every render. Options and attributes are the same as Django's own Select.
+    """
+
+    def render(self, name, value, attrs=None, renderer=None):
+        field = self.choices.field
+        options = get_catalog().derived(('select_options', field.catalog_key), _option_tags(field.catalog_key))
+        selected = set(self.format_value(value))
+
+        choices = options
+        if field.empty_label is not None:
+            choices = (('', field.empty_label, None),) + options
+        tags = format_html_join('', '\n  {}', (
+            (format_html('<option value="{}" selected>{}</option>', option_value, label)
+             if option_value in selected else
+             tag or format_html('<option value="{}">{}</option>', option_value, label),)
+            for option_value, label, tag in choices
+        ))
+        return format_html('<select name="{}"{}>{}\n</select>', name, flatatt(self.build_attrs(self.attrs, attrs)), tags)
+
+
+class CatalogChoiceField(forms.ModelChoiceField):
+    """
+    ModelChoiceField for a catalog table that renders and validates from the
+    in-memory catalog instead of querying the database.
+
+    The queryset is kept for Django's own bookkeeping and is only used as a
+    fallback for ids the cached snapshot does not know about.
+    """
+    iterator = CatalogChoiceIterator
+    widget = CatalogSelect
+
+    def __init__(self, catalog_key, **kwargs):
+        self.catalog_key = catalog_key
+        kwargs.setdefault('queryset', CATALOG_MODELS[catalog_key].objects.all())
+        super().__init__(**kwargs)
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        if isinstance(value, CATALOG_MODELS[self.catalog_key]):
+            return value
+
+        instance = get_catalog().instance(self.catalog_key, value)
+        if instance is not None:
+            return instance
+
+        return super().to_python(value)
@@ -0,0 +1,84 @@
+from decimal import Decimal
+
+from django import forms
+
+from ..services.price_revision_service import REVISABLE_PRICES, PriceRevision
+
+
+class PriceRevisionForm(forms.Form):
+    """Form for revising catalog prices by a percentage or an amount"""
+
+    CHANGE_CHOICES = [
+        ('percent', 'Percent'),
+        ('amount', 'Amount ($)'),
+    ]
+
+    targets = forms.MultipleChoiceField(
+        choices=[(key, price.label) for key, price in REVISABLE_PRICES.items()],
+        widget=forms.CheckboxSelectMultiple,
+        label="Prices",
+    )
+
+    change_type = forms.ChoiceField(
+        choices=CHANGE_CHOICES,
+        initial='percent',
+        label="Change By",
+    )
+
+    change = forms.DecimalField(
+        max_digits=8,
+        decimal_places=3,
+        label="Change",
+        help_text="Negative values lower the prices",
+    )
+
+    name_contains = forms.CharField(
+        max_length=100,
+        required=False,
+        label="Name Contains",
+    )
+
+    min_price = forms.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        required=False,
+        label="Current Price From",
+    )
+
+    max_price = forms.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        required=False,
+        label="Current Price To",
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+
+        change = cleaned_data.get('change')
+        if change is not None:
+            if change == 0:
+                self.add_error('change', "Enter a change other than zero")
+            elif cleaned_data.get('change_type') == 'percent' and change <= -100:
+                self.add_error('change', "A percentage change must be above -100")
+            elif cleaned_data.get('change_type') == 'amount' and change != change.quantize(Decimal('0.01')):
+                self.add_error('change', "An amount change must be in whole cents")
+
+        min_price, max_price = cleaned_data.get('min_price'), cleaned_data.get('max_price')
+        if min_price is not None and max_price is not None and min_price > max_price:
+            self.add_error('max_price', "Must not be below the lower bound")
+
+        return cleaned_data
+
+    def revision(self) -> PriceRevision:
+        """Return the PriceRevision of a valid form."""
+        data = self.cleaned_data
+        is_percent = data['change_type'] == 'percent'
+        return PriceRevision(
+            targets=tuple(data['targets']),
+            percent=data['change'] if is_percent else None,
+            amount=None if is_percent else data['change'],
+            name_contains=data['name_contains'],
+            min_price=data['min_price'],
+            max_price=data['max_price'],
+        )
@@ -0,0 +1,108 @@
+"""
+Per-request timing of database queries and template rendering.
+
+ServerTimingMiddleware starts a RequestTimings for every request. Queries are
+timed through a database execute wrapper, and templates through the
+TimedDjangoTemplates backend, which the TEMPLATES setting uses in place of
+Django's own DjangoTemplates.
+"""
+import time
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from django.template import TemplateDoesNotExist
+from django.template.backends.django import DjangoTemplates, Template, reraise
+
+_current_timings: ContextVar[Optional['RequestTimings']] = ContextVar('request_timings', default=None)
+
+
+class RequestTimings:
+    """Where the time of one request went, in seconds."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.total_time = 0.0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.queries: List[Tuple[str, float]] = []
+        self._template_depth = 0
+
+    @property
+    def query_count(self) -> int:
+        return len(self.queries)
+
+    def record_query(self, execute, sql, params, many, context):
+        """Database execute wrapper timing every query of the request."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.db_time += duration
+            self.queries.append((sql, duration))
+
+    def sql_report(self) -> str:
+        """List every query of the request with its duration, slowest first."""
+        return '\n'.join(
+            f'{duration * 1000:8.1f}ms  {sql}'
+            for sql, duration in sorted(self.queries, key=lambda query: -query[1])
+        )
+
+    def finish(self) -> None:
+        self.total_time = time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """Format the timings as a Server-Timing header value, in milliseconds."""
+        return (
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.query_count} queries", '
+            f'tpl;dur={self.template_time * 1000:.1f};desc="Templates", '
+            f'view;dur={self.total_time * 1000:.1f};desc="View"'
+        )
+
+
+def start_timings() -> Tuple[RequestTimings, object]:
+    """Start timing a request; returns the timings and a token for stop_timings()."""
+    timings = RequestTimings()
+    return timings, _current_timings.set(timings)
+
+
+def stop_timings(timings: RequestTimings, token: object) -> None:
+    timings.finish()
+    _current_timings.reset(token)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    """Return the timings of the request being handled by this thread, if any."""
+    return _current_timings.get()
+
+
+class TimedTemplate(Template):
+    """Template that adds its render time to the current request's timings."""
+
+    def render(self, context=None, request=None):
+        timings = current_timings()
+        if timings is None:
+            return super().render(context, request)
+
+        # Templates rendered while rendering another are already being timed
+        timings._template_depth += 1
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            timings._template_depth -= 1
+            if not timings._template_depth:
+                timings.template_time += time.perf_counter() - start
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """DjangoTemplates backend returning TimedTemplate instances."""
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return TimedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
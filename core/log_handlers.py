@@ -0,0 +1,88 @@
+"""
+Logging handlers that keep disk I/O off the request threads.
+
+This module is loaded by the LOGGING setting before the app registry is
+ready, so it must not import Django models.
+"""
+import gzip
+import logging
+import os
+import queue
+import shutil
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that gzips every file it rotates out, e.g. app.log.1.gz."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.namer = self._gzip_name
+        self.rotator = self._gzip_rotate
+
+    @staticmethod
+    def _gzip_name(name: str) -> str:
+        return f'{name}.gz'
+
+    @staticmethod
+    def _gzip_rotate(source: str, dest: str) -> None:
+        with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(source)
+
+
+class QueuedRotatingFileHandler(QueueHandler):
+    """
+    Puts records on an in-memory queue; a listener thread formats them and
+    writes them to a CompressingRotatingFileHandler.
+
+    Logging from a request thread costs a queue put. Records are formatted
+    on the listener thread, so a message's %-arguments are only rendered if
+    the record is written. When the queue is full, records are dropped and
+    counted in ``dropped`` rather than blocking the request; a warning with
+    the count is logged once the queue has room again.
+    """
+
+    def __init__(self, filename: str, maxBytes: int = 0, backupCount: int = 0,
+                 encoding: str = 'utf-8', queue_size: int = 10000):
+        super().__init__(queue.Queue(queue_size))
+        os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+        self.target = CompressingRotatingFileHandler(
+            filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding, delay=True
+        )
+        self.dropped = 0
+        self._unreported = 0
+        self.listener = QueueListener(self.queue, self.target)
+        self.listener.start()
+
+    def setFormatter(self, fmt):
+        super().setFormatter(fmt)
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record):
+        # The queue never leaves this process, so the record can be formatted later as is
+        return record
+
+    def enqueue(self, record):
+        try:
+            if self._unreported:
+                self.queue.put_nowait(logging.makeLogRecord({
+                    'name': __name__, 'levelno': logging.WARNING, 'levelname': 'WARNING',
+                    'msg': "Log queue was full, dropped %d record(s)", 'args': (self._unreported,),
+                }))
+                self._unreported = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self._unreported += 1
+
+    def flush(self):
+        self.target.flush()
+
+    def close(self):
+        # Write out whatever is still queued, then close the file
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        self.target.close()
+        super().close()
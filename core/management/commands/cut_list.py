@@ -0,0 +1,42 @@
+import csv
+
+from django.core.management.base import BaseCommand
+
+from core.models import Order
+from core.services.cut_list_service import CutListService
+from core.views.common import search_and_filter_orders
+
+
+class Command(BaseCommand):
+    help = "Write the door cut list of confirmed orders as CSV"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'order_ids',
+            nargs='*',
+            type=int,
+            help="Only these orders (default: all matching the filters)",
+        )
+        parser.add_argument('--start-date', default='', help="First order date (YYYY-MM-DD)")
+        parser.add_argument('--end-date', default='', help="Last order date (YYYY-MM-DD)")
+        parser.add_argument('--customer', default='', help="Company name search")
+        parser.add_argument('-o', '--output', help="Output file (default: standard output)")
+
+    def handle(self, *args, **options):
+        orders = search_and_filter_orders(Order.confirmed.all(), {
+            'ids': ','.join(str(pk) for pk in options['order_ids']),
+            'start_date': options['start_date'],
+            'end_date': options['end_date'],
+            'customer_search': options['customer'],
+        })
+        pieces = CutListService().for_orders(orders)
+
+        if options['output']:
+            with open(options['output'], 'w', newline='') as f:
+                csv.writer(f).writerows(pieces.csv_rows())
+            self.stdout.write(self.style.SUCCESS(f"Wrote {len(pieces)} piece(s) to {options['output']}"))
+        else:
+            csv.writer(self.stdout).writerows(pieces.csv_rows())
+
+        for item_id in pieces.invalid_items:
+            self.stderr.write(f"Door item {item_id} is too small for its rails and was skipped")
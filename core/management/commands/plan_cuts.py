@@ -0,0 +1,60 @@
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import Order
+from core.services.cutting_stock_service import CuttingStockService
+from core.views.common import search_and_filter_orders
+
+
+class Command(BaseCommand):
+    help = "Plan how the rails and stiles of confirmed orders are cut from boards"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start-date', default='', help="First order date (YYYY-MM-DD)")
+        parser.add_argument('--end-date', default='', help="Last order date (YYYY-MM-DD)")
+        parser.add_argument('--board-length', help="Board length in inches (default: CUT_BOARD_LENGTH)")
+        parser.add_argument('--kerf', help="Saw kerf in inches (default: CUT_KERF)")
+        parser.add_argument(
+            '--time-budget',
+            type=float,
+            help="Seconds for the improvement pass; 0 for first-fit decreasing only",
+        )
+        parser.add_argument('-o', '--output', help="Also write the board plans to this CSV file")
+
+    def handle(self, *args, **options):
+        if not (options['start_date'] or options['end_date']):
+            raise CommandError("Give --start-date and/or --end-date")
+
+        orders = search_and_filter_orders(Order.confirmed.all(), {
+            'start_date': options['start_date'],
+            'end_date': options['end_date'],
+        })
+        plan = CuttingStockService(
+            board_length=options['board_length'],
+            kerf=options['kerf'],
+            time_budget=options['time_budget'],
+        ).for_orders(orders)
+
+        for group in plan.groups:
+            self.stdout.write(
+                f"{group.wood_stock} {group.edge_profile} {group.width}\": "
+                f"{group.part_count} parts on {group.board_count} boards, {group.yield_percent}% yield"
+            )
+            for number, board in enumerate(group.boards, start=1):
+                cuts = ' + '.join(str(length) for length in board.lengths)
+                self.stdout.write(f"  {number:>4}: {cuts} (waste {board.waste})")
+
+        for cut in plan.oversize:
+            self.stderr.write(
+                f"{cut.part} of {cut.order_number} item {cut.item_id} ({cut.length}\") is longer than a board"
+            )
+
+        if options['output']:
+            with open(options['output'], 'w', newline='') as f:
+                csv.writer(f).writerows(plan.csv_rows())
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{plan.part_count} parts on {plan.board_count} boards of {plan.board_length}\", "
+            f"{plan.yield_percent}% yield"
+        ))
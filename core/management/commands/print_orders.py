@@ -0,0 +1,49 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import Order
+from core.services.batch_print_service import FORMATS, BatchPrintService
+from core.views.common import search_and_filter_orders
+
+
+class Command(BaseCommand):
+    help = "Print orders or quotes into one merged PDF or a ZIP of PDFs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'order_ids',
+            nargs='*',
+            type=int,
+            help="Only print these orders (default: all matching the filters)",
+        )
+        parser.add_argument('--start-date', default='', help="First order date (YYYY-MM-DD)")
+        parser.add_argument('--end-date', default='', help="Last order date (YYYY-MM-DD)")
+        parser.add_argument('--customer', default='', help="Company name search")
+        parser.add_argument('--quotes', action='store_true', help="Print quotes instead of orders")
+        parser.add_argument('--format', choices=sorted(FORMATS), default='pdf', help="Output format")
+        parser.add_argument('-o', '--output', help="Output file (default: orders.pdf or quotes.pdf)")
+
+    def handle(self, *args, **options):
+        queryset = Order.quotes.all() if options['quotes'] else Order.confirmed.all()
+        queryset = search_and_filter_orders(queryset, {
+            'ids': ','.join(str(pk) for pk in options['order_ids']),
+            'start_date': options['start_date'],
+            'end_date': options['end_date'],
+            'customer_search': options['customer'],
+        })
+
+        service = BatchPrintService(queryset, is_quote=options['quotes'])
+        entries = service.prepare()
+        if not entries:
+            raise CommandError("Nothing to print")
+
+        output = options['output'] or f"{service.kind}s.{options['format']}"
+
+        def progress(finished, total):
+            self.stdout.write(f"\r{finished}/{total} rendered", ending='')
+            self.stdout.flush()
+
+        service.write(entries, os.path.abspath(output), options['format'], progress)
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(f"Wrote {len(entries)} {service.kind}(s) to {output}"))
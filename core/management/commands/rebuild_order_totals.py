@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from core.models import Order
+from core.services.order_totals_service import OrderTotalsService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the stored item total and line item counts of orders and quotes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'order_ids',
+            nargs='*',
+            type=int,
+            help="Only rebuild these orders (default: all)",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Order.objects.all()
+        if options['order_ids']:
+            queryset = queryset.filter(pk__in=options['order_ids'])
+
+        updated = OrderTotalsService.rebuild(queryset)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt totals for {updated} order(s)"))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from core.models import Order
+from core.services.door_repricing_service import DoorRepricingService
+
+
+class Command(BaseCommand):
+    help = "Reprice door line items from the current style and wood stock prices"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'order_ids',
+            nargs='*',
+            type=int,
+            help="Only reprice these orders or quotes (default: all quotes)",
+        )
+        parser.add_argument(
+            '--include-orders',
+            action='store_true',
+            help="Also reprice confirmed orders, not just quotes",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Order.objects.all()
+        if options['order_ids']:
+            queryset = queryset.filter(pk__in=options['order_ids'])
+        if not options['include_orders']:
+            queryset = queryset.filter(is_quote=True)
+
+        updated = DoorRepricingService.reprice(queryset)
+        self.stdout.write(self.style.SUCCESS(f"Repriced {updated} door line item(s)"))
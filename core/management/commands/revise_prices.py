@@ -0,0 +1,78 @@
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import Style, WoodStock
+from core.services.price_revision_service import REVISABLE_PRICES, PriceRevision, PriceRevisionService
+
+
+class Command(BaseCommand):
+    help = "Raise or lower catalog prices by a percentage or an amount"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'targets',
+            nargs='+',
+            choices=list(REVISABLE_PRICES),
+            help="Price columns to revise",
+        )
+        change = parser.add_mutually_exclusive_group(required=True)
+        change.add_argument(
+            '--percent',
+            type=Decimal,
+            help="Change the prices by this percentage, e.g. 3.5 or -2",
+        )
+        change.add_argument(
+            '--amount',
+            type=Decimal,
+            help="Change the prices by this amount, e.g. 1.25 or -0.50",
+        )
+        parser.add_argument(
+            '--name-contains',
+            default='',
+            help="Only revise rows whose name contains this text",
+        )
+        parser.add_argument(
+            '--min-price',
+            type=Decimal,
+            help="Only revise rows currently priced at least this much",
+        )
+        parser.add_argument(
+            '--max-price',
+            type=Decimal,
+            help="Only revise rows currently priced at most this much",
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help="Show the new prices without saving them",
+        )
+
+    def handle(self, *args, **options):
+        if options['percent'] is not None and options['percent'] <= -100:
+            raise CommandError("--percent must be above -100")
+
+        revision = PriceRevision(
+            targets=tuple(dict.fromkeys(options['targets'])),
+            percent=options['percent'],
+            amount=options['amount'],
+            name_contains=options['name_contains'],
+            min_price=options['min_price'],
+            max_price=options['max_price'],
+        )
+        if options['dry_run']:
+            changes, errors = PriceRevisionService.preview(revision)
+        else:
+            changes, errors = PriceRevisionService.apply(revision)
+
+        for change in changes:
+            self.stdout.write(f"{change.label}: {change.name} {change.old_price} -> {change.new_price}")
+        if errors:
+            raise CommandError("Nothing was saved:\n" + "\n".join(errors))
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f"Dry run: {len(changes)} price(s) would change"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Changed {len(changes)} price(s)"))
+            if any(REVISABLE_PRICES[target].model in (Style, WoodStock) for target in revision.targets):
+                self.stdout.write("Run reprice_doors to bring the door prices of open quotes up to date")
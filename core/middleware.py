@@ -1,71 +1,90 @@
 import logging
+import random
 import time
-import traceback
+from django.conf import settings
+from django.db import connection
 from django.utils.deprecation import MiddlewareMixin
 
+from .instrumentation import start_timings, stop_timings
+
 logger = logging.getLogger(__name__)
+slow_request_logger = logging.getLogger('core.slow_requests')
 
 
 class RequestResponseLoggingMiddleware(MiddlewareMixin):
     """
     Middleware to log HTTP requests, responses, and exceptions.
+
+    Each request is logged as a single line once its response is ready.
+    Messages use lazy %-formatting, so they are only rendered if the record
+    is written. Only settings.HTTP_LOG_SAMPLE_RATE of successful requests
+    are logged; client and server errors and exceptions always are.
     """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.sample_rate = getattr(settings, 'HTTP_LOG_SAMPLE_RATE', 1.0)
     
     def process_request(self, request):
-        """Log incoming HTTP requests."""
-        request._start_time = time.time()
-        
-        # Log request details
-        logger.info(
-            f"HTTP Request: {request.method} {request.get_full_path()} "
-            f"from {self.get_client_ip(request)} "
-            f"User-Agent: {request.META.get('HTTP_USER_AGENT', 'Unknown')}"
-        )
+        """Note the start time and log request headers when debugging."""
+        request._start_time = time.perf_counter()
         
         # Log request headers (optional, be careful with sensitive data)
         if logger.isEnabledFor(logging.DEBUG):
             headers = {k: v for k, v in request.META.items() if k.startswith('HTTP_')}
-            logger.debug(f"Request Headers: {headers}")
+            logger.debug("Request Headers: %s", headers)
         
         return None
     
     def process_response(self, request, response):
-        """Log HTTP responses."""
-        # Calculate response time
-        response_time = None
-        if hasattr(request, '_start_time'):
-            response_time = time.time() - request._start_time
-        
-        # Log response details
-        logger.info(
-            f"HTTP Response: {request.method} {request.get_full_path()} "
-            f"Status: {response.status_code} "
-            f"Response Time: {response_time:.3f}s" if response_time else ""
-        )
+        """Log the request and its response."""
+        if not self.should_log(response.status_code):
+            return response
+
+        message = "HTTP %s %s Status: %s Response Time: %.3fs from %s User-Agent: %s"
+        args = [
+            request.method, request.get_full_path(), response.status_code, self.get_response_time(request),
+            self.get_client_ip(request), request.META.get('HTTP_USER_AGENT', 'Unknown'),
+        ]
+
+        # Add the breakdown recorded by ServerTimingMiddleware
+        timings = getattr(request, 'timings', None)
+        if timings is not None:
+            message += " Queries: %d (%.1fms) Templates: %.1fms"
+            args += [timings.query_count, timings.db_time * 1000, timings.template_time * 1000]
+
+        logger.info(message, *args)
         
         # Log response headers for debugging
         if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f"Response Headers: {dict(response.items())}")
+            logger.debug("Response Headers: %s", dict(response.items()))
         
         return response
     
     def process_exception(self, request, exception):
-        """Log exceptions that occur during request processing."""
-        response_time = None
-        if hasattr(request, '_start_time'):
-            response_time = time.time() - request._start_time
-        
+        """Log exceptions that occur during request processing, with their traceback."""
         logger.error(
-            f"HTTP Exception: {request.method} {request.get_full_path()} "
-            f"from {self.get_client_ip(request)} "
-            f"Exception: {type(exception).__name__}: {str(exception)} "
-            f"Response Time: {response_time:.3f}s" if response_time else ""
+            "HTTP Exception: %s %s from %s Exception: %s: %s Response Time: %.3fs",
+            request.method, request.get_full_path(), self.get_client_ip(request),
+            type(exception).__name__, exception, self.get_response_time(request),
+            exc_info=exception,
         )
         
-        # Log full traceback for debugging
-        logger.error(f"Full Traceback:\n{traceback.format_exc()}")
-        
         return None  # Let Django handle the exception normally
+
+    def should_log(self, status_code):
+        """Decide whether a response is logged: always for errors, sampled otherwise."""
+        if not logger.isEnabledFor(logging.INFO):
+            return False
+        if status_code >= 400 or self.sample_rate >= 1:
+            return True
+        return random.random() < self.sample_rate
+
+    @staticmethod
+    def get_response_time(request):
+        """Seconds since process_request, or 0 if it did not run."""
+        start_time = getattr(request, '_start_time', None)
+        return time.perf_counter() - start_time if start_time is not None else 0.0
     
     def get_client_ip(self, request):
         """Get the client's IP address from the request."""
@@ -74,4 +93,50 @@ class RequestResponseLoggingMiddleware(MiddlewareMixin):
             ip = x_forwarded_for.split(',')[0]
         else:
             ip = request.META.get('REMOTE_ADDR')
-        return ip
\ No newline at end of file
+        return ip
+
+class ServerTimingMiddleware:
+    """
+    Times the database queries, template rendering and view of each request
+    and reports them in a Server-Timing header.
+
+    Requests taking settings.SLOW_REQUEST_SECONDS or longer are also written
+    to the slow request log together with their SQL. Place it after
+    RequestResponseLoggingMiddleware so the request log line includes the
+    timings.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.slow_request_seconds = getattr(settings, 'SLOW_REQUEST_SECONDS', None)
+
+    def __call__(self, request):
+        timings, token = start_timings()
+        try:
+            with connection.execute_wrapper(timings.record_query):
+                response = self.get_response(request)
+        finally:
+            stop_timings(timings, token)
+
+        request.timings = timings
+        response['Server-Timing'] = timings.server_timing()
+
+        if self.slow_request_seconds is not None and timings.total_time >= self.slow_request_seconds:
+            slow_request_logger.warning(
+                "Slow request: %s %s Status: %s Time: %.3fs Queries: %d (%.1fms) Templates: %.1fms\n%s",
+                request.method, request.get_full_path(), response.status_code, timings.total_time,
+                timings.query_count, timings.db_time * 1000, timings.template_time * 1000,
+                timings.sql_report(),
+            )
+        return response
+
+
+class DraftOrderCookieMiddleware(MiddlewareMixin):
+    """
+    Keeps the signed draft order cookie in step with the draft a view used.
+    """
+
+    def process_response(self, request, response):
+        """Set or clear the draft order cookie."""
+        from .services.draft_order_service import DraftOrderService
+        return DraftOrderService.update_cookie(request, response)
@@ -0,0 +1,73 @@
+# Generated by Django 5.1.7 on 2026-10-18 17:56
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Count, ExpressionWrapper, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_order_totals(apps, schema_editor):
+    """Fill the new aggregate columns from the existing line items with one UPDATE."""
+    Order = apps.get_model('core', 'Order')
+    line_item_models = {
+        'door_count': apps.get_model('core', 'DoorLineItem'),
+        'drawer_count': apps.get_model('core', 'DrawerLineItem'),
+        'generic_count': apps.get_model('core', 'GenericLineItem'),
+    }
+
+    money = models.DecimalField(max_digits=10, decimal_places=2)
+    extended_price = ExpressionWrapper(F('price_per_unit') * F('quantity'), output_field=money)
+
+    def aggregate(model, expression, output_field):
+        subquery = (
+            model.objects.filter(order=OuterRef('pk'))
+            .order_by()
+            .values('order')
+            .annotate(value=expression)
+            .values('value')
+        )
+        return Coalesce(Subquery(subquery, output_field=output_field), Value(0), output_field=output_field)
+
+    item_total = Value(Decimal('0.00'), output_field=money)
+    for model in line_item_models.values():
+        item_total = item_total + aggregate(model, Sum(extended_price), money)
+
+    Order.objects.order_by().update(
+        item_total=item_total,
+        **{
+            count_field: aggregate(model, Count('pk'), models.IntegerField())
+            for count_field, model in line_item_models.items()
+        }
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_doorlineitem_sand_cross_grain_doorlineitem_sand_edge'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='door_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Door Count'),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='drawer_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Drawer Count'),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='generic_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Miscellaneous Item Count'),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='item_total',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10, verbose_name='Item Total'),
+        ),
+        migrations.RunPython(backfill_order_totals, migrations.RunPython.noop),
+    ]
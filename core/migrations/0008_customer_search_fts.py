@@ -0,0 +1,66 @@
+# Full-text search index for customers (SQLite only)
+
+from django.db import migrations
+
+FTS_COLUMNS = 'company_name, first_name, last_name, city, phone'
+
+CREATE_FTS = [
+    f"""
+    CREATE VIRTUAL TABLE core_customer_fts USING fts5(
+        {FTS_COLUMNS},
+        content='core_customer',
+        content_rowid='id',
+        tokenize='unicode61',
+        prefix='2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER core_customer_fts_insert AFTER INSERT ON core_customer BEGIN
+        INSERT INTO core_customer_fts(rowid, {FTS_COLUMNS})
+        VALUES (new.id, new.company_name, new.first_name, new.last_name, new.city, new.phone);
+    END
+    """,
+    f"""
+    CREATE TRIGGER core_customer_fts_delete AFTER DELETE ON core_customer BEGIN
+        INSERT INTO core_customer_fts(core_customer_fts, rowid, {FTS_COLUMNS})
+        VALUES ('delete', old.id, old.company_name, old.first_name, old.last_name, old.city, old.phone);
+    END
+    """,
+    f"""
+    CREATE TRIGGER core_customer_fts_update AFTER UPDATE ON core_customer BEGIN
+        INSERT INTO core_customer_fts(core_customer_fts, rowid, {FTS_COLUMNS})
+        VALUES ('delete', old.id, old.company_name, old.first_name, old.last_name, old.city, old.phone);
+        INSERT INTO core_customer_fts(rowid, {FTS_COLUMNS})
+        VALUES (new.id, new.company_name, new.first_name, new.last_name, new.city, new.phone);
+    END
+    """,
+    "INSERT INTO core_customer_fts(core_customer_fts) VALUES ('rebuild')",
+]
+
+DROP_FTS = [
+    "DROP TRIGGER IF EXISTS core_customer_fts_update",
+    "DROP TRIGGER IF EXISTS core_customer_fts_delete",
+    "DROP TRIGGER IF EXISTS core_customer_fts_insert",
+    "DROP TABLE IF EXISTS core_customer_fts",
+]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        # Other backends keep using the ORM search in CustomerSearchService
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_order_item_total_and_counts'),
+    ]
+
+    operations = [
+        migrations.RunPython(_run(CREATE_FTS), _run(DROP_FTS)),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.7 on 2026-10-18 17:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_customer_search_fts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='doorlineitem',
+            index=models.Index(fields=['order', 'created_at'], name='dooritem_order_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='drawerlineitem',
+            index=models.Index(fields=['order', 'created_at'], name='draweritem_order_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='genericlineitem',
+            index=models.Index(fields=['order', 'created_at'], name='genericitem_order_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('is_quote', False)), fields=['order_date', 'id'], name='order_confirmed_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('is_quote', True)), fields=['order_date', 'id'], name='order_quote_date_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.1.7 on 2026-10-18 18:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_order_and_line_item_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DraftOrder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('billing_address1', models.CharField(blank=True, max_length=255, verbose_name='Billing Address Line 1')),
+                ('billing_address2', models.CharField(blank=True, max_length=255, verbose_name='Billing Address Line 2')),
+                ('customer', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='draft_orders', to='core.customer', verbose_name='Customer')),
+            ],
+            options={
+                'verbose_name': 'Draft Order',
+                'verbose_name_plural': 'Draft Orders',
+            },
+        ),
+        migrations.CreateModel(
+            name='DraftLineItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('type', models.CharField(max_length=10, verbose_name='Item Type')),
+                ('data', models.JSONField(verbose_name='Item Data')),
+                ('draft', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='core.draftorder', verbose_name='Draft')),
+            ],
+            options={
+                'verbose_name': 'Draft Line Item',
+                'verbose_name_plural': 'Draft Line Items',
+                'ordering': ['id'],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.7 on 2026-10-18 18:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_draft_orders'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='draftorder',
+            name='item_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Item Count'),
+        ),
+        migrations.AddField(
+            model_name='draftorder',
+            name='item_total',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10, verbose_name='Item Total'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.1.7 on 2026-10-18 19:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_draft_order_totals'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PriceList',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('digest', models.CharField(editable=False, max_length=64, unique=True)),
+                ('prices', models.JSONField(editable=False)),
+            ],
+            options={
+                'verbose_name': 'Price List',
+                'verbose_name_plural': 'Price Lists',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='doorlineitem',
+            name='price_list',
+            field=models.ForeignKey(blank=True, editable=False, help_text='Catalog prices the item was priced from; None for custom and older items', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.pricelist', verbose_name='Price List'),
+        ),
+        migrations.AddField(
+            model_name='drawerlineitem',
+            name='price_list',
+            field=models.ForeignKey(blank=True, editable=False, help_text='Catalog prices the item was priced from; None for custom and older items', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.pricelist', verbose_name='Price List'),
+        ),
+    ]
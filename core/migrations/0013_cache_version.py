@@ -0,0 +1,24 @@
+# Generated by Django 5.1.7 on 2026-10-18 21:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_price_lists'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CacheVersion',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Cache Version',
+                'verbose_name_plural': 'Cache Versions',
+            },
+        ),
+    ]
@@ -2,6 +2,9 @@ from .base import BaseModel
 from .customer import Customer, CustomerDefaults
 from .order import Order, QuoteManager, ConfirmedManager
 from .line_item import LineItem, GenericLineItem
+from .draft import DraftOrder, DraftLineItem
+from .price_list import PriceList
+from .cache_version import CacheVersion
 from .door import (
     WoodStock, 
     Design, 
@@ -45,5 +48,9 @@ __all__ = [
     'DrawerPricing', 
     'DrawerLineItem',
     'DefaultDrawerSettings',
-    'GenericLineItem'
+    'GenericLineItem',
+    'DraftOrder',
+    'DraftLineItem',
+    'PriceList',
+    'CacheVersion'
 ] 
\ No newline at end of file
@@ -0,0 +1,35 @@
+from django.db import models
+from django.db.models import F
+
+
+class CacheVersion(models.Model):
+    """
+    Version counter of an in-process cache, shared by every process using the database.
+
+    A writer bumps the counter inside its own transaction; each process
+    compares it with the last value it saw and reloads its cache when it
+    changed, so writes from management commands, the shell or a second
+    server reach the running server too.
+    """
+    name = models.CharField(max_length=50, primary_key=True)
+    version = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Cache Version'
+        verbose_name_plural = 'Cache Versions'
+
+    def __str__(self):
+        return f"{self.name} v{self.version}"
+
+    @classmethod
+    def current(cls, name: str) -> int:
+        """Return the shared version of cache ``name``; 0 if it was never bumped."""
+        return cls.objects.filter(name=name).values_list('version', flat=True).first() or 0
+
+    @classmethod
+    def bump(cls, name: str) -> int:
+        """Increment the shared version of cache ``name`` and return the new value."""
+        if not cls.objects.filter(name=name).update(version=F('version') + 1):
+            cls.objects.get_or_create(name=name)
+            cls.objects.filter(name=name).update(version=F('version') + 1)
+        return cls.current(name)
@@ -104,6 +104,11 @@ class Customer(BaseModel):
             self.phone = ''.join(filter(str.isdigit, self.phone))
         if not self.fax.isdigit():
             self.fax = ''.join(filter(str.isdigit, self.fax))
+
+        # Cached defaults are keyed on updated_at, which auto_now only writes if it is saved too
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'updated_at' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'updated_at']
         super().save(*args, **kwargs)
     
     def get_door_defaults(self):
@@ -119,8 +124,8 @@ class Customer(BaseModel):
         defaults = self.door_defaults.copy()
         
         # Get global rail defaults to filter out matching values
-        from .door import RailDefaults
-        global_rail_defaults = RailDefaults.objects.first()
+        from ..services.settings_cache import get_rail_defaults
+        global_rail_defaults = get_rail_defaults()
         
         if global_rail_defaults:
             # Check each rail dimension and remove it if it matches the global default
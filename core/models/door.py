@@ -144,10 +144,27 @@ class DoorLineItem(LineItem):
         default=False,
         help_text="Whether to sand across the grain"
     )
+
+    price_list = models.ForeignKey(
+        'PriceList',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='+',
+        verbose_name="Price List",
+        help_text="Catalog prices the item was priced from; None for custom and older items"
+    )
     
+    order_count_field = 'door_count'
+    uses_price_list = True
+
     class Meta:
         verbose_name = "Door Item"
         verbose_name_plural = "Door Items"
+        indexes = [
+            models.Index(fields=['order', 'created_at'], name='dooritem_order_created_idx'),
+        ]
     
     @property
     def square_feet(self):
@@ -156,17 +173,8 @@ class DoorLineItem(LineItem):
 
     def calculate_price(self):
         """Calculate the unit price based on door specifications."""
-        # Get base price from style
-        base_price = self.style.price
-        
-        # Determine woodstock price based on panel type
-        if self.style.panel_type.use_flat_panel_price:
-            woodstock_price = self.wood_stock.flat_panel_price
-        else:
-            woodstock_price = self.wood_stock.raised_panel_price
-            
-        # Calculate and return price per unit (base_price + twice woodstock price)
-        return base_price + (woodstock_price * 2)
+        from ..services.pricing_engine import PricingEngine
+        return PricingEngine().unit_price(self)
     
     def __str__(self):
         return f"Door {self.id} - {self.wood_stock.name} {self.style.name}"
@@ -0,0 +1,76 @@
+from django.db import models
+from .base import BaseModel
+
+
+class DraftOrder(BaseModel):
+    """
+    An order or quote that is still being built on the create page.
+
+    Only the draft's id is kept in the session, so adding or removing a line
+    item writes one DraftLineItem row instead of the whole session blob.
+    """
+    customer = models.ForeignKey(
+        'Customer',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='draft_orders',
+        verbose_name="Customer"
+    )
+    billing_address1 = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name="Billing Address Line 1"
+    )
+    billing_address2 = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name="Billing Address Line 2"
+    )
+
+    # Line item aggregates, kept up to date by DraftOrderService
+    item_total = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        default=0,
+        verbose_name="Item Total"
+    )
+    item_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Item Count"
+    )
+
+    class Meta:
+        verbose_name = "Draft Order"
+        verbose_name_plural = "Draft Orders"
+
+    def __str__(self):
+        return f"Draft {self.id}"
+
+
+class DraftLineItem(BaseModel):
+    """
+    One line item of a draft, stored as the item dictionary that the line item
+    table, the pricing engine and OrderService.create_from_session read.
+    """
+    draft = models.ForeignKey(
+        DraftOrder,
+        on_delete=models.CASCADE,
+        related_name='items',
+        verbose_name="Draft"
+    )
+    type = models.CharField(
+        max_length=10,
+        verbose_name="Item Type"
+    )
+    data = models.JSONField(
+        verbose_name="Item Data"
+    )
+
+    class Meta:
+        ordering = ['id']
+        verbose_name = "Draft Line Item"
+        verbose_name_plural = "Draft Line Items"
+
+    def __str__(self):
+        return f"Draft {self.draft_id} {self.type} item {self.id}"
@@ -131,32 +131,35 @@ class DrawerLineItem(LineItem):
         default=False,
         help_text="Whether drawer requires finishing"
     )
+
+    price_list = models.ForeignKey(
+        'PriceList',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='+',
+        verbose_name="Price List",
+        help_text="Catalog prices the item was priced from; None for custom and older items"
+    )
     
+    order_count_field = 'drawer_count'
+    uses_price_list = True
+
     class Meta:
         verbose_name = 'Drawer'
         verbose_name_plural = 'Drawers'
+        indexes = [
+            models.Index(fields=['order', 'created_at'], name='draweritem_order_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.width}″ × {self.height}″ × {self.depth}″ Drawer"
     
     def calculate_price(self):
         """Calculate the unit price of the drawer based on dimensions and options"""
-        # Get the base price from wood stock and bottom
-        base_price = self.wood_stock.price + self.bottom.price
-        
-        # Get the default settings
-        default_settings = DefaultDrawerSettings.objects.first()
-        if not default_settings:
-            return base_price
-        
-        # Add charges for options if enabled
-        if self.undermount:
-            base_price += default_settings.undermount_charge
-            
-        if self.finishing:
-            base_price += default_settings.finish_charge
-        
-        return base_price
+        from ..services.pricing_engine import PricingEngine
+        return PricingEngine().unit_price(self)
     
     def save(self, *args, **kwargs):
         # Always set type to 'drawer'
@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 from django.core.validators import MinValueValidator
 from decimal import Decimal
 from .base import BaseModel
@@ -45,6 +46,29 @@ class LineItem(BaseModel):
         verbose_name_plural = "Line Items"
         ordering = ['-created_at']
 
+    # Unit price assigned by PricingEngine.price_batch(), reused by price and save()
+    _priced_unit_price = None
+
+    # Whether PricingEngine took the last unit price from the item's own price list
+    _priced_from_list = False
+
+    # Whether calculated prices come from the catalog, and so pin the item to a price list;
+    # such subclasses declare a price_list foreign key
+    uses_price_list = False
+
+    # Order column that counts line items of this type
+    order_count_field = None
+
+    # (order_id, extended price) as last read from or written to the database
+    _persisted_contribution = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if {'order_id', 'price_per_unit', 'quantity'}.issubset(field_names):
+            instance._persisted_contribution = instance._order_contribution()
+        return instance
+
     def __str__(self):
         return f"Line Item {self.id} - Order {self.order.order_number}"
     
@@ -61,10 +85,14 @@ class LineItem(BaseModel):
         """
         Returns the total price of the item including quantity.
         If custom_price is True, uses the stored price_per_unit value.
-        Otherwise, calls calculate_price() to get the calculated price per unit.
+        Otherwise, uses the unit price from the last PricingEngine batch this
+        item was part of, or calls calculate_price() to get it; either way
+        the price comes from the item's price list once it has one.
         """
         if self.custom_price:
             unit_price = self.price_per_unit
+        elif self._priced_unit_price is not None:
+            unit_price = self._priced_unit_price
         else:
             unit_price = self.calculate_price()
             
@@ -80,13 +108,85 @@ class LineItem(BaseModel):
         """
         Override the save method to calculate and set the price_per_unit
         if custom_price is False. This ensures correct pricing regardless
-        of how the model is instantiated.
+        of how the model is instantiated. A price that did not come from the
+        item's own price list came from the live catalog, so the item is
+        pinned to the catalog's current price list.
+        The order's stored item total and line counts are adjusted in the
+        same transaction.
         """
         if not self.custom_price:
             # Calculate and set the price_per_unit before saving
-            self.price_per_unit = self.calculate_price()
+            if self._priced_unit_price is not None:
+                self.price_per_unit = self._priced_unit_price
+            else:
+                self.price_per_unit = self.calculate_price()
+
+            if self.uses_price_list and not self._priced_from_list:
+                from ..services.price_list_service import PriceListService
+                self.price_list_id = PriceListService.current_id()
         
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            if self._state.adding:
+                previous = None
+            elif self._persisted_contribution is not None:
+                previous = self._persisted_contribution
+            else:
+                previous = self._load_persisted_contribution()
+
+            super().save(*args, **kwargs)
+
+            current = self._order_contribution()
+            if previous is None:
+                self._update_order_aggregates(current[0], current[1], 1)
+            elif previous[0] != current[0]:
+                self._update_order_aggregates(previous[0], -previous[1], -1)
+                self._update_order_aggregates(current[0], current[1], 1)
+            else:
+                self._update_order_aggregates(current[0], current[1] - previous[1], 0)
+            self._persisted_contribution = current
+
+    def delete(self, *args, **kwargs):
+        """Delete the item and take it out of the order's stored totals."""
+        with transaction.atomic():
+            previous = self._persisted_contribution or self._load_persisted_contribution()
+            result = super().delete(*args, **kwargs)
+            if previous is not None:
+                self._update_order_aggregates(previous[0], -previous[1], -1)
+            self._persisted_contribution = None
+        return result
+
+    def _order_contribution(self):
+        """Return (order_id, extended price) for the values currently on this instance"""
+        return self.order_id, self.price_per_unit * self.quantity
+
+    def _load_persisted_contribution(self):
+        """Read (order_id, extended price) of this item from the database, or None if it is not saved"""
+        row = type(self)._base_manager.filter(pk=self.pk).values_list(
+            'order_id', 'price_per_unit', 'quantity'
+        ).first()
+        if row is None:
+            return None
+        return row[0], row[1] * row[2]
+
+    def _update_order_aggregates(self, order_id, total_delta, count_delta):
+        """
+        Apply a relative change to an order's item_total and line count.
+        A loaded order instance on this item is kept in step.
+        """
+        from .order import Order
+
+        if order_id is None or (not total_delta and not count_delta):
+            return
+
+        updates = {'item_total': F('item_total') + total_delta}
+        if count_delta:
+            updates[self.order_count_field] = F(self.order_count_field) + count_delta
+        Order.objects.filter(pk=order_id).update(**updates)
+
+        if type(self).order.is_cached(self) and self.order.pk == order_id:
+            self.order.item_total += total_delta
+            setattr(self.order, self.order_count_field,
+                    getattr(self.order, self.order_count_field) + count_delta)
 
 class GenericLineItem(LineItem):
     """
@@ -108,9 +208,14 @@ class GenericLineItem(LineItem):
         help_text="Description of the item or service"
     )
     
+    order_count_field = 'generic_count'
+
     class Meta:
         verbose_name = "Miscellaneous Item"
         verbose_name_plural = "Miscellaneous Items"
+        indexes = [
+            models.Index(fields=['order', 'created_at'], name='genericitem_order_created_idx'),
+        ]
     
     def calculate_price(self):
         """
@@ -68,6 +68,28 @@ class Order(BaseModel):
         verbose_name="Total"
     )
 
+    # Line item aggregates, kept up to date by LineItem.save() and delete()
+    item_total = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        default=0,
+        verbose_name="Item Total"
+    )
+    door_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Door Count"
+    )
+    drawer_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Drawer Count"
+    )
+    generic_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Miscellaneous Item Count"
+    )
+
+    AGGREGATE_FIELDS = ('item_total', 'door_count', 'drawer_count', 'generic_count')
+
     # Managers
     objects = models.Manager()
     quotes = QuoteManager()
@@ -77,11 +99,39 @@ class Order(BaseModel):
         ordering = ['-order_date']
         verbose_name = "Order"
         verbose_name_plural = "Orders"
+        indexes = [
+            # Order and quote lists filter on is_quote, then sort and range-filter on order_date.
+            # SQLite cannot use a plain (is_quote, ...) index for the bare boolean terms
+            # Django emits for is_quote, so each manager gets a partial index instead.
+            models.Index(
+                fields=['order_date', 'id'],
+                condition=models.Q(is_quote=False),
+                name='order_confirmed_date_idx'
+            ),
+            models.Index(
+                fields=['order_date', 'id'],
+                condition=models.Q(is_quote=True),
+                name='order_quote_date_idx'
+            ),
+        ]
 
     def __str__(self):
         type_prefix = "Quote" if self.is_quote else "Order"
         return f"{type_prefix} {self.order_number} - {self.customer.company_name}"
 
+    def save(self, *args, **kwargs):
+        """
+        Save the order without overwriting the line item aggregates.
+        Those columns are only ever changed with relative updates, so a stale
+        instance must not write back the values it was loaded with.
+        """
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.AGGREGATE_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
     @property
     def order_number(self):
         """Generate order number based on type, date, and primary key"""
@@ -111,37 +161,42 @@ class Order(BaseModel):
     
     def count_total_items(self):
         """Count all line items"""
-        return self.door_items.count() + self.drawer_items.count() + self.generic_items.count()
+        return self.door_count + self.drawer_count + self.generic_count
             
     def get_item_types_summary(self):
         """Get a summary of item types and counts"""
         return {
-            'doors': self.door_items.count(),
-            'drawers': self.drawer_items.count(),
-            'misc': self.generic_items.count(),
+            'doors': self.door_count,
+            'drawers': self.drawer_count,
+            'misc': self.generic_count,
             'total': self.count_total_items()
         }
 
-    @property
-    def item_total(self):
-        """Calculate the sum of all line items"""
-        door_total = sum(item.total_price for item in self.door_items.all())
-        drawer_total = sum(item.total_price for item in self.drawer_items.all())
-        generic_total = sum(item.total_price for item in self.generic_items.all())
-        return door_total + drawer_total + generic_total
+    def calculate_item_total(self):
+        """Re-price all line items from their price lists (current catalog prices for items without one) and return their sum"""
+        from ..services.pricing_engine import PricingEngine
+        return PricingEngine.total(PricingEngine().price_batch(self.line_items))
 
     @property
     def subtotal(self):
         """Calculate subtotal (item_total - discount + surcharge + shipping)"""
-        return self.item_total - self.discount_amount + self.surcharge_amount + self.shipping_amount
+        return self.get_subtotal(self.item_total)
+
+    def get_subtotal(self, item_total):
+        """Calculate subtotal from an already computed item total"""
+        return item_total - self.discount_amount + self.surcharge_amount + self.shipping_amount
 
-    def calculate_totals(self):
-        """Calculate and update all order totals based on customer defaults"""
+    def calculate_totals(self, item_total=None):
+        """
+        Calculate and update all order totals based on customer defaults.
+        Pass item_total when the line items have already been priced.
+        """
         # Get customer defaults
         customer_defaults = self.customer.defaults
         
         # Calculate item total
-        item_total = self.item_total
+        if item_total is None:
+            item_total = self.item_total
         
         # Calculate discount
         if customer_defaults.discount_type == 'PERCENT':
@@ -162,4 +217,4 @@ class Order(BaseModel):
             self.shipping_amount = customer_defaults.shipping_value
         
         # Calculate total
-        self.total = self.subtotal + self.tax_amount 
\ No newline at end of file
+        self.total = self.get_subtotal(item_total) + self.tax_amount 
\ No newline at end of file
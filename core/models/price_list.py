@@ -0,0 +1,57 @@
+from decimal import Decimal
+from typing import Optional
+
+from django.db import models
+
+from .base import BaseModel
+
+
+class PriceList(BaseModel):
+    """
+    Immutable snapshot of the catalog prices line items were priced from.
+
+    A new price list is stored the first time an item is priced after a
+    catalog or drawer settings change; identical prices share one row through
+    the digest. Line items keep a reference to the list they were priced from,
+    so old orders are never re-priced from the live catalog.
+
+    ``prices`` holds, with every price as a string:
+        door: {style id: {wood stock id: unit price}}
+        drawer_wood_stock / drawer_bottom_size: {id: price}
+        undermount_charge / finish_charge: option charges, or None
+    """
+    digest = models.CharField(max_length=64, unique=True, editable=False)
+    prices = models.JSONField(editable=False)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Price List'
+        verbose_name_plural = 'Price Lists'
+
+    def __str__(self):
+        return f"Price List {self.pk} ({self.created_at:%Y-%m-%d})"
+
+    def save(self, *args, **kwargs):
+        """Price lists are written once; line items rely on them never changing."""
+        if not self._state.adding:
+            raise ValueError("Price lists are immutable")
+        super().save(*args, **kwargs)
+
+    def door_price(self, style_id, wood_stock_id) -> Optional[Decimal]:
+        """Return the unit price of a door, or None if the list has no such style and wood stock."""
+        price = self.prices['door'].get(str(style_id), {}).get(str(wood_stock_id))
+        return None if price is None else Decimal(price)
+
+    def drawer_price(self, wood_stock_id, bottom_id, undermount=False, finishing=False) -> Optional[Decimal]:
+        """Return the unit price of a drawer, or None if the list has no such wood stock or bottom."""
+        wood_stock_price = self.prices['drawer_wood_stock'].get(str(wood_stock_id))
+        bottom_price = self.prices['drawer_bottom_size'].get(str(bottom_id))
+        if wood_stock_price is None or bottom_price is None:
+            return None
+
+        price = Decimal(wood_stock_price) + Decimal(bottom_price)
+        if undermount and self.prices['undermount_charge'] is not None:
+            price += Decimal(self.prices['undermount_charge'])
+        if finishing and self.prices['finish_charge'] is not None:
+            price += Decimal(self.prices['finish_charge'])
+        return price
@@ -0,0 +1,210 @@
+"""
+Keyset (cursor) pagination for list and search views.
+
+Django's Paginator counts the whole result set and skips rows with OFFSET,
+both of which get slower as tables grow. CursorPaginator instead remembers the
+sort key of the first and last row on the page and asks for the rows just
+before or after it, which the list indexes answer directly. Cursors are
+opaque url-safe strings so they can go straight into HTMX query strings.
+"""
+import base64
+import json
+from typing import Any, List, Optional, Sequence
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+
+
+def encode_cursor(data: dict) -> str:
+    """Encode cursor data as an opaque, url-safe string."""
+    raw = json.dumps(data, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[dict]:
+    """Decode a cursor made by encode_cursor(), or return None if it is missing or malformed."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        data = json.loads(raw)
+    except (ValueError, TypeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class CursorPage:
+    """
+    One page of results, with cursors for the neighbouring pages.
+
+    Mirrors the parts of django.core.paginator.Page the templates use
+    (iteration, has_next, has_previous, has_other_pages), plus first/last
+    cursors and a count that may be capped.
+    """
+
+    def __init__(self, object_list: List[Any], paginator: 'CursorPaginator',
+                 next_cursor: Optional[str], previous_cursor: Optional[str]):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+    @property
+    def last_cursor(self) -> str:
+        """Cursor for the final page."""
+        return self.paginator.last_cursor
+
+
+class CursorPaginator:
+    """
+    Paginate a queryset by its sort key instead of by page number.
+
+    ``ordering`` lists the non-null fields that give the queryset a total
+    order, e.g. ('-order_date', '-id'); the last one must be unique. Anything
+    that is not a queryset (such as ranked full-text results) is paged by an
+    offset stored in the cursor instead.
+
+    ``count`` is capped at ``count_limit`` rows so that counting a huge table
+    stays cheap; ``count_is_exact`` tells the template whether to show it as
+    a lower bound. Pass ``count_limit=None`` for an exact count, or 0 to skip
+    counting.
+    """
+
+    last_cursor = encode_cursor({'before': True})
+
+    def __init__(self, object_list: Any, ordering: Sequence[str] = ('-id',),
+                 per_page: int = 10, count_limit: Optional[int] = 1000):
+        self.object_list = object_list
+        self.ordering = tuple(ordering)
+        self.per_page = per_page
+        self.count_limit = count_limit
+        self._count = None
+
+    @property
+    def uses_keyset(self) -> bool:
+        return isinstance(self.object_list, QuerySet)
+
+    @property
+    def count(self) -> int:
+        """Number of rows, capped at count_limit."""
+        if self._count is None:
+            if self.count_limit == 0:
+                self._count = 0
+            elif self.count_limit is None or not self.uses_keyset:
+                self._count = self.object_list.count()
+            else:
+                self._count = self.object_list.order_by()[:self.count_limit + 1].count()
+        return self._count
+
+    @property
+    def count_is_exact(self) -> bool:
+        return self.count_limit is None or not self.uses_keyset or self.count <= self.count_limit
+
+    @property
+    def display_count(self) -> int:
+        """Count to show to users; at most count_limit."""
+        return self.count if self.count_is_exact else self.count_limit
+
+    def page(self, cursor: Optional[str] = None) -> CursorPage:
+        """Return the page identified by ``cursor``; the first page if it is empty or invalid."""
+        data = decode_cursor(cursor) or {}
+        if not self.uses_keyset:
+            return self._offset_page(data)
+        return self._keyset_page(data)
+
+    def _keyset_page(self, data: dict) -> CursorPage:
+        before = bool(data.get('before'))
+        key = self._decode_key(data.get('key'))
+
+        queryset = self.object_list.order_by(*self._ordering(reverse=before))
+        if key is not None:
+            queryset = queryset.filter(self._seek(key, before))
+        rows = list(queryset[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if before:
+            rows.reverse()
+            # Stepping back into the first page may give a short page; show the real first page
+            if key is not None and not has_more:
+                return self._keyset_page({})
+            has_next, has_previous = key is not None, has_more
+        else:
+            has_next, has_previous = has_more, key is not None
+
+        next_cursor = previous_cursor = None
+        if rows and has_next:
+            next_cursor = encode_cursor({'key': self._encode_key(rows[-1])})
+        if rows and has_previous:
+            previous_cursor = encode_cursor({'key': self._encode_key(rows[0]), 'before': True})
+        return CursorPage(rows, self, next_cursor, previous_cursor)
+
+    def _offset_page(self, data: dict) -> CursorPage:
+        if data.get('before') and 'offset' not in data:
+            offset = max((self.count - 1) // self.per_page * self.per_page, 0)
+        else:
+            try:
+                offset = max(int(data.get('offset', 0)), 0)
+            except (TypeError, ValueError):
+                offset = 0
+
+        rows = list(self.object_list[offset:offset + self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        next_cursor = encode_cursor({'offset': offset + self.per_page}) if has_more else None
+        previous_cursor = encode_cursor({'offset': max(offset - self.per_page, 0)}) if offset else None
+        return CursorPage(rows, self, next_cursor, previous_cursor)
+
+    def _ordering(self, reverse: bool = False) -> List[str]:
+        if not reverse:
+            return list(self.ordering)
+        return [name[1:] if name.startswith('-') else f'-{name}' for name in self.ordering]
+
+    def _fields(self):
+        return [(name.lstrip('-'), name.startswith('-')) for name in self.ordering]
+
+    def _seek(self, key: List[Any], before: bool) -> Q:
+        """
+        Build the filter for rows after ``key`` in the paging direction, i.e.
+        (a, b) < (x, y) expanded as a < x OR (a = x AND b < y).
+        """
+        condition = Q()
+        equal = Q()
+        for (name, descending), value in zip(self._fields(), key):
+            lookup = 'lt' if descending != before else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def _encode_key(self, obj: Any) -> List[str]:
+        model = self.object_list.model
+        return [model._meta.get_field(name).value_to_string(obj) for name, _ in self._fields()]
+
+    def _decode_key(self, values: Any) -> Optional[List[Any]]:
+        fields = self._fields()
+        if not isinstance(values, list) or len(values) != len(fields):
+            return None
+        model = self.object_list.model
+        try:
+            return [model._meta.get_field(name).to_python(value) for (name, _), value in zip(fields, values)]
+        except ValidationError:
+            return None
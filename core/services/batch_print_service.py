@@ -0,0 +1,189 @@
+"""
+Service for printing many orders or quotes as one merged PDF or ZIP.
+
+The whole batch is loaded and priced with one query per table, each document
+is rendered by the PDF worker pool (or taken from the PDF cache), and the
+results are joined once every document is ready.
+"""
+import os
+import zipfile
+from collections import defaultdict
+from concurrent.futures import as_completed
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from django.utils import timezone
+from pypdf import PdfWriter
+
+from .pdf_cache_service import PdfCacheService
+from .pdf_job_service import PdfJob, PdfJobService
+from .pricing_engine import PricingEngine
+from ..models.door import DoorLineItem
+from ..models.drawer import DrawerLineItem
+from ..models.line_item import GenericLineItem
+
+FORMATS = {
+    'pdf': 'application/pdf',
+    'zip': 'application/zip',
+}
+
+
+class BatchEntry(NamedTuple):
+    """One document of a batch and where its PDF is cached."""
+    order: Any
+    context: Dict[str, Any]
+    path: str
+    filename: str
+
+
+class BatchPrintService:
+    """
+    Prints every order or quote of a queryset into a single file.
+
+    Usage:
+        service = BatchPrintService(queryset, is_quote=False)
+        entries = service.prepare()
+        job = service.submit(entries, 'pdf')       # web: assembled in the background
+        service.write(entries, path, 'zip')        # command line: blocks until done
+    """
+
+    def __init__(self, queryset, is_quote: bool = False):
+        self.queryset = queryset
+        self.kind = 'quote' if is_quote else 'order'
+        self.template_name = f'pdf/{self.kind}_pdf.html'
+
+    def prepare(self) -> List[BatchEntry]:
+        """
+        Load, price and key every document of the batch.
+
+        Orders, customers and each line item type are read with one query
+        each, however many orders the batch holds.
+
+        Returns:
+            list: A BatchEntry per order, in queryset order
+        """
+        orders = list(self.queryset.select_related('customer'))
+        order_ids = [order.pk for order in orders]
+
+        # Get every line item of the batch, grouped by order
+        items = {
+            'door_items': self._group(DoorLineItem.objects.filter(order_id__in=order_ids).select_related(
+                'wood_stock', 'edge_profile', 'panel_rise', 'style'
+            )),
+            'drawer_items': self._group(DrawerLineItem.objects.filter(order_id__in=order_ids).select_related(
+                'wood_stock', 'edge_type', 'bottom'
+            )),
+            'generic_items': self._group(GenericLineItem.objects.filter(order_id__in=order_ids)),
+        }
+
+        # Price the whole batch against a single catalog snapshot
+        PricingEngine().price_batch(
+            item for grouped in items.values() for order_items in grouped.values() for item in order_items
+        )
+
+        entries = []
+        for order in orders:
+            line_items = {name: grouped.get(order.pk, []) for name, grouped in items.items()}
+            versions = PdfCacheService.line_item_versions_from(
+                order, line_items['door_items'], line_items['drawer_items'], line_items['generic_items']
+            )
+            entries.append(BatchEntry(
+                order=order,
+                context={self.kind: order, **line_items},
+                path=PdfCacheService.path_for(order, self.template_name, versions),
+                filename=f'{self.kind}_{order.order_number}.pdf',
+            ))
+        return entries
+
+    def queue(self, entries: List[BatchEntry]) -> list:
+        """
+        Queue every document that is not cached yet on the PDF worker pool.
+
+        Returns:
+            list: Futures of the queued documents
+        """
+        futures = []
+        for entry in entries:
+            if not PdfCacheService.get(entry.path):
+                job = PdfJobService.submit(self.template_name, entry.context, entry.filename, path=entry.path)
+                futures.append(job.future)
+        return futures
+
+    def submit(self, entries: List[BatchEntry], file_format: str = 'pdf') -> PdfJob:
+        """
+        Queue the batch and assemble it in the background.
+
+        The job's ``progress`` counts finished documents so the status
+        partial can show how far along the batch is.
+
+        Args:
+            entries: Documents from prepare()
+            file_format: 'pdf' for one merged PDF, 'zip' for an archive of PDFs
+
+        Returns:
+            PdfJob: The job producing the batch file
+        """
+        futures = self.queue(entries)
+
+        def task(job: PdfJob):
+            def progress(finished, total):
+                job.progress = (finished, total)
+            return self.assemble(entries, futures, job.path, file_format, progress)
+
+        filename = f'{self.kind}s_{timezone.localdate():%Y-%m-%d}.{file_format}'
+        return PdfJobService.submit_task(task, filename, content_type=FORMATS[file_format])
+
+    def write(self, entries: List[BatchEntry], output_path: str, file_format: str = 'pdf',
+              progress: Optional[Callable[[int, int], None]] = None) -> str:
+        """Queue the batch and write it to ``output_path``, blocking until it is done."""
+        return self.assemble(entries, self.queue(entries), output_path, file_format, progress)
+
+    @staticmethod
+    def assemble(entries: List[BatchEntry], futures: list, output_path: str, file_format: str = 'pdf',
+                 progress: Optional[Callable[[int, int], None]] = None) -> str:
+        """
+        Wait for the queued documents, then merge or zip every PDF of the batch.
+
+        Args:
+            entries: Documents from prepare()
+            futures: Futures returned by queue()
+            output_path: Where to write the batch file
+            file_format: 'pdf' or 'zip'
+            progress: Called with (finished, total) as documents complete
+
+        Returns:
+            str: output_path
+        """
+        total = len(entries)
+        finished = total - len(futures)
+        if progress:
+            progress(finished, total)
+        for future in as_completed(futures):
+            # Raises if a document failed, failing the whole batch
+            future.result()
+            finished += 1
+            if progress:
+                progress(finished, total)
+
+        temp_path = f'{output_path}.tmp'
+        if file_format == 'zip':
+            with zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_STORED) as archive:
+                for entry in entries:
+                    archive.write(entry.path, entry.filename)
+        else:
+            writer = PdfWriter()
+            for entry in entries:
+                writer.append(entry.path)
+            with open(temp_path, 'wb') as f:
+                writer.write(f)
+        os.replace(temp_path, output_path)
+
+        PdfCacheService.evict()
+        return output_path
+
+    @staticmethod
+    def _group(queryset) -> Dict[int, list]:
+        """Group line items by order id, keeping the queryset order."""
+        grouped = defaultdict(list)
+        for item in queryset:
+            grouped[item.order_id].append(item)
+        return grouped
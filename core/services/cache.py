@@ -0,0 +1,145 @@
+"""
+Small building blocks for process-wide, versioned in-memory caches.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from ..models.cache_version import CacheVersion
+
+
+class VersionedCache:
+    """
+    Thread-safe holder for a value that is rebuilt lazily after invalidation.
+
+    Every call to invalidate() bumps the version number. The next get() calls
+    the loader with the new version and keeps the result until the version
+    changes again. A value loaded while an invalidation was in flight is
+    returned to its caller but never stored, so a stale snapshot cannot
+    outlive the write that made it stale.
+
+    With a ``shared_name`` the cache also follows writes made by other
+    processes: invalidate_on_commit() bumps a CacheVersion row in the
+    writer's transaction, and the cache is invalidated when it sees that row
+    change. The row is read at most once every CACHE_VERSION_CHECK_SECONDS.
+    """
+
+    def __init__(self, loader, shared_name: Optional[str] = None):
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._version = 0
+        self._value = None
+        self._value_version = None
+        self._shared_name = shared_name
+        self._shared_version = None
+        self._next_check = 0.0
+
+    @property
+    def version(self):
+        """Current version number; changes every time the cache is invalidated."""
+        self.sync()
+        return self._version
+
+    def sync(self):
+        """Invalidate the cache if another process bumped its shared version."""
+        if self._shared_name is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_check:
+                return
+            self._next_check = now + settings.CACHE_VERSION_CHECK_SECONDS
+
+        shared_version = CacheVersion.current(self._shared_name)
+
+        with self._lock:
+            if shared_version != self._shared_version:
+                self._shared_version = shared_version
+                self._invalidate()
+
+    def get(self):
+        """Return the cached value, loading it first if it is missing or stale."""
+        self.sync()
+        with self._lock:
+            if self._value_version == self._version:
+                return self._value
+            version = self._version
+
+        value = self._loader(version)
+
+        with self._lock:
+            if self._version == version:
+                self._value = value
+                self._value_version = version
+        return value
+
+    def invalidate(self):
+        """Drop the cached value and bump the version."""
+        with self._lock:
+            self._invalidate()
+
+    def _invalidate(self):
+        """invalidate() for callers already holding the lock."""
+        self._version += 1
+        self._value = None
+        self._value_version = None
+
+    def invalidate_on_commit(self):
+        """
+        Invalidate now and again once the current transaction commits.
+
+        The second bump discards any snapshot another thread loaded between
+        the write and the commit, when it could still see the old rows. A
+        shared cache also bumps its CacheVersion row in the same transaction,
+        so other processes drop their copies once the write is visible.
+        """
+        self.invalidate()
+        if self._shared_name is None:
+            transaction.on_commit(self.invalidate)
+            return
+
+        shared_version = CacheVersion.bump(self._shared_name)
+
+        def invalidate_committed():
+            with self._lock:
+                # Our own bump needs no reload when sync() next reads it
+                self._shared_version = shared_version
+                self._invalidate()
+
+        transaction.on_commit(invalidate_committed)
+
+
+class MemoCache:
+    """
+    Thread-safe, size-bounded memo of values keyed on everything they depend on.
+
+    Callers put the versions of their inputs (updated_at, catalog version,
+    ...) in the key, so entries never need invalidating: a stale entry is
+    simply never asked for again and is evicted once the memo is full, least
+    recently used first.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._values = OrderedDict()
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Return the value stored under ``key``, calling ``build()`` to compute it if missing."""
+        with self._lock:
+            if key in self._values:
+                self._values.move_to_end(key)
+                return self._values[key]
+
+        value = build()
+
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            while len(self._values) > self._max_entries:
+                self._values.popitem(last=False)
+        return value
@@ -0,0 +1,187 @@
+"""
+In-process cache of the door and drawer catalog reference tables.
+
+Catalog rows (wood stocks, styles, edge profiles, ...) change a few times a
+month but are read on every pricing call and every form render. This module
+keeps an immutable snapshot of all of them in memory. The snapshot is
+versioned and is thrown away whenever a catalog row is saved or deleted
+(see core.signals), in this process or in any other using the same database.
+"""
+import hashlib
+from collections import namedtuple
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from .cache import VersionedCache
+from .price_matrix import DoorPriceMatrix
+from ..models.door import WoodStock, Design, EdgeProfile, PanelType, PanelRise, Style
+from ..models.drawer import DrawerWoodStock, DrawerEdgeType, DrawerBottomSize
+
+CATALOG_MODELS = {
+    'wood_stock': WoodStock,
+    'design': Design,
+    'edge_profile': EdgeProfile,
+    'panel_type': PanelType,
+    'panel_rise': PanelRise,
+    'style': Style,
+    'drawer_wood_stock': DrawerWoodStock,
+    'drawer_edge_type': DrawerEdgeType,
+    'drawer_bottom_size': DrawerBottomSize,
+}
+
+MODEL_KEYS = {model: key for key, model in CATALOG_MODELS.items()}
+
+
+def _record_type(model):
+    """Build an immutable record type holding every concrete column of ``model``."""
+    return namedtuple(f'{model.__name__}Record', [f.attname for f in model._meta.concrete_fields])
+
+
+RECORD_TYPES = {key: _record_type(model) for key, model in CATALOG_MODELS.items()}
+
+
+class Catalog:
+    """
+    Immutable snapshot of every catalog table.
+
+    Rows are stored as namedtuple records keyed by primary key, in name order.
+    """
+
+    def __init__(self, version: int, rows: Dict[str, Dict[int, tuple]]):
+        self.version = version
+        self._rows = rows
+        self._choices = {}
+        self._digest = None
+        self._door_prices = None
+        self._derived = {}
+
+    @property
+    def digest(self) -> str:
+        """
+        Hash of every row in the snapshot. Unlike ``version`` it survives a
+        restart, so it can key caches that outlive the process.
+        """
+        if self._digest is None:
+            self._digest = hashlib.sha256(repr(sorted(self._rows.items())).encode()).hexdigest()
+        return self._digest
+
+    @property
+    def door_prices(self) -> DoorPriceMatrix:
+        """Door unit price of every style and wood stock pair, built on first use."""
+        if self._door_prices is None:
+            self._door_prices = DoorPriceMatrix.build(self)
+        return self._door_prices
+
+    def derived(self, name: Hashable, build: Callable[['Catalog'], Any]) -> Any:
+        """
+        Return ``build(catalog)``, computed once per snapshot and shared by
+        every caller using the same ``name``. Values derived from the catalog,
+        such as rendered option lists, are discarded along with the snapshot.
+        """
+        if name not in self._derived:
+            self._derived[name] = build(self)
+        return self._derived[name]
+
+    def get(self, key: str, pk: Any) -> Optional[tuple]:
+        """Return the record with primary key ``pk`` from table ``key``, or None."""
+        try:
+            return self._rows[key].get(int(pk))
+        except (TypeError, ValueError):
+            return None
+
+    def all(self, key: str) -> Tuple[tuple, ...]:
+        """Return every record of table ``key`` in name order."""
+        return tuple(self._rows[key].values())
+
+    def instance(self, key: str, pk: Any):
+        """
+        Build a model instance from a cached record without touching the database.
+
+        Foreign keys to other catalog tables (e.g. Style.panel_type) are
+        hydrated from the snapshot too. A fresh instance is returned on every
+        call so callers are free to modify it.
+        """
+        record = self.get(key, pk)
+        if record is None:
+            return None
+
+        model = CATALOG_MODELS[key]
+        instance = model(**record._asdict())
+        instance._state.adding = False
+        instance._state.db = 'default'
+
+        for field in model._meta.concrete_fields:
+            if field.is_relation and field.related_model in MODEL_KEYS:
+                related = self.instance(MODEL_KEYS[field.related_model], getattr(record, field.attname))
+                if related is not None:
+                    setattr(instance, field.name, related)
+        return instance
+
+    def choices(self, key: str) -> List[Tuple[int, str]]:
+        """Return ``(pk, label)`` pairs for a select widget, labelled like the model's __str__."""
+        if key not in self._choices:
+            self._choices[key] = [(pk, str(self.instance(key, pk))) for pk in self._rows[key]]
+        return self._choices[key]
+
+
+def _load_catalog(version: int) -> Catalog:
+    """Read every catalog table in one pass and wrap it in a Catalog."""
+    rows = {}
+    for key, model in CATALOG_MODELS.items():
+        record_type = RECORD_TYPES[key]
+        fields = record_type._fields
+        rows[key] = {
+            values[0]: record_type(*values)
+            for values in model.objects.order_by('name').values_list(*fields)
+        }
+    return Catalog(version, rows)
+
+
+_catalog_cache = VersionedCache(_load_catalog, shared_name='catalog')
+
+
+def get_catalog() -> Catalog:
+    """Return the current catalog snapshot, loading it if needed."""
+    return _catalog_cache.get()
+
+
+def catalog_version() -> int:
+    """Return the current catalog version number."""
+    return _catalog_cache.version
+
+
+def invalidate_catalog() -> None:
+    """Discard the cached catalog after a catalog table has changed."""
+    _catalog_cache.invalidate_on_commit()
+
+
+def resolve_instances(references: Dict[str, Tuple[str, Any]]) -> Dict[str, Any]:
+    """
+    Build model instances for references to catalog rows.
+
+    Args:
+        references: ``{name: (catalog key, pk)}``, e.g. {'bottom': ('drawer_bottom_size', 3)}
+
+    Returns:
+        dict: ``{name: instance}`` for every reference to an existing row.
+        Rows come from the catalog snapshot; rows it does not know about yet
+        are loaded with one in_bulk() query per table.
+    """
+    catalog = get_catalog()
+    instances = {}
+    missing = {}
+    for name, (key, pk) in references.items():
+        instance = catalog.instance(key, pk)
+        if instance is not None:
+            instances[name] = instance
+            continue
+        try:
+            missing.setdefault(key, {})[name] = int(pk)
+        except (TypeError, ValueError):
+            continue
+
+    for key, names in missing.items():
+        rows = CATALOG_MODELS[key].objects.in_bulk(set(names.values()))
+        for name, pk in names.items():
+            if pk in rows:
+                instances[name] = rows[pk]
+    return instances
@@ -0,0 +1,293 @@
+"""
+Registry of the catalog tables edited on the settings pages, and the service
+that validates and saves their rows.
+"""
+import re
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from django.db import IntegrityError, transaction
+from django.forms import ModelForm, modelform_factory
+from django.utils import timezone
+
+from .catalog_cache import MODEL_KEYS, get_catalog, invalidate_catalog
+from ..forms.fields import CatalogChoiceField
+from ..models.door import Design, EdgeProfile, PanelRise, PanelType, Style, WoodStock
+from ..models.drawer import DrawerBottomSize, DrawerEdgeType, DrawerPricing, DrawerWoodStock
+
+
+def _catalog_formfield(field, **kwargs):
+    """Form field for a model field; relations to catalog tables validate against the catalog cache."""
+    if field.is_relation and field.related_model in MODEL_KEYS:
+        return CatalogChoiceField(MODEL_KEYS[field.related_model], required=not field.blank, **kwargs)
+    return field.formfield(**kwargs)
+
+
+class BulkRowForm(ModelForm):
+    """Row form of a bulk edit; CatalogEditService.bulk_update checks uniqueness for all rows at once."""
+
+    def validate_unique(self):
+        pass
+
+
+class CatalogTable:
+    """
+    One editable table of a settings page.
+
+    Args:
+        key: Suffix of the table's URL names, e.g. ``wood_stock`` for edit_wood_stock
+        path: URL path of the table below /settings/, e.g. ``doors/wood-stock``
+        model: The model the rows are instances of
+        fields: Editable fields, in the order of the table's columns
+        row_name: Variable the row partials expect the instance in
+        html_id: Prefix of the element ids of the table, e.g. ``wood-stocks`` for #wood-stocks-tbody
+        page: URL name of the settings page the table is on
+        row_templates: Display and edit row partials, with ``{}`` for display or edit
+        add_templates: Add form row and add button partials, with ``{}`` for row_add or add_button
+        select_related: Relations the display row shows
+        choices: Extra context for the edit and add rows, mapping a variable to a catalog table key
+    """
+
+    def __init__(self, key: str, path: str, model, fields: Sequence[str], row_name: str, html_id: str,
+                 page: str, row_templates: str, add_templates: str,
+                 select_related: Sequence[str] = (), choices: Optional[Mapping[str, str]] = None):
+        self.key = key
+        self.path = path
+        self.model = model
+        self.fields = tuple(fields)
+        self.row_name = row_name
+        self.html_id = html_id
+        self.page = page
+        self.row_templates = row_templates
+        self.add_templates = add_templates
+        self.select_related = tuple(select_related)
+        self.choices = dict(choices or {})
+        self.form_class = modelform_factory(model, fields=self.fields, formfield_callback=_catalog_formfield)
+        self.bulk_form_class = modelform_factory(
+            model, form=BulkRowForm, fields=self.fields, formfield_callback=_catalog_formfield
+        )
+
+    def __repr__(self):
+        return f'<CatalogTable {self.key}>'
+
+    @property
+    def label(self) -> str:
+        return self.model._meta.verbose_name_plural
+
+    @property
+    def column_count(self) -> int:
+        """Columns of the table: one per field, then the actions column."""
+        return len(self.fields) + 1
+
+    @property
+    def display_template(self) -> str:
+        return self.row_templates.format('display')
+
+    @property
+    def edit_template(self) -> str:
+        return self.row_templates.format('edit')
+
+    @property
+    def add_row_template(self) -> str:
+        return self.add_templates.format('row_add')
+
+    @property
+    def add_button_template(self) -> str:
+        return self.add_templates.format('add_button')
+
+    def queryset(self):
+        """Return every row of the table, in the order the settings page lists them."""
+        return self.model.objects.select_related(*self.select_related)
+
+    def choice_context(self) -> Dict[str, Any]:
+        """Return the select options the edit and add rows need, from the catalog cache."""
+        catalog = get_catalog()
+        return {name: catalog.all(key) for name, key in self.choices.items()}
+
+
+CATALOG_TABLES = {table.key: table for table in (
+    CatalogTable(
+        'door_style', 'doors/styles', Style,
+        ('name', 'panel_type', 'design', 'price', 'panels_across', 'panels_down',
+         'panel_overlap', 'designs_on_top', 'designs_on_bottom'),
+        'style', 'door-styles', 'door_settings',
+        'settings/partials/style_row_{}.html', 'settings/partials/style_{}.html',
+        select_related=('panel_type', 'design'),
+        choices={'panel_types': 'panel_type', 'designs': 'design'},
+    ),
+    CatalogTable(
+        'wood_stock', 'doors/wood-stock', WoodStock,
+        ('name', 'raised_panel_price', 'flat_panel_price'),
+        'wood', 'wood-stocks', 'door_settings',
+        'settings/partials/wood_stock_row_{}.html', 'settings/partials/wood_stock_{}.html',
+    ),
+    CatalogTable(
+        'door_design', 'doors/designs', Design,
+        ('name', 'arch'),
+        'design', 'door-designs', 'door_settings',
+        'settings/partials/design_row_{}.html', 'settings/partials/door_design_{}.html',
+    ),
+    CatalogTable(
+        'edge_profile', 'doors/edge-profiles', EdgeProfile,
+        ('name',),
+        'profile', 'edge-profiles', 'door_settings',
+        'settings/partials/edge_profile_row_{}.html', 'settings/partials/edge_profile_{}.html',
+    ),
+    CatalogTable(
+        'panel_rise', 'doors/panel-rises', PanelRise,
+        ('name',),
+        'rise', 'panel-rises', 'door_settings',
+        'settings/partials/panel_rise_row_{}.html', 'settings/partials/panel_rise_{}.html',
+    ),
+    CatalogTable(
+        'panel_type', 'doors/panel-types', PanelType,
+        ('name', 'surcharge_width', 'surcharge_height', 'surcharge_percent', 'minimum_sq_ft', 'use_flat_panel_price'),
+        'type', 'panel-types', 'door_settings',
+        'settings/partials/panel_type_row_{}.html', 'settings/partials/panel_type_{}.html',
+    ),
+    CatalogTable(
+        'drawer_woodstock', 'drawers/wood-stock', DrawerWoodStock,
+        ('name', 'price'),
+        'wood', 'drawer-wood-stocks', 'drawer_settings',
+        'settings/partials/drawer_woodstock_row_{}.html', 'settings/partials/drawer_woodstock_{}.html',
+    ),
+    CatalogTable(
+        'drawer_edgetype', 'drawers/edge-types', DrawerEdgeType,
+        ('name',),
+        'edge', 'drawer-edge-types', 'drawer_settings',
+        'settings/partials/drawer_edgetype_row_{}.html', 'settings/partials/drawer_edgetype_{}.html',
+    ),
+    CatalogTable(
+        'drawer_bottom', 'drawers/bottom-sizes', DrawerBottomSize,
+        ('name', 'thickness', 'price'),
+        'bottom', 'drawer-bottom-sizes', 'drawer_settings',
+        'settings/partials/drawer_bottom_row_{}.html', 'settings/partials/drawer_bottom_{}.html',
+    ),
+    CatalogTable(
+        'drawer_pricing', 'drawers/pricing', DrawerPricing,
+        ('price', 'height'),
+        'pricing', 'drawer-pricing', 'drawer_settings',
+        'settings/partials/drawer_pricing_row_{}.html', 'settings/partials/drawer_pricing_{}.html',
+    ),
+)}
+
+# Bulk edit fields are named "<row id>-<field>", the prefix of each row's form
+ROW_FIELD_PATTERN = re.compile(r'^(\d+)-')
+
+
+class CatalogEditService:
+    """
+    Validates and saves catalog table rows through a ModelForm built from the
+    table's fields.
+
+    Usage:
+        instance, errors = CatalogEditService.save(table, request.POST)
+        forms, updated = CatalogEditService.bulk_update(table, request.POST)
+    """
+
+    @staticmethod
+    def errors(form) -> Dict[str, List[str]]:
+        """Return a form's errors as ``{field: [message, ...]}``, like ValidationError.message_dict."""
+        return {field: list(messages) for field, messages in form.errors.items()}
+
+    @classmethod
+    def save(cls, table: CatalogTable, data, instance=None) -> Tuple[Any, Dict[str, List[str]]]:
+        """
+        Validate one row and save it.
+
+        Args:
+            table: The table the row belongs to
+            data: Submitted field values
+            instance: Row to update, or None to add one
+
+        Returns:
+            tuple: (instance, errors); the instance is only saved if errors is empty
+        """
+        form = table.form_class(data, instance=instance)
+        if not form.is_valid():
+            return form.instance, cls.errors(form)
+        return form.save(), {}
+
+    @staticmethod
+    def forms(table: CatalogTable, data=None) -> List[Any]:
+        """
+        Return a prefixed form for every row of the table, bound to ``data`` if
+        given. The rows are read with the table's own ordering.
+        """
+        return [table.bulk_form_class(data, instance=row, prefix=str(row.pk)) for row in table.queryset()]
+
+    @classmethod
+    def bulk_update(cls, table: CatalogTable, data) -> Tuple[List[Any], int]:
+        """
+        Validate every submitted row and write the changed ones in one
+        transaction with a single bulk_update.
+
+        Rows are identified by the "<row id>-" prefix of their field names.
+        Nothing is written unless every submitted row is valid.
+
+        Args:
+            table: The table the rows belong to
+            data: Submitted field values, e.g. {'3-name': 'Oak', '3-raised_panel_price': '12.50', ...}
+
+        Returns:
+            tuple: (forms, updated); a form per submitted row, in table order, and
+            the number of rows written, or -1 if any form has errors
+        """
+        row_ids = {int(match.group(1)) for match in map(ROW_FIELD_PATTERN.match, data) if match}
+
+        with transaction.atomic():
+            rows = table.queryset().filter(pk__in=row_ids)
+            forms = [table.bulk_form_class(data, instance=row, prefix=str(row.pk)) for row in rows]
+            if not all([form.is_valid() for form in forms]) or not cls._check_unique(table, forms):
+                return forms, -1
+
+            changed = [form for form in forms if form.has_changed()]
+            if not changed:
+                return forms, 0
+
+            now = timezone.now()
+            fields = {'updated_at'}
+            for form in changed:
+                form.instance.updated_at = now
+                fields.update(form.changed_data)
+            try:
+                with transaction.atomic():
+                    table.model.objects.bulk_update([form.instance for form in changed], sorted(fields))
+            except IntegrityError:
+                # e.g. two rows swapping names collide halfway through the update
+                for form in changed:
+                    form.add_error(None, "Another row already uses one of these values")
+                return forms, -1
+
+            # bulk_update sends no post_save, so drop the cached catalog here
+            if table.model in MODEL_KEYS:
+                invalidate_catalog()
+        return forms, len(changed)
+
+    @staticmethod
+    def _check_unique(table: CatalogTable, forms) -> bool:
+        """
+        Check the unique fields of all bulk edited rows with one query per
+        field, against the other rows and against each other. Adds an error to
+        every offending form; returns False if there was any.
+        """
+        meta = table.model._meta
+        row_ids = [form.instance.pk for form in forms]
+        valid = True
+        for name in table.fields:
+            field = meta.get_field(name)
+            if not field.unique:
+                continue
+
+            rows_by_value = {}
+            for form in forms:
+                rows_by_value.setdefault(form.cleaned_data[name], []).append(form)
+            taken = set(
+                table.model.objects.filter(**{f'{name}__in': list(rows_by_value)})
+                .exclude(pk__in=row_ids).values_list(name, flat=True)
+            )
+            for value, value_forms in rows_by_value.items():
+                if value in taken or len(value_forms) > 1:
+                    valid = False
+                    for form in value_forms:
+                        form.add_error(name, f"{meta.verbose_name.capitalize()} with this {field.verbose_name} already exists.")
+        return valid
@@ -0,0 +1,112 @@
+"""
+Service for searching customers by name, city and phone number.
+"""
+import re
+from typing import List
+
+from django.db import connection
+from django.db.models import Q
+
+from ..models import Customer
+
+FTS_TABLE = 'core_customer_fts'
+SEARCH_FIELDS = ['company_name', 'first_name', 'last_name', 'city', 'phone']
+
+# Set once the index is seen, so later searches skip the introspection query
+_fts_available = False
+
+
+def fts_available() -> bool:
+    """
+    Return whether the FTS5 customer index can be queried.
+
+    Checked through introspection rather than by trying a query in an atomic
+    block, which would take the SQLite write lock on every search. Only a
+    positive result is remembered, so running migrate enables the index
+    without a restart.
+    """
+    global _fts_available
+    if not _fts_available and connection.vendor == 'sqlite':
+        _fts_available = FTS_TABLE in connection.introspection.table_names()
+    return _fts_available
+
+
+class RankedCustomerResults:
+    """
+    Lazily evaluated, ranked result set of an FTS5 customer search.
+
+    Paginator only ever asks for the count and one slice, so each page is a
+    single ranked id query followed by one in_bulk() for the customers.
+    """
+
+    def __init__(self, match_expression: str):
+        self.match_expression = match_expression
+        self._count = None
+
+    def count(self) -> int:
+        if self._count is None:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT COUNT(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s",
+                    [self.match_expression],
+                )
+                self._count = cursor.fetchone()[0]
+        return self._count
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+
+        start = index.start or 0
+        limit = -1 if index.stop is None else max(index.stop - start, 0)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s "
+                f"ORDER BY rank, rowid DESC LIMIT %s OFFSET %s",
+                [self.match_expression, limit, start],
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+
+        customers = Customer.objects.in_bulk(ids)
+        return [customers[pk] for pk in ids if pk in customers]
+
+
+class CustomerSearchService:
+    """
+    Searches customers through the SQLite FTS5 index created in migration 0008.
+
+    Every word of the query must prefix-match one of the indexed columns, and
+    results come back best match first. On other database backends, or if the
+    index is missing, the original icontains search is used instead.
+    """
+
+    @staticmethod
+    def tokenize(search_query: str) -> List[str]:
+        """Split a search query into words, dropping FTS5 syntax characters."""
+        return [token for token in re.split(r'\W+', search_query.lower()) if token]
+
+    @classmethod
+    def search(cls, search_query: str):
+        """
+        Return customers matching ``search_query``, suitable for a Paginator.
+
+        The result is a RankedCustomerResults when the FTS5 index is used and a
+        queryset ordered newest first otherwise.
+        """
+        tokens = cls.tokenize(search_query)
+        if tokens and fts_available():
+            match_expression = ' '.join(f'"{token}"*' for token in tokens)
+            return RankedCustomerResults(match_expression)
+
+        return cls.search_orm(search_query)
+
+    @staticmethod
+    def search_orm(search_query: str):
+        """Search across multiple fields with icontains; the fallback path."""
+        query = Q()
+        for field in SEARCH_FIELDS:
+            query |= Q(**{f'{field}__icontains': search_query})
+        return Customer.objects.filter(query).order_by('-id')
@@ -0,0 +1,248 @@
+"""
+Service for computing door cut lists.
+
+Every door is a frame of two stiles and two rails around one or more panels.
+Styles with more than one panel down add interior rails between the rows, and
+more than one panel across adds mullions between the panels of each row. The
+sizes of every part of every door in a batch are computed at once with NumPy
+array math; the only per-row Python work is building the output tuples.
+"""
+from decimal import Decimal
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from .catalog_cache import get_catalog
+from .settings_cache import MiscDoorSettings, get_misc_door_settings
+from ..models.door import DoorLineItem
+
+# Output order of the parts of a door
+PARTS = ('stile', 'rail', 'interior rail', 'mullion', 'panel')
+
+# Door columns loaded for the cut list, in array order
+DOOR_FIELDS = (
+    'id', 'order_id', 'wood_stock_id', 'edge_profile_id', 'style_id', 'quantity',
+    'width', 'height', 'rail_top', 'rail_bottom', 'rail_left', 'rail_right', 'interior_rail_size',
+)
+
+# Decimal places of every size in the cut list, matching the model fields
+PRECISION = 3
+
+# Used until the miscellaneous door settings have been saved
+NO_ALLOWANCES = MiscDoorSettings(
+    extra_height=Decimal('0'),
+    extra_width=Decimal('0'),
+    glue_min_width=Decimal('Infinity'),
+    rail_extra=Decimal('0'),
+    drawer_front_id=None,
+    drawer_slab_id=None,
+)
+
+
+class CutPiece(NamedTuple):
+    """One part of a door line item, with its finished and blank size in inches."""
+    order_number: str
+    item_id: int
+    wood_stock: str
+    edge_profile: str
+    style: str
+    part: str
+    quantity: int
+    width: Decimal
+    length: Decimal
+    glued: bool
+    blank_width: Decimal
+    blank_length: Decimal
+
+
+class CutList:
+    """The pieces of a batch of doors, plus the doors too small for their rails."""
+
+    CSV_HEADER = ('Order', 'Item', 'Wood Stock', 'Edge Profile', 'Style', 'Part', 'Qty', 'Width', 'Length',
+                  'Glued', 'Blank Width', 'Blank Length')
+
+    def __init__(self, pieces: List[CutPiece], invalid_items: List[int]):
+        self.pieces = pieces
+        self.invalid_items = invalid_items
+
+    def __iter__(self):
+        return iter(self.pieces)
+
+    def __len__(self):
+        return len(self.pieces)
+
+    def csv_rows(self):
+        """Yield the header and every piece as CSV rows."""
+        yield self.CSV_HEADER
+        for piece in self.pieces:
+            yield (
+                piece.order_number, piece.item_id, piece.wood_stock, piece.edge_profile, piece.style, piece.part,
+                piece.quantity, piece.width, piece.length, 'yes' if piece.glued else '',
+                piece.blank_width, piece.blank_length,
+            )
+
+
+class CutListService:
+    """
+    Computes stile, rail, interior rail, mullion and panel sizes for doors.
+
+    Sizes follow MiscellaneousDoorSettings: rails and mullions get
+    ``rail_extra`` added at each joint, and panels wider than
+    ``glue_min_width`` are glued up from boards, so their blank gets
+    ``extra_width`` and ``extra_height`` added. Style.panel_overlap is
+    added on each edge of a panel to sit in the frame grooves.
+    """
+
+    def __init__(self, misc_settings: Optional[MiscDoorSettings] = None):
+        self.settings = misc_settings or get_misc_door_settings() or NO_ALLOWANCES
+        self.catalog = get_catalog()
+
+    def for_orders(self, orders) -> CutList:
+        """
+        Build the cut list of every door in a queryset of orders.
+
+        Args:
+            orders: Queryset of orders or quotes
+
+        Returns:
+            CutList: Pieces ordered by order, door and part
+        """
+        order_numbers = {
+            order.pk: order.order_number
+            for order in orders.only('id', 'is_quote', 'order_date')
+        }
+        rows = (
+            DoorLineItem.objects
+            .filter(order__in=orders.order_by().values('pk'))
+            .order_by('order_id', 'id')
+            .values_list(*DOOR_FIELDS)
+        )
+        return self.compute(list(rows), order_numbers)
+
+    def compute(self, rows: List[tuple], order_numbers: Dict[int, str]) -> CutList:
+        """
+        Build the cut list of door rows laid out as DOOR_FIELDS.
+
+        Args:
+            rows: One tuple per door line item
+            order_numbers: Order number of each order id
+
+        Returns:
+            CutList: Pieces ordered as the rows, then by part
+        """
+        if not rows:
+            return CutList([], [])
+
+        columns = list(zip(*rows))
+        doors = {name: columns[i] for i, name in enumerate(DOOR_FIELDS)}
+        sizes = {
+            name: np.array(doors[name], dtype=np.float64)
+            for name in ('width', 'height', 'rail_top', 'rail_bottom', 'rail_left', 'rail_right',
+                         'interior_rail_size')
+        }
+        quantity = np.array(doors['quantity'], dtype=np.int64)
+        across, down, overlap = self._style_geometry(np.array(doors['style_id'], dtype=np.int64))
+
+        rail_extra = float(self.settings.rail_extra)
+        interior = sizes['interior_rail_size']
+
+        # Openings inside the outer frame, and the size of one row and column of panels
+        opening_width = sizes['width'] - sizes['rail_left'] - sizes['rail_right']
+        opening_height = sizes['height'] - sizes['rail_top'] - sizes['rail_bottom']
+        column_width = (opening_width - (across - 1) * interior) / across
+        row_height = (opening_height - (down - 1) * interior) / down
+        rail_length = opening_width + 2 * rail_extra
+
+        valid = (column_width > 0) & (row_height > 0)
+
+        # (part, door quantity multiplier, width, length) for every part of every door
+        parts = [
+            ('stile', 1, sizes['rail_left'], sizes['height']),
+            ('stile', 1, sizes['rail_right'], sizes['height']),
+            ('rail', 1, sizes['rail_top'], rail_length),
+            ('rail', 1, sizes['rail_bottom'], rail_length),
+            ('interior rail', down - 1, interior, rail_length),
+            ('mullion', (across - 1) * down, interior, row_height + 2 * rail_extra),
+            ('panel', across * down, column_width + 2 * overlap, row_height + 2 * overlap),
+        ]
+
+        door_index, part_index, counts, widths, lengths = [], [], [], [], []
+        for part, multiplier, width, length in parts:
+            door_index.append(np.arange(len(rows)))
+            part_index.append(np.full(len(rows), PARTS.index(part)))
+            counts.append(quantity * multiplier)
+            widths.append(np.broadcast_to(width, quantity.shape))
+            lengths.append(np.broadcast_to(length, quantity.shape))
+
+        door_index = np.concatenate(door_index)
+        part_index = np.concatenate(part_index)
+        counts = np.concatenate(counts)
+        widths = np.round(np.concatenate(widths), PRECISION)
+        lengths = np.round(np.concatenate(lengths), PRECISION)
+
+        # Merge identical parts of a door, e.g. equal left and right stiles
+        keep = valid[door_index] & (counts > 0)
+        keys = np.stack([door_index, part_index, widths, lengths], axis=1)[keep]
+        keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        counts = np.bincount(inverse.ravel(), weights=counts[keep]).astype(np.int64)
+        door_index = keys[:, 0].astype(np.int64)
+        part_index = keys[:, 1].astype(np.int64)
+        widths, lengths = keys[:, 2], keys[:, 3]
+
+        # Panels wider than the glue minimum are glued up with extra stock around them
+        glued = (part_index == PARTS.index('panel')) & (widths > float(self.settings.glue_min_width))
+        blank_widths = np.round(widths + glued * float(self.settings.extra_width), PRECISION)
+        blank_lengths = np.round(lengths + glued * float(self.settings.extra_height), PRECISION)
+
+        # Build the output rows; names and sizes repeat a lot, so convert each value once
+        wood_stocks = self._names('wood_stock', doors['wood_stock_id'])
+        edge_profiles = self._names('edge_profile', doors['edge_profile_id'])
+        styles = self._names('style', doors['style_id'])
+        decimals = {}
+
+        def to_decimal(value):
+            if value not in decimals:
+                decimals[value] = Decimal(f'{value:.{PRECISION}f}')
+            return decimals[value]
+
+        pieces = [
+            CutPiece(
+                order_number=order_numbers.get(doors['order_id'][door], ''),
+                item_id=doors['id'][door],
+                wood_stock=wood_stocks[doors['wood_stock_id'][door]],
+                edge_profile=edge_profiles[doors['edge_profile_id'][door]],
+                style=styles[doors['style_id'][door]],
+                part=PARTS[part],
+                quantity=count,
+                width=to_decimal(width),
+                length=to_decimal(length),
+                glued=is_glued,
+                blank_width=to_decimal(blank_width),
+                blank_length=to_decimal(blank_length),
+            )
+            for door, part, count, width, length, is_glued, blank_width, blank_length in zip(
+                door_index.tolist(), part_index.tolist(), counts.tolist(), widths.tolist(),
+                lengths.tolist(), glued.tolist(), blank_widths.tolist(), blank_lengths.tolist(),
+            )
+        ]
+        invalid_items = [doors['id'][door] for door in np.flatnonzero(~valid).tolist()]
+        return CutList(pieces, invalid_items)
+
+    def _style_geometry(self, style_ids: np.ndarray):
+        """Look up panels across, panels down and panel overlap for every door's style."""
+        unique_ids, inverse = np.unique(style_ids, return_inverse=True)
+        styles = [self.catalog.get('style', pk) for pk in unique_ids.tolist()]
+        across = np.array([style.panels_across if style else 1 for style in styles], dtype=np.float64)
+        down = np.array([style.panels_down if style else 1 for style in styles], dtype=np.float64)
+        overlap = np.array([float(style.panel_overlap) if style else 0.0 for style in styles])
+        across, down = np.maximum(across, 1), np.maximum(down, 1)
+        return across[inverse], down[inverse], overlap[inverse]
+
+    def _names(self, key: str, pks) -> Dict[int, str]:
+        """Map each distinct primary key in ``pks`` to its catalog name."""
+        names = {}
+        for pk in set(pks):
+            record = self.catalog.get(key, pk)
+            names[pk] = record.name if record else ''
+        return names
+
@@ -0,0 +1,262 @@
+"""
+Service for planning how rails and stiles are cut from fixed-length boards.
+
+Frame parts from the cut list are grouped by wood stock, edge profile and rip
+width, since only parts of the same group can come out of the same board.
+Each group is packed with first-fit decreasing. An optional improvement pass
+then tries, until its time budget runs out, to empty the worst-used boards
+into the spare length of the others.
+"""
+import time
+from collections import defaultdict
+from decimal import Decimal
+from typing import List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+
+from .cut_list_service import CutList, CutListService
+
+# Cut list parts made from board stock; panels are glued up from sheets instead
+FRAME_PARTS = ('stile', 'rail', 'interior rail', 'mullion')
+
+# Lengths are packed as integer thousandths of an inch to avoid rounding drift
+SCALE = 1000
+
+
+class Cut(NamedTuple):
+    """One part to cut, and the door it belongs to."""
+    length: Decimal
+    part: str
+    order_number: str
+    item_id: int
+
+
+class Board:
+    """One board of stock and the cuts planned on it."""
+
+    def __init__(self, cuts: List[Cut], used: Decimal, board_length: Decimal):
+        self.cuts = cuts
+        self.used = used
+        self.waste = board_length - used
+
+    @property
+    def lengths(self) -> List[Decimal]:
+        return [cut.length for cut in self.cuts]
+
+
+class StockGroup:
+    """The cutting plan for every part of one wood stock, edge profile and width."""
+
+    def __init__(self, wood_stock: str, edge_profile: str, width: Decimal,
+                 boards: List[Board], oversize: List[Cut], board_length: Decimal):
+        self.wood_stock = wood_stock
+        self.edge_profile = edge_profile
+        self.width = width
+        self.boards = boards
+        self.oversize = oversize
+        self.board_length = board_length
+
+    @property
+    def board_count(self) -> int:
+        return len(self.boards)
+
+    @property
+    def part_count(self) -> int:
+        return sum(len(board.cuts) for board in self.boards)
+
+    @property
+    def part_length(self) -> Decimal:
+        return sum((cut.length for board in self.boards for cut in board.cuts), Decimal('0'))
+
+    @property
+    def yield_percent(self) -> Decimal:
+        """Share of the boards' length that ends up in parts."""
+        if not self.boards:
+            return Decimal('0')
+        return (self.part_length * 100 / (self.board_length * self.board_count)).quantize(Decimal('0.1'))
+
+
+class CuttingPlan:
+    """Cutting plans of every stock group, with totals across them."""
+
+    def __init__(self, groups: List[StockGroup], board_length: Decimal, kerf: Decimal):
+        self.groups = groups
+        self.board_length = board_length
+        self.kerf = kerf
+
+    @property
+    def board_count(self) -> int:
+        return sum(group.board_count for group in self.groups)
+
+    @property
+    def part_count(self) -> int:
+        return sum(group.part_count for group in self.groups)
+
+    @property
+    def oversize(self) -> List[Cut]:
+        return [cut for group in self.groups for cut in group.oversize]
+
+    def csv_rows(self):
+        """Yield the header and one row per board: its group, waste and cut lengths."""
+        yield ('Wood Stock', 'Edge Profile', 'Width', 'Board', 'Parts', 'Waste', 'Cuts')
+        for group in self.groups:
+            for number, board in enumerate(group.boards, start=1):
+                yield (
+                    group.wood_stock, group.edge_profile, group.width, number, len(board.cuts),
+                    board.waste, ' + '.join(str(length) for length in board.lengths),
+                )
+
+    @property
+    def yield_percent(self) -> Decimal:
+        if not self.board_count:
+            return Decimal('0')
+        part_length = sum((group.part_length for group in self.groups), Decimal('0'))
+        return (part_length * 100 / (self.board_length * self.board_count)).quantize(Decimal('0.1'))
+
+
+class _FirstFitTree:
+    """
+    Max segment tree over the remaining capacity of boards, so that first fit
+    finds the leftmost board with enough room in O(log n) instead of scanning.
+    """
+
+    def __init__(self, size: int, capacity: int):
+        self.size = 1
+        while self.size < max(size, 1):
+            self.size *= 2
+        self.tree = [capacity] * (2 * self.size)
+
+    def first_fit(self, need: int) -> int:
+        """Return the index of the leftmost board with at least ``need`` remaining, or -1."""
+        if self.tree[1] < need:
+            return -1
+        node = 1
+        while node < self.size:
+            node = 2 * node if self.tree[2 * node] >= need else 2 * node + 1
+        return node - self.size
+
+    def take(self, index: int, amount: int) -> None:
+        node = index + self.size
+        self.tree[node] -= amount
+        node //= 2
+        while node:
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+            node //= 2
+
+
+class CuttingStockService:
+    """
+    Packs frame parts onto boards of settings.CUT_BOARD_LENGTH inches.
+
+    Every cut also consumes settings.CUT_KERF inches of saw blade, except
+    that the last part on a board may run to its very end. The improvement
+    pass runs for at most ``time_budget`` seconds per plan; 0 skips it.
+    """
+
+    def __init__(self, board_length: Optional[Decimal] = None, kerf: Optional[Decimal] = None,
+                 time_budget: Optional[float] = None):
+        self.board_length = Decimal(str(settings.CUT_BOARD_LENGTH if board_length is None else board_length))
+        self.kerf = Decimal(str(settings.CUT_KERF if kerf is None else kerf))
+        self.time_budget = settings.CUT_OPTIMIZE_SECONDS if time_budget is None else time_budget
+
+    def for_orders(self, orders) -> CuttingPlan:
+        """
+        Plan the cutting of every rail and stile in a queryset of orders.
+
+        Args:
+            orders: Queryset of orders, e.g. the confirmed orders of a date window
+
+        Returns:
+            CuttingPlan: Per group board plans, largest groups first
+        """
+        return self.plan(CutListService().for_orders(orders))
+
+    def plan(self, cut_list: CutList) -> CuttingPlan:
+        """Group the frame parts of ``cut_list`` by stock and pack each group."""
+        groups = defaultdict(list)
+        for piece in cut_list:
+            if piece.part in FRAME_PARTS:
+                cut = Cut(piece.blank_length, piece.part, piece.order_number, piece.item_id)
+                groups[(piece.wood_stock, piece.edge_profile, piece.blank_width)].extend([cut] * piece.quantity)
+
+        deadline = time.monotonic() + self.time_budget
+        plans = [
+            self._pack_group(key, cuts, deadline)
+            for key, cuts in sorted(groups.items(), key=lambda group: -len(group[1]))
+        ]
+        return CuttingPlan(plans, self.board_length, self.kerf)
+
+    def _pack_group(self, key: Tuple[str, str, Decimal], cuts: List[Cut], deadline: float) -> StockGroup:
+        wood_stock, edge_profile, width = key
+        kerf = self._scaled(self.kerf)
+        # Adding one kerf to the board lets every cut, including the last, be charged a kerf
+        capacity = self._scaled(self.board_length) + kerf
+
+        sizes = [self._scaled(cut.length) + kerf for cut in cuts]
+        oversize = [cut for cut, size in zip(cuts, sizes) if size > capacity]
+        order = sorted((i for i, size in enumerate(sizes) if size <= capacity), key=lambda i: -sizes[i])
+
+        bins = self._first_fit_decreasing(order, sizes, capacity)
+        if bins and time.monotonic() < deadline:
+            bins = self._improve(bins, sizes, capacity, deadline)
+
+        boards = []
+        for contents in bins:
+            contents = sorted(contents, key=lambda i: -sizes[i])
+            board_cuts = [cuts[i] for i in contents]
+            used = sum((cut.length for cut in board_cuts), Decimal('0')) + self.kerf * (len(board_cuts) - 1)
+            boards.append(Board(board_cuts, used, self.board_length))
+        boards.sort(key=lambda board: board.waste)
+        return StockGroup(wood_stock, edge_profile, width, boards, oversize, self.board_length)
+
+    @staticmethod
+    def _first_fit_decreasing(order: List[int], sizes: List[int], capacity: int) -> List[List[int]]:
+        """Place each part, longest first, on the first board it fits."""
+        tree = _FirstFitTree(len(order), capacity)
+        bins = []
+        for i in order:
+            index = tree.first_fit(sizes[i])
+            if index == len(bins):
+                bins.append([])
+            bins[index].append(i)
+            tree.take(index, sizes[i])
+        return bins
+
+    @staticmethod
+    def _improve(bins: List[List[int]], sizes: List[int], capacity: int, deadline: float) -> List[List[int]]:
+        """
+        Try to empty boards, least used first, by moving their parts into the
+        spare room of the other boards (best fit). A board is only given up
+        if all of its parts find a place; stops at ``deadline``.
+        """
+        free = [capacity - sum(sizes[i] for i in contents) for contents in bins]
+        candidates = sorted(range(len(bins)), key=lambda b: -free[b])
+
+        for board in candidates:
+            if time.monotonic() >= deadline:
+                break
+            if not bins[board]:
+                continue
+
+            moves = []
+            spare = {b: free[b] for b in range(len(bins)) if b != board and bins[b]}
+            for i in sorted(bins[board], key=lambda i: -sizes[i]):
+                fits = [b for b, room in spare.items() if room >= sizes[i]]
+                if not fits:
+                    break
+                target = min(fits, key=lambda b: spare[b])
+                spare[target] -= sizes[i]
+                moves.append((i, target))
+            else:
+                for i, target in moves:
+                    bins[target].append(i)
+                    free[target] -= sizes[i]
+                bins[board] = []
+                free[board] = capacity
+
+        return [contents for contents in bins if contents]
+
+    @staticmethod
+    def _scaled(value: Decimal) -> int:
+        return int((value * SCALE).to_integral_value())
+
@@ -1,12 +1,23 @@
 from decimal import Decimal, InvalidOperation
-from typing import Dict, Any, Optional, Union
-from django.core.exceptions import ObjectDoesNotExist
+from typing import Dict, Any
 
-from ..models.door import WoodStock, EdgeProfile, PanelRise, Style, RailDefaults
+from ..models.door import WoodStock, EdgeProfile, PanelRise, Style
 from ..models.customer import Customer
+from .cache import MemoCache
+from .catalog_cache import MODEL_KEYS, catalog_version, resolve_instances
+from .settings_cache import get_rail_defaults
+
+# Resolved defaults per customer, keyed on everything they are built from
+_resolved_defaults = MemoCache(max_entries=512)
 
 class DoorDefaultsService:
-    """Service class to handle all door defaults logic."""
+    """
+    Service class to handle all door defaults logic.
+
+    A customer's resolved defaults are memoized on the customer's updated_at,
+    the catalog version and the global rail defaults, so the door form, the
+    add door view and order creation share one resolution per change.
+    """
     
     RAIL_FIELDS = ['rail_top', 'rail_bottom', 'rail_left', 'rail_right', 'interior_rail_size']
     MODEL_FIELDS = {
@@ -22,7 +33,7 @@ class DoorDefaultsService:
 
     def _get_global_defaults(self) -> Dict[str, Decimal]:
         """Get global rail defaults."""
-        defaults = RailDefaults.objects.first()
+        defaults = get_rail_defaults()
         if not defaults:
             return {
                 'rail_top': Decimal('2.500'),
@@ -43,20 +54,26 @@ class DoorDefaultsService:
         """
         Get all door defaults for a customer, including resolved model instances.
         Returns a dictionary with both model instances and rail dimensions.
+        The instances are shared between callers and must not be modified.
         """
         if not customer.door_defaults:
             return {}
+        if customer.pk is None:
+            return self._resolve_defaults(customer)
 
+        key = (customer.pk, customer.updated_at, catalog_version(), tuple(self.global_defaults.values()))
+        return dict(_resolved_defaults.get(key, lambda: self._resolve_defaults(customer)))
+
+    def _resolve_defaults(self, customer: Customer) -> Dict[str, Any]:
+        """Resolve a customer's door defaults; catalog rows are looked up in one pass."""
         defaults = {}
         
-        # Handle model fields (wood_stock, edge_profile, etc.)
-        for field, model_class in self.MODEL_FIELDS.items():
-            if field in customer.door_defaults:
-                try:
-                    instance = model_class.objects.get(pk=customer.door_defaults[field])
-                    defaults[field] = instance
-                except ObjectDoesNotExist:
-                    continue
+        # Handle model fields (wood_stock, edge_profile, etc.) from the in-memory catalog
+        defaults.update(resolve_instances({
+            field: (MODEL_KEYS[model_class], customer.door_defaults[field])
+            for field, model_class in self.MODEL_FIELDS.items()
+            if field in customer.door_defaults
+        }))
 
         # Handle rail dimensions
         for field in self.RAIL_FIELDS:
@@ -78,13 +95,7 @@ class DoorDefaultsService:
 
     def get_rail_size(self, customer: Customer, rail_name: str) -> Decimal:
         """Get a specific rail size, falling back to global default if not set."""
-        if not customer.door_defaults or rail_name not in customer.door_defaults:
-            return self.global_defaults[rail_name]
-        
-        try:
-            return Decimal(str(customer.door_defaults[rail_name]))
-        except (InvalidOperation, TypeError):
-            return self.global_defaults[rail_name]
+        return self.get_defaults(customer).get(rail_name, self.global_defaults[rail_name])
 
     def prepare_defaults_for_storage(self, form_data: Dict[str, Any]) -> Dict[str, Any]:
         """
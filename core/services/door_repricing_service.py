@@ -0,0 +1,75 @@
+"""
+Service for repricing stored door line items after catalog price changes.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from .catalog_cache import get_catalog
+from .order_totals_service import OrderTotalsService
+from .price_list_service import PriceListService
+from ..models import Order
+from ..models.door import DoorLineItem
+
+
+class DoorRepricingService:
+    """
+    Brings the stored price_per_unit of door line items in line with the
+    current price matrix.
+
+    Doors with a custom price are left alone. Repriced doors move to the
+    current price list. Changed doors are written with bulk_update and the
+    stored aggregates of their orders are rebuilt once, instead of saving
+    every door and adjusting its order one at a time.
+    """
+
+    BATCH_SIZE = 500
+
+    @classmethod
+    def reprice(cls, orders) -> int:
+        """
+        Reprice every non-custom door of ``orders``.
+
+        Args:
+            orders: Queryset of orders or quotes
+
+        Returns:
+            int: Number of door line items whose price changed
+        """
+        matrix = get_catalog().door_prices
+        price_list_id = PriceListService.current_id()
+        now = timezone.now()
+
+        # Get the doors whose stored price differs from the matrix
+        changed = []
+        repinned = []
+        doors = (
+            DoorLineItem.objects
+            .filter(order__in=orders.order_by().values('pk'), custom_price=False)
+            .only('id', 'order_id', 'style_id', 'wood_stock_id', 'price_per_unit', 'price_list_id')
+        )
+        for door in doors.iterator(chunk_size=2000):
+            unit_price = matrix.price(door.style_id, door.wood_stock_id)
+            if unit_price is None:
+                continue
+            if unit_price != door.price_per_unit:
+                door.price_per_unit = unit_price
+                door.price_list_id = price_list_id
+                door.updated_at = now
+                changed.append(door)
+            elif door.price_list_id != price_list_id:
+                # Same price, but later edits should price from the current list
+                door.price_list_id = price_list_id
+                repinned.append(door)
+
+        if not changed and not repinned:
+            return 0
+
+        with transaction.atomic():
+            DoorLineItem.objects.bulk_update(repinned, ['price_list'], batch_size=cls.BATCH_SIZE)
+            if changed:
+                DoorLineItem.objects.bulk_update(
+                    changed, ['price_per_unit', 'price_list', 'updated_at'], batch_size=cls.BATCH_SIZE
+                )
+                order_ids = {door.order_id for door in changed}
+                OrderTotalsService.rebuild(Order.objects.filter(pk__in=order_ids))
+        return len(changed)
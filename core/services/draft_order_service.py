@@ -0,0 +1,177 @@
+"""
+Service for the draft order that is built up on the order and quote create pages.
+"""
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from ..models.draft import DraftLineItem, DraftOrder
+
+
+class DraftOrderService:
+    """
+    Stores the draft's line items as rows, so a change writes one row and the
+    draft's stored item total and count instead of every item.
+
+    The session only holds the draft id, which is written once when the draft
+    is created. The id is also kept in a signed cookie, so a draft outlives
+    the session it was started in for settings.DRAFT_ORDER_MAX_AGE seconds.
+
+    Usage:
+        draft = DraftOrderService.get(request, create=True)
+        row = DraftOrderService.add_item(draft, item)   # also updates draft.item_total
+        items = DraftOrderService.items(draft)
+    """
+
+    SESSION_KEY = 'draft_order_id'
+    COOKIE_NAME = 'draft_order'
+    COOKIE_SALT = 'core.draft_order'
+
+    @classmethod
+    def get(cls, request, create: bool = False) -> Optional[DraftOrder]:
+        """
+        Return the draft of the current browser.
+
+        Args:
+            request: The HTTP request
+            create: Start a new draft if there is none
+
+        Returns:
+            DraftOrder or None
+        """
+        draft = getattr(request, '_draft_order', None)
+        if draft is None:
+            draft_id = request.session.get(cls.SESSION_KEY) or cls._cookie_value(request)
+            if draft_id:
+                draft = DraftOrder.objects.select_related('customer').filter(pk=draft_id).first()
+        if draft is None and create:
+            draft = DraftOrder.objects.create()
+
+        if draft is not None:
+            # Only touches the session when the draft changes
+            if request.session.get(cls.SESSION_KEY) != draft.pk:
+                request.session[cls.SESSION_KEY] = draft.pk
+            request._draft_order = draft
+        return draft
+
+    @classmethod
+    def discard(cls, request) -> None:
+        """Delete the current draft and any drafts that have expired."""
+        draft = cls.get(request)
+        if draft is not None:
+            draft.delete()
+            request._draft_order = None
+        request.session.pop(cls.SESSION_KEY, None)
+        cls.purge()
+
+    @staticmethod
+    def purge() -> int:
+        """
+        Delete drafts left unchanged for settings.DRAFT_ORDER_MAX_AGE; returns
+        the number deleted. A draft still being worked on is kept however old it is.
+        """
+        cutoff = timezone.now() - timedelta(seconds=settings.DRAFT_ORDER_MAX_AGE)
+        deleted, _ = DraftOrder.objects.filter(updated_at__lt=cutoff).delete()
+        return deleted
+
+    @staticmethod
+    def set_customer(draft: DraftOrder, customer, billing_address1: str = '', billing_address2: str = '') -> None:
+        """Point the draft at ``customer`` and its billing address, keeping its line items."""
+        draft.customer = customer
+        draft.billing_address1 = billing_address1
+        draft.billing_address2 = billing_address2
+        draft.save(update_fields=['customer', 'billing_address1', 'billing_address2', 'updated_at'])
+
+    @classmethod
+    def add_item(cls, draft: DraftOrder, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Append one line item dictionary to the draft.
+
+        Returns:
+            dict: The stored item with its row id, as items() returns it
+        """
+        with transaction.atomic():
+            row = DraftLineItem.objects.create(draft=draft, type=item.get('type', 'other'), data=item)
+            cls._adjust_totals(draft, Decimal(item.get('total_price', '0')), 1)
+        return cls.as_item(row)
+
+    @classmethod
+    def remove_item(cls, draft: DraftOrder, item_id: int) -> bool:
+        """Remove one line item from the draft; False if it is not part of it."""
+        with transaction.atomic():
+            row = DraftLineItem.objects.filter(draft=draft, pk=item_id).only('data').first()
+            if row is None:
+                return False
+            row.delete()
+            cls._adjust_totals(draft, -Decimal(row.data.get('total_price', '0')), -1)
+        return True
+
+    @classmethod
+    def items(cls, draft: Optional[DraftOrder]) -> List[Dict[str, Any]]:
+        """Return the draft's line item dictionaries in the order they were added, each with its row id."""
+        if draft is None:
+            return []
+        return [cls.as_item(row) for row in draft.items.all()]
+
+    @staticmethod
+    def as_item(row: DraftLineItem) -> Dict[str, Any]:
+        """Return the line item dictionary of a DraftLineItem row, with its row id."""
+        return dict(row.data, id=row.pk)
+
+    @staticmethod
+    def _adjust_totals(draft: DraftOrder, total_delta: Decimal, count_delta: int) -> None:
+        """
+        Apply a relative change to the draft's stored item total and count, and
+        reload them. Also touches updated_at, which purge() ages drafts by.
+        """
+        DraftOrder.objects.filter(pk=draft.pk).update(
+            item_total=F('item_total') + total_delta,
+            item_count=F('item_count') + count_delta,
+            updated_at=timezone.now(),
+        )
+        draft.refresh_from_db(fields=['item_total', 'item_count', 'updated_at'])
+
+    @classmethod
+    def order_data(cls, draft: Optional[DraftOrder]) -> Dict[str, Any]:
+        """
+        Return the draft in the shape OrderService expects: the customer id
+        and billing address, if a customer was picked, and the line items.
+        """
+        if draft is None:
+            return {}
+        data = {'items': cls.items(draft)}
+        if draft.customer_id is not None:
+            data.update({
+                'customer': draft.customer_id,
+                'billing_address1': draft.billing_address1,
+                'billing_address2': draft.billing_address2,
+            })
+        return data
+
+    @classmethod
+    def update_cookie(cls, request, response):
+        """Set or clear the draft cookie to match the draft the request used."""
+        if not hasattr(request, '_draft_order'):
+            return response
+
+        draft = request._draft_order
+        if draft is None:
+            if cls.COOKIE_NAME in request.COOKIES:
+                response.delete_cookie(cls.COOKIE_NAME)
+        elif cls._cookie_value(request) != str(draft.pk):
+            response.set_signed_cookie(
+                cls.COOKIE_NAME, draft.pk, salt=cls.COOKIE_SALT,
+                max_age=settings.DRAFT_ORDER_MAX_AGE, httponly=True, samesite='Lax',
+            )
+        return response
+
+    @classmethod
+    def _cookie_value(cls, request) -> Optional[str]:
+        return request.get_signed_cookie(
+            cls.COOKIE_NAME, default=None, salt=cls.COOKIE_SALT, max_age=settings.DRAFT_ORDER_MAX_AGE
+        )
@@ -0,0 +1,66 @@
+from typing import Any, Dict
+
+from ..models.customer import Customer
+from ..models.drawer import DrawerBottomSize, DrawerEdgeType, DrawerWoodStock
+from .cache import MemoCache
+from .catalog_cache import MODEL_KEYS, catalog_version, resolve_instances
+
+# Resolved defaults per customer, keyed on everything they are built from
+_resolved_defaults = MemoCache(max_entries=512)
+
+
+class DrawerDefaultsService:
+    """
+    Service class to handle drawer defaults logic.
+
+    Like door defaults, a customer's resolved drawer defaults are memoized on
+    the customer's updated_at and the catalog version.
+    """
+
+    MODEL_FIELDS = {
+        'wood_stock': DrawerWoodStock,
+        'edge_type': DrawerEdgeType,
+        'bottom': DrawerBottomSize,
+    }
+    BOOLEAN_FIELDS = ['undermount', 'finishing']
+
+    def get_defaults(self, customer: Customer) -> Dict[str, Any]:
+        """
+        Get all drawer defaults for a customer, with the wood stock, edge type
+        and bottom resolved to model instances. The instances are shared
+        between callers and must not be modified.
+        """
+        if not customer.drawer_defaults:
+            return {}
+        if customer.pk is None:
+            return self._resolve_defaults(customer)
+
+        key = (customer.pk, customer.updated_at, catalog_version())
+        return dict(_resolved_defaults.get(key, lambda: self._resolve_defaults(customer)))
+
+    def _resolve_defaults(self, customer: Customer) -> Dict[str, Any]:
+        """Resolve a customer's drawer defaults; catalog rows are looked up in one pass."""
+        drawer_defaults = customer.drawer_defaults
+
+        # Handle model fields from the in-memory catalog
+        defaults = resolve_instances({
+            field: (MODEL_KEYS[model_class], drawer_defaults[field])
+            for field, model_class in self.MODEL_FIELDS.items()
+            if isinstance(drawer_defaults.get(field), (int, str))
+        })
+
+        # Handle boolean options
+        for field in self.BOOLEAN_FIELDS:
+            if field in drawer_defaults:
+                defaults[field] = drawer_defaults[field]
+
+        return defaults
+
+    def prepare_defaults_for_storage(self, form_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert drawer defaults form data to the format stored in the JSONField."""
+        storage_data = {}
+        for field, value in form_data.items():
+            if value is not None:
+                # Model instances are stored by ID
+                storage_data[field] = value.pk if hasattr(value, 'pk') else value
+        return storage_data
@@ -8,6 +8,9 @@ from ..models.door import DoorLineItem
 from ..models.drawer import DrawerLineItem
 from ..models.line_item import GenericLineItem
 from .door_defaults_service import DoorDefaultsService
+from .draft_order_service import DraftOrderService
+from .price_list_service import PriceListService
+from .pricing_engine import PricingEngine
 
 
 class OrderService:
@@ -16,24 +19,32 @@ class OrderService:
     Encapsulates the business logic for creating, updating, and processing orders.
     """
 
+    # Order column counting each session line item type
+    ITEM_COUNT_FIELDS = {
+        'door': 'door_count',
+        'drawer': 'drawer_count',
+        'other': 'generic_count',
+    }
+
     def __init__(self):
         self.door_defaults_service = DoorDefaultsService()
 
     @staticmethod
-    def create_from_session(form_data, session_data, is_quote=False):
+    def create_from_session(form_data, draft, is_quote=False):
         """
-        Create an order or quote from form data and session data.
+        Create an order or quote from form data and the session's draft order.
         Uses atomic transactions to ensure data integrity.
         
         Args:
             form_data (dict): The cleaned form data
-            session_data (dict): The session data containing order info and line items
+            draft (DraftOrder): The draft holding the customer and line items
             is_quote (bool): Whether to create a quote or an order
             
         Returns:
             tuple: (success, order, error_message)
         """
-        # Validate the session data
+        # Read the draft in the shape of the old session data and validate it
+        session_data = DraftOrderService.order_data(draft)
         is_valid, error = OrderService._validate_session_data(form_data, session_data)
         if not is_valid:
             return False, None, error
@@ -41,14 +52,14 @@ class OrderService:
         try:
             # Use atomic transaction to ensure all-or-nothing database operations
             with transaction.atomic():
-                # Create the order/quote base object
-                order_instance = OrderService._create_order_base(form_data, is_quote)
-                # Process all line items
-                items_count = OrderService._process_line_items(order_instance, session_data.get('items', []))
+                # Price all line items in one pass
+                priced_items = PricingEngine().price_batch(session_data.get('items', []))
 
-                # Calculate and save totals
-                order_instance.calculate_totals()
-                order_instance.save()
+                # Create the order/quote base object with its totals
+                order_instance = OrderService._create_order_base(form_data, is_quote, priced_items)
+
+                # Process all line items
+                items_count = OrderService._process_line_items(order_instance, priced_items)
 
                 return True, order_instance, None
                 
@@ -73,7 +84,7 @@ class OrderService:
         """
         # Check if session data exists
         if not session_data:
-            return False, "No session data found. Please start over."
+            return False, "No draft order found. Please start over."
             
         # Check if there are items in the session
         if 'items' not in session_data or not session_data['items']:
@@ -95,18 +106,20 @@ class OrderService:
         return True, None
 
     @staticmethod
-    def _create_order_base(form_data, is_quote=False):
+    def _create_order_base(form_data, is_quote=False, priced_items=()):
         """
         Create the base order object.
+        The stored item total, line counts and order totals are computed from
+        the priced line items, so the order is written with a single INSERT.
         
         Args:
             form_data (dict): Cleaned form data
             is_quote (bool): Whether this is a quote
+            priced_items (list): PricedItem entries for the session line items
             
         Returns:
             Order: The created order instance
         """
-        # Create and save the order/quote
         order = Order(
             customer=form_data['customer'],
             is_quote=is_quote,
@@ -115,160 +128,175 @@ class OrderService:
             order_date=form_data['order_date'],
             notes=form_data.get('notes', '')
         )
+
+        # Fill in the line item aggregates that LineItem.save() would maintain
+        for item, _, total_price in priced_items:
+            count_field = OrderService.ITEM_COUNT_FIELDS.get(item.get('type'))
+            if count_field:
+                order.item_total += total_price
+                setattr(order, count_field, getattr(order, count_field) + 1)
+
+        # Calculate and save totals
+        order.calculate_totals(item_total=order.item_total)
         order.save()
         return order
 
     @staticmethod
-    def _process_line_items(order, line_items):
+    def _process_line_items(order, priced_items):
         """
         Process all line items and add them to the order.
+        Items are inserted with one bulk_create per line item type. Doors and
+        drawers without a custom price reference the current price list,
+        which is what bulk_create skips LineItem.save() for.
         
         Args:
             order (Order): The order instance
-            line_items (list): List of line item dictionaries from session
+            priced_items (list): PricedItem entries wrapping the line item dictionaries from session
             
         Returns:
             int: Number of line items processed
         """
+        # Resolve the customer's door defaults once for the whole order
+        door_defaults = OrderService._get_door_line_item_defaults(order.customer)
+
+        # The items were just priced from the current catalog
+        price_list_id = None
+        if any(item.get('type') in ('door', 'drawer') and not item.get('custom_price') for item, _, _ in priced_items):
+            price_list_id = PriceListService.current_id()
+
+        new_items = {DoorLineItem: [], DrawerLineItem: [], GenericLineItem: []}
         items_count = 0
-        for item in line_items:
+        for item, unit_price, _ in priced_items:
             items_count += 1
             item_type = item.get('type')
             
             if item_type == 'door':
-                OrderService._create_door_line_item(order, item)
+                new_items[DoorLineItem].append(
+                    OrderService._build_door_line_item(order, item, unit_price, door_defaults, price_list_id)
+                )
             elif item_type == 'drawer':
-                OrderService._create_drawer_line_item(order, item)
+                new_items[DrawerLineItem].append(
+                    OrderService._build_drawer_line_item(order, item, unit_price, price_list_id)
+                )
             elif item_type == 'other':
-                OrderService._create_generic_line_item(order, item)
+                new_items[GenericLineItem].append(
+                    OrderService._build_generic_line_item(order, item)
+                )
+
+        # Insert each type in a single statement; the order totals were already set
+        for model, objs in new_items.items():
+            if objs:
+                model.objects.bulk_create(objs)
 
         return items_count
 
     @staticmethod
-    def _create_door_line_item(order, item_data):
+    def _get_door_line_item_defaults(customer):
         """
-        Create a door line item from session data.
+        Resolve the customer-specific and global door defaults used for new door items.
         
         Args:
-            order (Order): The order to attach the item to
-            item_data (dict): The line item data from session
+            customer (Customer): The order's customer, or None
             
         Returns:
-            DoorLineItem: The created door line item
+            dict: Global rail sizes, interior rail size and sanding options
         """
-        # Get door components
-        width = Decimal(item_data['width'])
-        height = Decimal(item_data['height'])
-        quantity = int(item_data['quantity'])
-        custom_price = item_data.get('custom_price', False)
-        
-        # Only use the stored price_per_unit if custom_price is True
-        price_per_unit = Decimal(item_data['price_per_unit']) if custom_price else Decimal('0.00')
-        
-        # Get rail values from session if available, otherwise use defaults
         door_defaults_service = DoorDefaultsService()
+        defaults = dict(door_defaults_service.global_defaults)
+
+        # Get customer-specific interior rail size and sanding options
+        customer_defaults = door_defaults_service.get_defaults(customer) if customer else {}
+        defaults['interior_rail_size'] = customer_defaults.get('interior_rail_size', defaults['interior_rail_size'])
+        defaults['sand_edge'] = customer_defaults.get('sand_edge', False)
+        defaults['sand_cross_grain'] = customer_defaults.get('sand_cross_grain', False)
+        return defaults
+
+    @staticmethod
+    def _build_door_line_item(order, item_data, unit_price, door_defaults, price_list_id=None):
+        """
+        Build an unsaved door line item from session data.
         
-        # Get customer-specific interior rail size or global default
-        interior_rail_size = door_defaults_service.get_rail_size(
-            order.customer, 
-            'interior_rail_size'
-        ) if order.customer else door_defaults_service.global_defaults['interior_rail_size']
-        
-        # Get customer defaults for sanding options
-        customer_defaults = door_defaults_service.get_defaults(order.customer) if order.customer else {}
-        sand_edge = customer_defaults.get('sand_edge', False)
-        sand_cross_grain = customer_defaults.get('sand_cross_grain', False)
-        
-        # Create door line item
-        door_item = DoorLineItem(
+        Args:
+            order (Order): The order to attach the item to
+            item_data (dict): The line item data from session
+            unit_price (Decimal): Unit price from the pricing engine
+            door_defaults (dict): Defaults from _get_door_line_item_defaults()
+            price_list_id (int): Price list the unit price came from
+            
+        Returns:
+            DoorLineItem: The door line item, ready for bulk_create
+        """
+        return DoorLineItem(
             order=order,
+            type='door',
             wood_stock_id=item_data['wood_stock']['id'],
             edge_profile_id=item_data['edge_profile']['id'],
             panel_rise_id=item_data['panel_rise']['id'],
             style_id=item_data['style']['id'],
-            width=width,
-            height=height,
-            quantity=quantity,
-            price_per_unit=price_per_unit,
-            rail_top=Decimal(item_data.get('rail_top', door_defaults_service.global_defaults['rail_top'])),
-            rail_bottom=Decimal(item_data.get('rail_bottom', door_defaults_service.global_defaults['rail_bottom'])),
-            rail_left=Decimal(item_data.get('rail_left', door_defaults_service.global_defaults['rail_left'])),
-            rail_right=Decimal(item_data.get('rail_right', door_defaults_service.global_defaults['rail_right'])),
-            interior_rail_size=interior_rail_size,
-            custom_price=custom_price,
-            sand_edge=sand_edge,
-            sand_cross_grain=sand_cross_grain
+            width=Decimal(item_data['width']),
+            height=Decimal(item_data['height']),
+            quantity=int(item_data['quantity']),
+            price_per_unit=unit_price,
+            rail_top=Decimal(item_data.get('rail_top', door_defaults['rail_top'])),
+            rail_bottom=Decimal(item_data.get('rail_bottom', door_defaults['rail_bottom'])),
+            rail_left=Decimal(item_data.get('rail_left', door_defaults['rail_left'])),
+            rail_right=Decimal(item_data.get('rail_right', door_defaults['rail_right'])),
+            interior_rail_size=door_defaults['interior_rail_size'],
+            custom_price=item_data.get('custom_price', False),
+            price_list_id=None if item_data.get('custom_price') else price_list_id,
+            sand_edge=door_defaults['sand_edge'],
+            sand_cross_grain=door_defaults['sand_cross_grain']
         )
-        door_item.save()
-        return door_item
 
     @staticmethod
-    def _create_drawer_line_item(order, item_data):
+    def _build_drawer_line_item(order, item_data, unit_price, price_list_id=None):
         """
-        Create a drawer line item from session data.
+        Build an unsaved drawer line item from session data.
         
         Args:
             order (Order): The order to attach the item to
             item_data (dict): The line item data from session
+            unit_price (Decimal): Unit price from the pricing engine
+            price_list_id (int): Price list the unit price came from
             
         Returns:
-            DrawerLineItem: The created drawer line item
+            DrawerLineItem: The drawer line item, ready for bulk_create
         """
-        # Get drawer components
-        width = Decimal(item_data['width'])
-        height = Decimal(item_data['height'])
-        depth = Decimal(item_data['depth'])
-        quantity = int(item_data['quantity'])
-        custom_price = item_data.get('custom_price', False)
-        
-        # Only use the stored price_per_unit if custom_price is True
-        price_per_unit = Decimal(item_data['price_per_unit']) if custom_price else Decimal('0.00')
-        
-        # Create drawer line item
-        drawer_item = DrawerLineItem(
+        return DrawerLineItem(
             order=order,
+            type='drawer',
             wood_stock_id=item_data['wood_stock']['id'],
             edge_type_id=item_data['edge_type']['id'],
             bottom_id=item_data['bottom']['id'],
-            width=width,
-            height=height,
-            depth=depth,
-            quantity=quantity,
-            price_per_unit=price_per_unit,
+            width=Decimal(item_data['width']),
+            height=Decimal(item_data['height']),
+            depth=Decimal(item_data['depth']),
+            quantity=int(item_data['quantity']),
+            price_per_unit=unit_price,
             undermount=item_data.get('undermount', False),
             finishing=item_data.get('finishing', False),
-            custom_price=custom_price
+            custom_price=item_data.get('custom_price', False),
+            price_list_id=None if item_data.get('custom_price') else price_list_id
         )
-        drawer_item.save()
-        return drawer_item
 
     @staticmethod
-    def _create_generic_line_item(order, item_data):
+    def _build_generic_line_item(order, item_data):
         """
-        Create a generic line item from session data.
+        Build an unsaved generic line item from session data.
         
         Args:
             order (Order): The order to attach the item to
             item_data (dict): The line item data from session
             
         Returns:
-            GenericLineItem: The created generic line item
+            GenericLineItem: The generic line item, ready for bulk_create
         """
-        # Get item details
-        name = item_data.get('name')
-        quantity = int(item_data.get('quantity'))
-        custom_price = item_data.get('custom_price', False)
-        
         # Price per unit is always required for generic items
-        price_per_unit = Decimal(item_data.get('price_per_unit'))
-        
-        # Create generic line item
-        generic_item = GenericLineItem(
+        return GenericLineItem(
             order=order,
-            name=name,
-            quantity=quantity,
-            price_per_unit=price_per_unit,
-            custom_price=custom_price
+            type='other',
+            name=item_data.get('name'),
+            quantity=int(item_data.get('quantity')),
+            price_per_unit=Decimal(item_data.get('price_per_unit')),
+            custom_price=item_data.get('custom_price', False)
         )
-        generic_item.save()
-        return generic_item 
\ No newline at end of file
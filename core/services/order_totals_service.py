@@ -0,0 +1,67 @@
+"""
+Service for rebuilding the stored line item aggregates on orders.
+"""
+from decimal import Decimal
+
+from django.db.models import (
+    Count, DecimalField, ExpressionWrapper, F, IntegerField, OuterRef, Subquery, Sum, Value,
+)
+from django.db.models.functions import Coalesce
+
+from ..models import Order
+from ..models.door import DoorLineItem
+from ..models.drawer import DrawerLineItem
+from ..models.line_item import GenericLineItem
+
+
+class OrderTotalsService:
+    """
+    Recomputes Order.item_total and the per-type line counts from the line
+    item tables.
+
+    LineItem.save() and delete() keep these columns current one item at a
+    time; this service is the fallback for bulk operations and repairs.
+    """
+
+    LINE_ITEM_MODELS = (DoorLineItem, DrawerLineItem, GenericLineItem)
+
+    @staticmethod
+    def _aggregate(model, expression, output_field):
+        """Correlated subquery aggregating ``expression`` over one order's items of ``model``."""
+        subquery = (
+            model.objects.filter(order=OuterRef('pk'))
+            .order_by()
+            .values('order')
+            .annotate(value=expression)
+            .values('value')
+        )
+        return Coalesce(Subquery(subquery, output_field=output_field), Value(0), output_field=output_field)
+
+    @classmethod
+    def rebuild(cls, queryset=None):
+        """
+        Rebuild the aggregates of every order in ``queryset`` with one UPDATE.
+        
+        Args:
+            queryset: Orders to rebuild, all orders by default
+            
+        Returns:
+            int: Number of orders updated
+        """
+        if queryset is None:
+            queryset = Order.objects.all()
+
+        money = DecimalField(max_digits=10, decimal_places=2)
+        extended_price = ExpressionWrapper(F('price_per_unit') * F('quantity'), output_field=money)
+
+        item_total = Value(Decimal('0.00'), output_field=money)
+        for model in cls.LINE_ITEM_MODELS:
+            item_total = item_total + cls._aggregate(model, Sum(extended_price), money)
+
+        return queryset.order_by().update(
+            item_total=item_total,
+            **{
+                model.order_count_field: cls._aggregate(model, Count('pk'), IntegerField())
+                for model in cls.LINE_ITEM_MODELS
+            }
+        )
@@ -0,0 +1,158 @@
+"""
+Service for caching rendered order and quote PDFs on disk.
+
+A PDF only changes when the order, its customer, its line items, the catalog
+prices or the PDF template change, so each file is stored under a hash of
+exactly those inputs. A changed input gives a new key; the old file is simply
+never asked for again and is eventually evicted.
+"""
+import hashlib
+import logging
+import os
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.db.models import Max, OuterRef, Subquery
+from django.template.loader import get_template
+
+from .catalog_cache import get_catalog
+from .settings_cache import get_drawer_settings
+from ..models import Order
+from ..models.door import DoorLineItem
+from ..models.drawer import DrawerLineItem
+from ..models.line_item import GenericLineItem
+
+logger = logging.getLogger(__name__)
+
+LINE_ITEM_MODELS = (DoorLineItem, DrawerLineItem, GenericLineItem)
+
+
+class PdfCacheService:
+    """
+    Content-addressed store of rendered PDFs in settings.PDF_CACHE_DIR.
+
+    Files are written by the PDF workers straight into the cache. Each hit
+    touches the file's mtime, and evict() removes the least recently used
+    files once the directory grows past settings.PDF_CACHE_MAX_BYTES. Files
+    used within settings.PDF_CACHE_GRACE_SECONDS are kept, so a file is not
+    deleted between a hit and the response opening it.
+    """
+
+    @staticmethod
+    def line_item_versions(order: Order) -> tuple:
+        """
+        Return the latest ``updated_at`` of each line item type of ``order``,
+        read in a single query. Together with the stored item counts this
+        changes whenever an item is added, edited or deleted.
+        """
+        latest = {
+            f'{model._meta.model_name}_updated': Subquery(
+                model.objects.filter(order=OuterRef('pk'))
+                .order_by()
+                .values('order')
+                .annotate(latest=Max('updated_at'))
+                .values('latest')
+            )
+            for model in LINE_ITEM_MODELS
+        }
+        versions = Order.objects.filter(pk=order.pk).annotate(**latest).values_list(*latest).first()
+        return tuple(versions or ()) + (order.door_count, order.drawer_count, order.generic_count)
+
+    @staticmethod
+    def line_item_versions_from(order: Order, door_items, drawer_items, generic_items) -> tuple:
+        """Same as line_item_versions(), computed from line items that are already loaded."""
+        latest = tuple(
+            max((item.updated_at for item in items), default=None)
+            for items in (door_items, drawer_items, generic_items)
+        )
+        return latest + (order.door_count, order.drawer_count, order.generic_count)
+
+    @classmethod
+    def key(cls, order: Order, template_name: str, versions: Optional[tuple] = None) -> str:
+        """
+        Build the cache key of ``order`` rendered with ``template_name``.
+
+        Args:
+            order: The order or quote
+            template_name: The PDF template
+            versions: Line item versions if already known; queried otherwise
+
+        Returns:
+            str: Hex digest naming the cached file
+        """
+        template_path = get_template(template_name).origin.name
+        parts = (
+            template_name,
+            os.path.getmtime(template_path),
+            order.pk,
+            order.updated_at.isoformat(),
+            order.customer.updated_at.isoformat(),
+            versions if versions is not None else cls.line_item_versions(order),
+            get_catalog().digest,
+            get_drawer_settings(),
+        )
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    @classmethod
+    def path_for(cls, order: Order, template_name: str, versions: Optional[tuple] = None) -> str:
+        """Return the path the PDF of ``order`` is cached under, whether or not it exists yet."""
+        return os.path.join(settings.PDF_CACHE_DIR, f'{cls.key(order, template_name, versions)}.pdf')
+
+    @staticmethod
+    def get(path: str) -> Optional[str]:
+        """Return ``path`` if it is cached, marking it as recently used; otherwise None."""
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    @staticmethod
+    def evict(max_bytes: Optional[int] = None) -> int:
+        """
+        Delete the least recently used PDFs until the cache fits in ``max_bytes``,
+        skipping any used within settings.PDF_CACHE_GRACE_SECONDS.
+
+        Args:
+            max_bytes: Size limit; defaults to settings.PDF_CACHE_MAX_BYTES
+
+        Returns:
+            int: Number of files deleted
+        """
+        if max_bytes is None:
+            max_bytes = settings.PDF_CACHE_MAX_BYTES
+
+        try:
+            entries = [entry for entry in os.scandir(settings.PDF_CACHE_DIR)
+                       if entry.is_file() and entry.name.endswith('.pdf')]
+        except FileNotFoundError:
+            return 0
+
+        files = []
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in files)
+        recent = time.time() - settings.PDF_CACHE_GRACE_SECONDS
+        removed = 0
+        for mtime, size, path in sorted(files):
+            if total <= max_bytes or mtime >= recent:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # e.g. still open in a FileResponse on Windows; try the next one
+                continue
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info("Evicted %d cached PDF(s)", removed)
+        return removed
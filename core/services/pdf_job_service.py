@@ -0,0 +1,216 @@
+"""
+Service for rendering PDFs in background worker processes.
+
+Rendering HTML with pisa is CPU bound and holds the GIL for seconds on large
+orders. Web threads only render the HTML template and hand it to a process
+pool, then return a job id the browser polls until the file is ready.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.template.loader import render_to_string
+
+from .pdf_renderer import render_pdf
+
+logger = logging.getLogger(__name__)
+
+
+class PdfJob:
+    """A PDF being rendered in the worker pool."""
+
+    def __init__(self, id: str, filename: str, path: str, future: Any, owns_file: bool = True,
+                 content_type: str = 'application/pdf'):
+        self.id = id
+        self.filename = filename
+        self.path = path
+        self.future = future
+        self.owns_file = owns_file
+        self.content_type = content_type
+        self.created_at = time.monotonic()
+        # (finished, total) for jobs made of several documents
+        self.progress = None
+
+    @property
+    def status(self) -> str:
+        """One of 'pending', 'running', 'done' or 'failed'."""
+        if self.future.done():
+            return 'failed' if self.future.exception() is not None else 'done'
+        return 'running' if self.future.running() else 'pending'
+
+    @property
+    def is_finished(self) -> bool:
+        return self.future.done()
+
+    @property
+    def error(self) -> Optional[str]:
+        if self.future.done() and self.future.exception() is not None:
+            return str(self.future.exception())
+        return None
+
+
+class PdfJobService:
+    """
+    Keeps the process pool and the table of PDF jobs for this web process.
+
+    Workers are started with the 'spawn' method so they never inherit the
+    server's threads or database connections; app.py calls
+    multiprocessing.freeze_support() so this also works in the frozen build.
+    Finished jobs are forgotten after settings.PDF_JOB_TTL seconds, and their
+    files deleted unless the caller chose where to write them.
+    """
+
+    _executor = None
+    _task_executor = None
+    _jobs: Dict[str, PdfJob] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        """Return the shared process pool, starting it on first use."""
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=settings.PDF_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+            return cls._executor
+
+    @classmethod
+    def _discard_executor(cls, executor: ProcessPoolExecutor) -> None:
+        """Shut down a broken pool so the next _get_executor() starts a fresh one."""
+        with cls._lock:
+            if cls._executor is executor:
+                cls._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _submit_render(cls, html_string: str, path: str) -> Future:
+        """
+        Queue ``render_pdf`` on the process pool. A pool broken by a dead worker,
+        or shut down by another thread between lookup and submit, is replaced
+        and the submit retried once; if that fails too, the returned future
+        holds the error so the job reports 'failed'.
+        """
+        for _ in range(2):
+            executor = cls._get_executor()
+            try:
+                return executor.submit(render_pdf, html_string, path)
+            except (BrokenProcessPool, RuntimeError) as exc:
+                # RuntimeError: 'cannot schedule new futures after shutdown'
+                logger.warning("PDF worker pool is unusable, starting a new one: %s", exc)
+                cls._discard_executor(executor)
+                error = exc
+
+        future = Future()
+        future.set_exception(error)
+        return future
+
+    @classmethod
+    def submit(cls, template_name: str, context: Dict[str, Any], filename: str,
+               path: Optional[str] = None) -> PdfJob:
+        """
+        Render ``template_name`` to HTML now and queue its conversion to PDF.
+
+        Args:
+            template_name: The PDF template to render
+            context: Template context
+            filename: File name offered to the browser on download
+            path: Where to write the PDF; defaults to a temporary file in
+                  PDF_JOB_DIR that is deleted when the job expires
+
+        Returns:
+            PdfJob: The queued job, or the unfinished job already writing ``path``
+        """
+        cls._purge_expired()
+
+        if path is not None:
+            with cls._lock:
+                for job in cls._jobs.values():
+                    if job.path == path and not job.is_finished:
+                        return job
+
+        html_string = render_to_string(template_name, context)
+
+        job_id = uuid.uuid4().hex
+        owns_file = path is None
+        if owns_file:
+            path = os.path.join(settings.PDF_JOB_DIR, f'{job_id}.pdf')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        future = cls._submit_render(html_string, path)
+        job = PdfJob(id=job_id, filename=filename, path=path, future=future, owns_file=owns_file)
+        future.add_done_callback(lambda f: cls._log_failure(job))
+
+        with cls._lock:
+            cls._jobs[job_id] = job
+        return job
+
+    @classmethod
+    def submit_task(cls, task: Callable[[PdfJob], Any], filename: str,
+                    content_type: str = 'application/pdf') -> PdfJob:
+        """
+        Run ``task(job)`` on a background thread and track it like a PDF job.
+
+        Used for documents assembled from other jobs, such as batch prints.
+        The task writes its result to ``job.path`` and may update
+        ``job.progress`` as it goes. It must not touch the database.
+
+        Args:
+            task: Callable receiving the new job
+            filename: File name offered to the browser on download
+            content_type: Content type of the finished file
+
+        Returns:
+            PdfJob: The running job
+        """
+        cls._purge_expired()
+
+        job_id = uuid.uuid4().hex
+        extension = os.path.splitext(filename)[1]
+        path = os.path.join(settings.PDF_JOB_DIR, f'{job_id}{extension}')
+        os.makedirs(settings.PDF_JOB_DIR, exist_ok=True)
+
+        job = PdfJob(id=job_id, filename=filename, path=path, future=None, content_type=content_type)
+        with cls._lock:
+            if cls._task_executor is None:
+                cls._task_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pdf-task')
+            job.future = cls._task_executor.submit(task, job)
+            cls._jobs[job_id] = job
+        job.future.add_done_callback(lambda f: cls._log_failure(job))
+        return job
+
+    @classmethod
+    def get(cls, job_id: str) -> Optional[PdfJob]:
+        """Return the job with ``job_id``, or None if it is unknown or expired."""
+        with cls._lock:
+            return cls._jobs.get(job_id)
+
+    @staticmethod
+    def _log_failure(job: PdfJob) -> None:
+        if job.error:
+            logger.error("PDF job %s (%s) failed: %s", job.id, job.filename, job.error)
+
+    @classmethod
+    def _purge_expired(cls) -> None:
+        """Forget finished jobs older than PDF_JOB_TTL and delete the files they own."""
+        cutoff = time.monotonic() - settings.PDF_JOB_TTL
+        with cls._lock:
+            expired = [job for job in cls._jobs.values() if job.is_finished and job.created_at < cutoff]
+            for job in expired:
+                del cls._jobs[job.id]
+
+        for job in expired:
+            if not job.owns_file:
+                continue
+            try:
+                os.remove(job.path)
+            except FileNotFoundError:
+                pass
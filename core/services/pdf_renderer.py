@@ -0,0 +1,32 @@
+"""
+HTML to PDF conversion that runs inside the PDF worker processes.
+
+This module is imported by freshly spawned worker processes, so it must not
+import Django models or anything else that needs a configured app registry.
+"""
+import io
+import os
+
+from xhtml2pdf import pisa
+
+
+def render_pdf(html_string: str, output_path: str) -> str:
+    """
+    Convert an HTML document to PDF and write it to ``output_path``.
+
+    The file is written under a temporary name and moved into place, so a
+    path that exists is always a complete PDF.
+
+    Returns:
+        str: output_path
+    """
+    result = io.BytesIO()
+    pdf = pisa.pisaDocument(io.BytesIO(html_string.encode("UTF-8")), result)
+    if pdf.err:
+        raise RuntimeError(f"PDF conversion failed with {pdf.err} error(s)")
+
+    temp_path = f"{output_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(result.getvalue())
+    os.replace(temp_path, output_path)
+    return output_path
@@ -0,0 +1,70 @@
+"""
+Service for storing the current catalog prices as immutable price lists.
+"""
+import hashlib
+import json
+from typing import Any, Dict, NamedTuple, Optional
+
+from .catalog_cache import Catalog, get_catalog
+from .settings_cache import DrawerSettings, get_drawer_settings
+from ..models.price_list import PriceList
+
+
+class PriceListPrices(NamedTuple):
+    """The prices of a catalog snapshot in PriceList.prices form, with their digest."""
+    digest: str
+    prices: Dict[str, Any]
+
+
+def build_prices(catalog: Catalog, drawer_settings: Optional[DrawerSettings]) -> PriceListPrices:
+    """Collect every price the pricing engine reads from a catalog snapshot and the drawer settings."""
+    matrix = catalog.door_prices
+    prices = {
+        'door': {
+            str(style.id): {
+                str(wood_stock.id): str(matrix.price(style.id, wood_stock.id))
+                for wood_stock in matrix.wood_stocks
+            }
+            for style in matrix.styles
+        },
+        'drawer_wood_stock': {str(row.id): str(row.price) for row in catalog.all('drawer_wood_stock')},
+        'drawer_bottom_size': {str(row.id): str(row.price) for row in catalog.all('drawer_bottom_size')},
+        'undermount_charge': str(drawer_settings.undermount_charge) if drawer_settings else None,
+        'finish_charge': str(drawer_settings.finish_charge) if drawer_settings else None,
+    }
+    digest = hashlib.sha256(json.dumps(prices, sort_keys=True).encode()).hexdigest()
+    return PriceListPrices(digest, prices)
+
+
+class PriceListService:
+    """
+    Finds or stores the price list of the current catalog.
+
+    The prices are collected once per catalog snapshot and drawer settings;
+    storing them costs one lookup by digest, plus an INSERT the first time
+    after a price change.
+
+    Usage:
+        line_item.price_list_id = PriceListService.current_id()
+    """
+
+    @staticmethod
+    def current_prices() -> PriceListPrices:
+        """Return the prices of the current catalog snapshot and drawer settings."""
+        drawer_settings = get_drawer_settings()
+        return get_catalog().derived(
+            ('price_list', drawer_settings),
+            lambda catalog: build_prices(catalog, drawer_settings),
+        )
+
+    @classmethod
+    def current(cls) -> PriceList:
+        """Return the stored price list of the current prices, creating it if needed."""
+        current = cls.current_prices()
+        price_list, _ = PriceList.objects.get_or_create(digest=current.digest, defaults={'prices': current.prices})
+        return price_list
+
+    @classmethod
+    def current_id(cls) -> int:
+        """Return the primary key of the current price list."""
+        return cls.current().pk
@@ -0,0 +1,83 @@
+"""
+Precomputed door unit prices.
+
+A door's unit price depends only on its style and wood stock, so every
+combination is priced once per catalog snapshot and looked up afterwards.
+The matrix is built lazily by Catalog.door_prices and thrown away with the
+snapshot whenever a catalog row changes.
+"""
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+def door_unit_price(style: Any, wood_stock: Any, panel_type: Any) -> Decimal:
+    """
+    Price one door from its style, wood stock and the style's panel type.
+
+    Args:
+        style: Style row or record
+        wood_stock: WoodStock row or record
+        panel_type: PanelType row or record of the style
+
+    Returns:
+        Decimal: The unit price
+    """
+    # Determine woodstock price based on panel type
+    if panel_type.use_flat_panel_price:
+        woodstock_price = wood_stock.flat_panel_price
+    else:
+        woodstock_price = wood_stock.raised_panel_price
+
+    # Base price from style plus twice the woodstock price
+    return style.price + (woodstock_price * 2)
+
+
+class DoorPriceMatrix:
+    """
+    Dense style x wood stock table of door unit prices.
+
+    Usage:
+        matrix = get_catalog().door_prices
+        matrix.price(style_id, wood_stock_id)   # Decimal, or None if unknown
+    """
+
+    def __init__(self, styles: List[Any], wood_stocks: List[Any], prices: List[List[Decimal]]):
+        self.styles = styles
+        self.wood_stocks = wood_stocks
+        self._prices = prices
+        self._style_index = {style.id: i for i, style in enumerate(styles)}
+        self._wood_stock_index = {wood_stock.id: j for j, wood_stock in enumerate(wood_stocks)}
+
+    @classmethod
+    def build(cls, catalog) -> 'DoorPriceMatrix':
+        """Price every style and wood stock combination in a catalog snapshot."""
+        styles = list(catalog.all('style'))
+        wood_stocks = list(catalog.all('wood_stock'))
+        prices = []
+        for style in styles:
+            panel_type = catalog.get('panel_type', style.panel_type_id)
+            prices.append([door_unit_price(style, wood_stock, panel_type) for wood_stock in wood_stocks])
+        return cls(styles, wood_stocks, prices)
+
+    def price(self, style_id: Any, wood_stock_id: Any) -> Optional[Decimal]:
+        """Return the unit price of a door, or None if either row is not in the matrix."""
+        try:
+            i = self._style_index[int(style_id)]
+            j = self._wood_stock_index[int(wood_stock_id)]
+        except (KeyError, TypeError, ValueError):
+            return None
+        return self._prices[i][j]
+
+    def as_dict(self) -> Dict[Tuple[int, int], Decimal]:
+        """Return every price keyed by (style id, wood stock id)."""
+        return {
+            (style.id, wood_stock.id): self._prices[i][j]
+            for i, style in enumerate(self.styles)
+            for j, wood_stock in enumerate(self.wood_stocks)
+        }
+
+    def csv_rows(self) -> Iterator[tuple]:
+        """Yield the table as CSV rows: a header of wood stocks, then one row per style."""
+        yield ('Style',) + tuple(wood_stock.name for wood_stock in self.wood_stocks)
+        for style, prices in zip(self.styles, self._prices):
+            yield (style.name,) + tuple(prices)
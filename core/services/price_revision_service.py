@@ -0,0 +1,176 @@
+"""
+Service for revising catalog prices by a percentage or a fixed amount with
+set-based UPDATE statements.
+"""
+from decimal import Decimal
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from django.core.validators import MinValueValidator
+from django.db import transaction
+from django.db.models import DecimalField, F, Value
+from django.db.models.functions import Round
+from django.utils import timezone
+
+from .catalog_cache import invalidate_catalog
+from ..models.door import Style, WoodStock
+from ..models.drawer import DrawerBottomSize, DrawerWoodStock
+
+CENT = Decimal('0.01')
+
+
+class RevisablePrice(NamedTuple):
+    """A price column a revision can change."""
+    model: type
+    field: str
+    label: str
+
+    @property
+    def model_field(self):
+        return self.model._meta.get_field(self.field)
+
+    @property
+    def minimum(self) -> Decimal:
+        """Lowest price the column's validators accept, or zero."""
+        for validator in self.model_field.validators:
+            if isinstance(validator, MinValueValidator):
+                return Decimal(validator.limit_value)
+        return Decimal('0')
+
+    @property
+    def maximum(self) -> Decimal:
+        """Highest price that fits the column's max_digits."""
+        field = self.model_field
+        return Decimal(10) ** (field.max_digits - field.decimal_places) - CENT
+
+
+# Price columns by the key the view and the management command select them with
+REVISABLE_PRICES: Dict[str, RevisablePrice] = {
+    'wood_stock_raised': RevisablePrice(WoodStock, 'raised_panel_price', 'Wood stock raised panel price'),
+    'wood_stock_flat': RevisablePrice(WoodStock, 'flat_panel_price', 'Wood stock flat panel price'),
+    'style': RevisablePrice(Style, 'price', 'Door style price'),
+    'drawer_wood_stock': RevisablePrice(DrawerWoodStock, 'price', 'Drawer wood stock price'),
+    'drawer_bottom': RevisablePrice(DrawerBottomSize, 'price', 'Drawer bottom price'),
+}
+
+
+class PriceRevision(NamedTuple):
+    """
+    A price change and the rows it applies to.
+
+    Exactly one of percent and amount is set: percent=Decimal('3.5') raises the
+    prices by 3.5%, amount=Decimal('-1.25') lowers them by $1.25. The filters
+    are optional and combine: name_contains matches the row name case
+    insensitively, min_price and max_price bound the current price.
+    """
+    targets: Tuple[str, ...]
+    percent: Optional[Decimal] = None
+    amount: Optional[Decimal] = None
+    name_contains: str = ''
+    min_price: Optional[Decimal] = None
+    max_price: Optional[Decimal] = None
+
+
+class PriceChange(NamedTuple):
+    """One row's price before and after a revision."""
+    target: str
+    pk: int
+    name: str
+    old_price: Decimal
+    new_price: Decimal
+
+    @property
+    def label(self) -> str:
+        return REVISABLE_PRICES[self.target].label
+
+
+class PriceRevisionService:
+    """
+    Applies a PriceRevision as one ``UPDATE ... SET price = ROUND(price * factor, 2)``
+    per price column, instead of loading and saving every row.
+
+    Usage:
+        changes, errors = PriceRevisionService.preview(revision)
+        changes, errors = PriceRevisionService.apply(revision)
+    """
+
+    @staticmethod
+    def expression(price: RevisablePrice, revision: PriceRevision):
+        """Return the new price of a column as a database expression, rounded to cents."""
+        if revision.percent is not None:
+            factor = Decimal(1) + revision.percent / 100
+            value = F(price.field) * Value(factor)
+        else:
+            value = F(price.field) + Value(revision.amount)
+        return Round(value, 2, output_field=DecimalField(max_digits=price.model_field.max_digits, decimal_places=2))
+
+    @staticmethod
+    def queryset(price: RevisablePrice, revision: PriceRevision):
+        """Return the rows of a column the revision's filters select."""
+        queryset = price.model.objects.order_by()
+        if revision.name_contains:
+            queryset = queryset.filter(name__icontains=revision.name_contains)
+        if revision.min_price is not None:
+            queryset = queryset.filter(**{f'{price.field}__gte': revision.min_price})
+        if revision.max_price is not None:
+            queryset = queryset.filter(**{f'{price.field}__lte': revision.max_price})
+        return queryset
+
+    @classmethod
+    def preview(cls, revision: PriceRevision) -> Tuple[List[PriceChange], List[str]]:
+        """
+        Compute the revision without writing it; a dry run.
+
+        The new prices come from the same expression apply() writes, one
+        SELECT per price column.
+
+        Returns:
+            tuple: (changes, errors); a PriceChange for every selected row whose
+            price changes, and a message for every new price outside its
+            column's range
+        """
+        changes = []
+        errors = []
+        for target in revision.targets:
+            price = REVISABLE_PRICES[target]
+            rows = (
+                cls.queryset(price, revision)
+                .annotate(new_price=cls.expression(price, revision))
+                .values_list('pk', 'name', price.field, 'new_price')
+                .order_by('name')
+            )
+            for pk, name, old_price, new_price in rows:
+                new_price = new_price.quantize(CENT)
+                if new_price == old_price:
+                    continue
+                changes.append(PriceChange(target, pk, name, old_price, new_price))
+                if not price.minimum <= new_price <= price.maximum:
+                    errors.append(
+                        f"{price.label} of {name} would be {new_price}; "
+                        f"it must be between {price.minimum} and {price.maximum}"
+                    )
+        return changes, errors
+
+    @classmethod
+    def apply(cls, revision: PriceRevision) -> Tuple[List[PriceChange], List[str]]:
+        """
+        Write the revision with one UPDATE per price column, in one
+        transaction. Nothing is written if any new price is out of range.
+
+        Returns:
+            tuple: (changes, errors) as from preview(); the changes are written
+            only if errors is empty
+        """
+        with transaction.atomic():
+            changes, errors = cls.preview(revision)
+            if errors or not changes:
+                return changes, errors
+
+            now = timezone.now()
+            for target in revision.targets:
+                price = REVISABLE_PRICES[target]
+                cls.queryset(price, revision).update(**{price.field: cls.expression(price, revision), 'updated_at': now})
+
+            # update() sends no post_save, so drop the cached catalog and the price matrix
+            # built from it; in the transaction, so running servers see the new version too
+            invalidate_catalog()
+        return changes, []
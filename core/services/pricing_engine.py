@@ -0,0 +1,245 @@
+"""
+Service for pricing door, drawer and generic line items in batches.
+"""
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from .catalog_cache import CATALOG_MODELS, get_catalog
+from .price_matrix import door_unit_price
+from .settings_cache import get_drawer_settings
+from ..models.door import DoorLineItem
+from ..models.drawer import DrawerLineItem
+from ..models.line_item import GenericLineItem
+from ..models.price_list import PriceList
+
+# Catalog tables referenced by each line item type, as (item field, catalog key)
+ITEM_REFERENCES = {
+    'door': (('style', 'style'), ('wood_stock', 'wood_stock')),
+    'drawer': (('wood_stock', 'drawer_wood_stock'), ('bottom', 'drawer_bottom_size')),
+    'other': (),
+}
+
+MODEL_TYPES = {
+    DoorLineItem: 'door',
+    DrawerLineItem: 'drawer',
+    GenericLineItem: 'other',
+}
+
+
+class PricedItem(NamedTuple):
+    """A line item together with its unit and extended price."""
+    item: Any
+    unit_price: Decimal
+    total_price: Decimal
+
+
+class PricingEngine:
+    """
+    Prices any mix of line items against a single catalog snapshot.
+
+    Items may be saved or unsaved model instances, or the dictionaries kept in
+    the session while an order is being built. Saved items that reference a
+    price list are priced from that list, loaded with one query per batch, so
+    old orders never see later catalog changes. Everything else is priced
+    from the live catalog: door prices come straight from the catalog's
+    precomputed price matrix, and every other catalog row the batch refers to
+    is looked up in the in-memory catalog; rows the snapshot does not know
+    about yet are fetched with one query per table.
+    """
+
+    def __init__(self):
+        self.catalog = get_catalog()
+        self.drawer_settings = get_drawer_settings()
+        self._price_lists: Dict[int, PriceList] = {}
+
+    def price_batch(self, items: Iterable[Any]) -> List[PricedItem]:
+        """
+        Price every item and return a PricedItem for each, in input order.
+
+        Model instances also remember their unit price so that ``price``,
+        ``total_price`` and ``save()`` reuse it instead of pricing again.
+        """
+        items = list(items)
+        self._load_price_lists(items)
+        list_prices = {}
+        for index, item in enumerate(items):
+            if not self._get(item, 'custom_price', False):
+                list_price = self._list_price(item)
+                if list_price is not None:
+                    list_prices[index] = list_price
+        rows = self._resolve_references([item for index, item in enumerate(items) if index not in list_prices])
+
+        priced = []
+        for index, item in enumerate(items):
+            if self._get(item, 'custom_price', False) or self._item_type(item) == 'other':
+                unit_price = Decimal(str(self._get(item, 'price_per_unit')))
+            elif index in list_prices:
+                unit_price = list_prices[index]
+            else:
+                unit_price = self._calculate_unit_price(item, rows)
+
+            if not isinstance(item, dict):
+                item._priced_unit_price = unit_price
+                item._priced_from_list = index in list_prices
+
+            total_price = unit_price * int(self._get(item, 'quantity', 1))
+            priced.append(PricedItem(item, unit_price, total_price))
+        return priced
+
+    def unit_price(self, item: Any) -> Decimal:
+        """
+        Return the calculated unit price of one item, ignoring any custom price.
+        It comes from the item's price list if the list has it, otherwise from
+        the live catalog.
+        """
+        self._load_price_lists([item])
+        list_price = self._list_price(item)
+        if not isinstance(item, dict):
+            item._priced_from_list = list_price is not None
+        if list_price is not None:
+            return list_price
+
+        if self._item_type(item) == 'door':
+            unit_price = self._matrix_price(item)
+            if unit_price is not None:
+                return unit_price
+        return self._calculate_unit_price(item, self._resolve_references([item]))
+
+    @staticmethod
+    def total(priced_items: Iterable[PricedItem]) -> Decimal:
+        """Return the sum of the extended prices of a priced batch."""
+        return sum((priced.total_price for priced in priced_items), Decimal('0.00'))
+
+    def _calculate_unit_price(self, item: Any, rows: Dict[str, Dict[int, Any]]) -> Decimal:
+        """Calculate the unit price of a door or drawer from resolved catalog rows."""
+        item_type = self._item_type(item)
+
+        if item_type == 'door':
+            unit_price = self._matrix_price(item)
+            if unit_price is not None:
+                return unit_price
+
+            # Rows the snapshot does not know about yet are priced from the database rows
+            style = self._row(rows, 'style', self._ref(item, 'style'))
+            wood_stock = self._row(rows, 'wood_stock', self._ref(item, 'wood_stock'))
+            panel_type = self._row(rows, 'panel_type', style.panel_type_id)
+            return door_unit_price(style, wood_stock, panel_type)
+
+        if item_type == 'drawer':
+            wood_stock = self._row(rows, 'drawer_wood_stock', self._ref(item, 'wood_stock'))
+            bottom = self._row(rows, 'drawer_bottom_size', self._ref(item, 'bottom'))
+            base_price = wood_stock.price + bottom.price
+
+            if not self.drawer_settings:
+                return base_price
+
+            # Add charges for options if enabled
+            if self._get(item, 'undermount', False):
+                base_price += self.drawer_settings.undermount_charge
+            if self._get(item, 'finishing', False):
+                base_price += self.drawer_settings.finish_charge
+            return base_price
+
+        return Decimal(str(self._get(item, 'price_per_unit')))
+
+    def _load_price_lists(self, items: List[Any]) -> None:
+        """Load the price lists ``items`` reference that this engine has not loaded yet, in one query."""
+        missing = {
+            item.price_list_id for item in items
+            if not isinstance(item, dict) and getattr(item, 'price_list_id', None) is not None
+        } - set(self._price_lists)
+        if missing:
+            self._price_lists.update(PriceList.objects.in_bulk(missing))
+
+    def _list_price(self, item: Any) -> Optional[Decimal]:
+        """
+        Look up a saved door's or drawer's unit price in its price list; None
+        if the item has no price list or the list does not have its current
+        style, wood stock or bottom.
+        """
+        if isinstance(item, dict):
+            return None
+        price_list = self._price_lists.get(getattr(item, 'price_list_id', None))
+        if price_list is None:
+            return None
+
+        item_type = self._item_type(item)
+        if item_type == 'door':
+            return price_list.door_price(item.style_id, item.wood_stock_id)
+        if item_type == 'drawer':
+            return price_list.drawer_price(item.wood_stock_id, item.bottom_id, item.undermount, item.finishing)
+        return None
+
+    def _matrix_price(self, item: Any) -> Optional[Decimal]:
+        """Look up a door's unit price in the catalog's price matrix; None on a miss."""
+        return self.catalog.door_prices.price(self._ref(item, 'style'), self._ref(item, 'wood_stock'))
+
+    def _resolve_references(self, items: List[Any]) -> Dict[str, Dict[int, Any]]:
+        """
+        Collect every catalog row referenced by ``items``.
+
+        Rows come from the catalog snapshot when possible. Misses are loaded
+        with one in_bulk() query per table, followed by the panel types of any
+        styles that were loaded that way.
+        """
+        rows = {key: {} for key in CATALOG_MODELS}
+        missing = {key: set() for key in CATALOG_MODELS}
+
+        def collect(key, pk):
+            if pk is None or pk in rows[key]:
+                return
+            record = self.catalog.get(key, pk)
+            if record is None:
+                missing[key].add(pk)
+            else:
+                rows[key][record.id] = record
+
+        for item in items:
+            item_type = self._item_type(item)
+            # Doors in the price matrix need no rows
+            if item_type == 'door' and self._matrix_price(item) is not None:
+                continue
+            for field, key in ITEM_REFERENCES.get(item_type, ()):
+                collect(key, self._ref(item, field))
+
+        for key in list(CATALOG_MODELS):
+            if missing[key]:
+                rows[key].update(CATALOG_MODELS[key].objects.in_bulk(missing[key]))
+
+        for style in rows['style'].values():
+            collect('panel_type', style.panel_type_id)
+        if missing['panel_type']:
+            rows['panel_type'].update(CATALOG_MODELS['panel_type'].objects.in_bulk(missing['panel_type']))
+
+        return rows
+
+    @staticmethod
+    def _row(rows: Dict[str, Dict[int, Any]], key: str, pk: Any) -> Any:
+        """Return a resolved catalog row, raising DoesNotExist like a related lookup would."""
+        try:
+            return rows[key][int(pk)]
+        except (KeyError, TypeError, ValueError):
+            model = CATALOG_MODELS[key]
+            raise model.DoesNotExist(f"{model._meta.object_name} matching id {pk} does not exist.")
+
+    @staticmethod
+    def _item_type(item: Any) -> str:
+        """Return 'door', 'drawer' or 'other' for a model instance or session dict."""
+        if isinstance(item, dict):
+            return item.get('type', 'other')
+        return MODEL_TYPES.get(type(item), item.type)
+
+    @staticmethod
+    def _ref(item: Any, field: str) -> Any:
+        """Return the primary key an item refers to through ``field``."""
+        if isinstance(item, dict):
+            value = item.get(field)
+            return value.get('id') if isinstance(value, dict) else value
+        return getattr(item, f'{field}_id')
+
+    @staticmethod
+    def _get(item: Any, field: str, default: Any = None) -> Any:
+        """Read a plain field from a model instance or session dict."""
+        if isinstance(item, dict):
+            return item.get(field, default)
+        return getattr(item, field, default)
@@ -0,0 +1,87 @@
+"""
+Cached, typed accessors for the singleton settings models.
+
+RailDefaults, DefaultDrawerSettings and MiscellaneousDoorSettings each hold a
+single row that is read on almost every request but only changes when an
+operator saves the settings page. The rows are kept in memory as immutable
+records and are reloaded after a save or delete (see core.signals), including
+one made by another process.
+"""
+from decimal import Decimal
+from typing import NamedTuple, Optional
+
+from .cache import VersionedCache
+from ..models.door import RailDefaults, MiscellaneousDoorSettings
+from ..models.drawer import DefaultDrawerSettings
+
+
+class RailDefaultsSettings(NamedTuple):
+    """Global default rail sizes for doors, in inches."""
+    top: Decimal
+    bottom: Decimal
+    left: Decimal
+    right: Decimal
+    interior_rail_size: Decimal
+
+
+class DrawerSettings(NamedTuple):
+    """Global drawer surcharges, option charges and cutting adjustments."""
+    surcharge_width: Decimal
+    surcharge_depth: Decimal
+    surcharge_percent: Decimal
+    finish_charge: Decimal
+    undermount_charge: Decimal
+    ends_cutting_adjustment: Decimal
+    sides_cutting_adjustment: Decimal
+    plywood_size_adjustment: Decimal
+
+
+class MiscDoorSettings(NamedTuple):
+    """Global door sheet gluing allowances and drawer panel types."""
+    extra_height: Decimal
+    extra_width: Decimal
+    glue_min_width: Decimal
+    rail_extra: Decimal
+    drawer_front_id: int
+    drawer_slab_id: int
+
+
+SETTINGS_RECORDS = {
+    RailDefaults: RailDefaultsSettings,
+    DefaultDrawerSettings: DrawerSettings,
+    MiscellaneousDoorSettings: MiscDoorSettings,
+}
+
+
+def _settings_loader(model, record_type):
+    """Build a loader that reads the first row of ``model`` into ``record_type``."""
+    def load(version):
+        values = model.objects.order_by('pk').values_list(*record_type._fields).first()
+        return record_type(*values) if values else None
+    return load
+
+
+_settings_caches = {
+    model: VersionedCache(_settings_loader(model, record_type), shared_name=model.__name__)
+    for model, record_type in SETTINGS_RECORDS.items()
+}
+
+
+def get_rail_defaults() -> Optional[RailDefaultsSettings]:
+    """Return the global rail defaults, or None if none have been saved."""
+    return _settings_caches[RailDefaults].get()
+
+
+def get_drawer_settings() -> Optional[DrawerSettings]:
+    """Return the global drawer settings, or None if none have been saved."""
+    return _settings_caches[DefaultDrawerSettings].get()
+
+
+def get_misc_door_settings() -> Optional[MiscDoorSettings]:
+    """Return the miscellaneous door settings, or None if none have been saved."""
+    return _settings_caches[MiscellaneousDoorSettings].get()
+
+
+def invalidate_settings(model) -> None:
+    """Discard the cached row of the singleton settings ``model``."""
+    _settings_caches[model].invalidate_on_commit()
@@ -0,0 +1,43 @@
+"""
+Signal handlers that keep the in-process caches in step with the database.
+"""
+from django.db.models.signals import post_save, post_delete
+
+from .services.catalog_cache import CATALOG_MODELS, invalidate_catalog
+from .services.settings_cache import SETTINGS_RECORDS, invalidate_settings
+
+
+def invalidate_catalog_cache(sender, **kwargs):
+    """Drop the cached catalog whenever a catalog row is saved or deleted."""
+    invalidate_catalog()
+
+
+for catalog_model in CATALOG_MODELS.values():
+    post_save.connect(
+        invalidate_catalog_cache,
+        sender=catalog_model,
+        dispatch_uid=f'catalog_cache_save_{catalog_model.__name__}'
+    )
+    post_delete.connect(
+        invalidate_catalog_cache,
+        sender=catalog_model,
+        dispatch_uid=f'catalog_cache_delete_{catalog_model.__name__}'
+    )
+
+
+def invalidate_settings_cache(sender, **kwargs):
+    """Reload a singleton settings row whenever it is saved or deleted."""
+    invalidate_settings(sender)
+
+
+for settings_model in SETTINGS_RECORDS:
+    post_save.connect(
+        invalidate_settings_cache,
+        sender=settings_model,
+        dispatch_uid=f'settings_cache_save_{settings_model.__name__}'
+    )
+    post_delete.connect(
+        invalidate_settings_cache,
+        sender=settings_model,
+        dispatch_uid=f'settings_cache_delete_{settings_model.__name__}'
+    )
@@ -0,0 +1,18 @@
+"""
+Template tags for the catalog tables of the settings pages.
+"""
+from django import template
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def include_row(context, table, row):
+    """
+    Render ``table``'s display row partial for ``row``, under the variable name
+    the partial expects, e.g. {% include_row table wood %} renders
+    wood_stock_row_display.html with ``wood``.
+    """
+    row_template = context.template.engine.get_template(table.display_template)
+    with context.push({table.row_name: row}):
+        return row_template.render(context)
@@ -1 +1,77 @@
-# Create your tests here.
+from datetime import date
+from decimal import Decimal
+from unittest import skipUnless
+
+from django.db import connection
+from django.db.models import F
+from django.test import TestCase, override_settings
+
+from .models import CacheVersion, Customer, Order
+from .models.door import DoorLineItem, WoodStock
+from .models.drawer import DrawerLineItem
+from .models.line_item import GenericLineItem
+from .services.catalog_cache import get_catalog
+from .views.common import search_and_filter_orders
+
+
+@skipUnless(connection.vendor == 'sqlite', "Query plans are checked on SQLite only")
+class QueryPlanTests(TestCase):
+    """The order list, order search and line item queries are served by the composite indexes."""
+
+    def assertUsesIndex(self, queryset, index_name):
+        """Assert the EXPLAIN QUERY PLAN of queryset uses index_name and needs no sort step."""
+        plan = queryset.explain()
+        self.assertIn(f'USING INDEX {index_name}', plan, plan)
+        self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', plan, plan)
+
+    def test_order_and_quote_lists(self):
+        self.assertUsesIndex(Order.confirmed.all(), 'order_confirmed_date_idx')
+        self.assertUsesIndex(Order.quotes.all(), 'order_quote_date_idx')
+
+    def test_order_search_by_date_range(self):
+        queryset = search_and_filter_orders(Order.confirmed.all(), {
+            'start_date': '2025-01-01',
+            'end_date': '2025-06-30',
+        })
+        self.assertUsesIndex(queryset, 'order_confirmed_date_idx')
+
+    def test_line_items_by_order(self):
+        for model, index_name in (
+            (DoorLineItem, 'dooritem_order_created_idx'),
+            (DrawerLineItem, 'draweritem_order_created_idx'),
+            (GenericLineItem, 'genericitem_order_created_idx'),
+        ):
+            with self.subTest(model=model.__name__):
+                queryset = model.objects.filter(order_id=1).order_by('-created_at')
+                self.assertUsesIndex(queryset, index_name)
+
+
+class OrderSearchTests(TestCase):
+    """Order and quote search filters."""
+
+    def test_customer_search_matches_inside_words(self):
+        customer = Customer.objects.create(
+            company_name='Redwood Cabinets', first_name='Ann', last_name='Lee',
+            address_line1='1 Main St', city='Eureka', state='CA', zip_code='95501',
+            phone='7075550100', fax='7075550101',
+        )
+        quote = Order.objects.create(customer=customer, is_quote=True, billing_address1='1 Main St',
+                                     order_date=date(2025, 3, 1))
+        queryset = search_and_filter_orders(Order.quotes.all(), {'customer_search': 'wood'})
+        self.assertEqual(list(queryset), [quote])
+
+
+@override_settings(CACHE_VERSION_CHECK_SECONDS=0)
+class SharedCacheVersionTests(TestCase):
+    """The catalog cache follows writes made by other processes through CacheVersion."""
+
+    def test_catalog_reloads_when_shared_version_changes(self):
+        wood_stock = WoodStock.objects.create(name='Oak', raised_panel_price='10.00', flat_panel_price='8.00')
+        self.assertEqual(get_catalog().get('wood_stock', wood_stock.pk).raised_panel_price, Decimal('10.00'))
+
+        # Another process changes the row; until it bumps the version the snapshot is kept
+        WoodStock.objects.filter(pk=wood_stock.pk).update(raised_panel_price='12.00')
+        self.assertEqual(get_catalog().get('wood_stock', wood_stock.pk).raised_panel_price, Decimal('10.00'))
+
+        CacheVersion.objects.filter(name='catalog').update(version=F('version') + 1)
+        self.assertEqual(get_catalog().get('wood_stock', wood_stock.pk).raised_panel_price, Decimal('12.00'))
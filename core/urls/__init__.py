@@ -12,4 +12,5 @@ urlpatterns = [
     path('drawers/', include('core.urls.drawer')),
     path('generic/', include('core.urls.generic')),
     path('settings/', include('core.urls.settings')),
+    path('pdf-jobs/', include('core.urls.pdf')),
 ] 
\ No newline at end of file
@@ -1,7 +1,9 @@
 from django.urls import path
 from ..views import door_form, add_door
+from ..views.door import door_price_preview
 
 urlpatterns = [
     path('form/', door_form, name='door_form'),
     path('add/', add_door, name='new_door'),
+    path('price-preview/', door_price_preview, name='door_price_preview'),
 ] 
\ No newline at end of file
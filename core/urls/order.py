@@ -1,7 +1,9 @@
 from django.urls import path
+from ..views.cut_list import cut_list, cut_plan
 from ..views.order import (
     orders, order_detail, create_order, delete_order,
-    get_customer_details, order_search, remove_line_item, generate_order_pdf
+    get_customer_details, order_search, remove_line_item, generate_order_pdf,
+    batch_print_orders
 )
 
 urlpatterns = [
@@ -12,5 +14,8 @@ urlpatterns = [
     path('<int:order_id>/pdf/', generate_order_pdf, name='order_pdf'),
     path('get-customer-address/', get_customer_details, name='get_customer_address'),
     path('search/', order_search, name='order_search'),
+    path('print/', batch_print_orders, name='order_batch_pdf'),
+    path('cut-list/', cut_list, name='cut_list'),
+    path('cut-plan/', cut_plan, name='cut_plan'),
     path('items/<int:item_id>/remove/', remove_line_item, name='remove_line_item'),
 ] 
\ No newline at end of file
@@ -0,0 +1,7 @@
+from django.urls import path
+from ..views.pdf import pdf_job_status, pdf_job_download
+
+urlpatterns = [
+    path('<str:job_id>/', pdf_job_status, name='pdf_job_status'),
+    path('<str:job_id>/download/', pdf_job_download, name='pdf_job_download'),
+]
@@ -1,5 +1,5 @@
 from django.urls import path
-from ..views.quote import quotes, quote_detail, create_quote, delete_quote, convert_to_order, generate_quote_pdf, quote_search
+from ..views.quote import quotes, quote_detail, create_quote, delete_quote, convert_to_order, generate_quote_pdf, quote_search, batch_print_quotes
 
 urlpatterns = [
     path('', quotes, name='quotes'),
@@ -9,4 +9,5 @@ urlpatterns = [
     path('<int:quote_id>/convert/', convert_to_order, name='convert_to_order'),
     path('<int:quote_id>/pdf/', generate_quote_pdf, name='quote_pdf'),
     path('search/', quote_search, name='quote_search'),
+    path('print/', batch_print_quotes, name='quote_batch_pdf'),
 ] 
\ No newline at end of file
@@ -3,36 +3,68 @@ Common view functions for order and quote listings and search functionality.
 """
 
 from django.shortcuts import render
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from decimal import Decimal, InvalidOperation
 
-from django_htmx.http import retarget
+from django_htmx.http import reswap, retarget
 
-from ..models import Customer
+from ..models import Customer, DoorLineItem
+from ..pagination import CursorPaginator
+from ..services.draft_order_service import DraftOrderService
+from ..services.pricing_engine import PricingEngine
 
+# Sort key for order and quote lists; matches the order_*_date_idx indexes
+ORDER_LIST_ORDERING = ('-order_date', '-id')
 
-def paginate_queryset(queryset, page, per_page=10):
+
+def get_priced_line_items(order):
     """
-    Paginate a queryset.
+    Load and price every line item of an order or quote in one pass.
     
     Args:
-        queryset: The queryset to paginate
-        page: The current page number
-        per_page: Number of items per page
+        order: The order or quote
         
     Returns:
-        paginated queryset
+        dict: door_items, drawer_items and generic_items for the detail
+              and PDF templates
+    """
+    # Get all door line items related to this order
+    door_items = list(DoorLineItem.objects.filter(order=order).select_related(
+        'wood_stock', 'edge_profile', 'panel_rise', 'style'
+    ))
+
+    # Get all drawer line items related to this order
+    drawer_items = list(order.drawer_items.all().select_related(
+        'wood_stock', 'edge_type', 'bottom'
+    ))
+
+    # Get all generic line items related to this order
+    generic_items = list(order.generic_items.all())
+
+    # Price everything against a single catalog snapshot
+    PricingEngine().price_batch(door_items + drawer_items + generic_items)
+
+    return {
+        'door_items': door_items,
+        'drawer_items': drawer_items,
+        'generic_items': generic_items,
+    }
+
+
+def paginate_queryset(queryset, cursor=None, per_page=10, ordering=ORDER_LIST_ORDERING):
     """
-    paginator = Paginator(queryset, per_page)
+    Paginate a queryset with keyset cursors.
     
-    try:
-        paginated_items = paginator.page(page)
-    except PageNotAnInteger:
-        paginated_items = paginator.page(1)
-    except EmptyPage:
-        paginated_items = paginator.page(paginator.num_pages)
+    Args:
+        queryset: The queryset to paginate
+        cursor: The opaque cursor from the request, or None for the first page
+        per_page: Number of items per page
+        ordering: Fields giving the queryset a total order, last one unique
         
-    return paginated_items, paginator
+    Returns:
+        tuple: (CursorPage, CursorPaginator)
+    """
+    paginator = CursorPaginator(queryset, ordering=ordering, per_page=per_page)
+    return paginator.page(cursor), paginator
 
 
 def search_and_filter_orders(queryset, search_params):
@@ -42,6 +74,7 @@ def search_and_filter_orders(queryset, search_params):
     Args:
         queryset: The base queryset of Order objects
         search_params: Dictionary containing search parameters
+            - ids: Comma separated list of order IDs
             - min_id: Minimum order ID
             - max_id: Maximum order ID
             - start_date: Start date for filtering
@@ -52,6 +85,7 @@ def search_and_filter_orders(queryset, search_params):
         Filtered queryset
     """
     # Extract search parameters
+    ids = search_params.get('ids', '')
     min_id = search_params.get('min_id', '')
     max_id = search_params.get('max_id', '')
     start_date = search_params.get('start_date', '')
@@ -59,6 +93,9 @@ def search_and_filter_orders(queryset, search_params):
     customer_query = search_params.get('customer_search', '').strip()
     
     # Apply ID filters if provided
+    if ids:
+        queryset = queryset.filter(id__in=[int(pk) for pk in ids.split(',') if pk.strip().isdigit()])
+    
     if min_id and min_id.isdigit():
         queryset = queryset.filter(id__gte=int(min_id))
     
@@ -81,7 +118,7 @@ def search_and_filter_orders(queryset, search_params):
         queryset = queryset.filter(customer__company_name__icontains=customer_query)
     
     # Order by descending order date (newest first)
-    queryset = queryset.order_by('-order_date')
+    queryset = queryset.order_by(*ORDER_LIST_ORDERING)
     
     return queryset
 
@@ -107,13 +144,13 @@ def handle_entity_search(request, base_queryset, template_name, entity_name='ite
         'end_date': request.GET.get('end_date', ''),
         'customer_search': request.GET.get('customer_search', '').strip()
     }
-    page = request.GET.get('page', 1)
+    cursor = request.GET.get('cursor')
 
     # Apply filters
     filtered_query = search_and_filter_orders(base_queryset, search_params)
     
     # Paginate the results
-    paginated_items, paginator = paginate_queryset(filtered_query, page)
+    paginated_items, paginator = paginate_queryset(filtered_query, cursor)
 
     # Prepare context
     context = {
@@ -144,11 +181,11 @@ def handle_entity_list(request, base_queryset, template_name, entity_name='items
     Returns:
         Rendered response with paginated results
     """
-    # Get page number
-    page = request.GET.get('page', 1)
+    # Get page cursor
+    cursor = request.GET.get('cursor')
     
     # Use common pagination function
-    paginated_items, paginator = paginate_queryset(base_queryset, page)
+    paginated_items, paginator = paginate_queryset(base_queryset, cursor)
     
     # Prepare context
     context = {
@@ -187,36 +224,25 @@ def render_form_with_errors(request, form, item_type, error_message=None):
         
     template_name = f"{item_type}/{item_type}_form.html"
     response = render(request, template_name, {'form': form})
-    return retarget(response, "#door-form-container")
+    # The add forms append rows to the table, so also swap the form back in place
+    return reswap(retarget(response, "#door-form-container"), "innerHTML")
 
 
 def process_line_item_form(request, form_class, model_class, item_type, transform_data_func=None):
     """
-    Process a line item form (door, drawer, etc.) and add to session.
+    Process a line item form (door, drawer, etc.) and add it to the draft order.
     
     Args:
         request: The HTTP request
         form_class: The form class to use for validation
         model_class: The model class to use for price calculation
         item_type: Type of item ('door', 'drawer', etc.)
-        transform_data_func: Optional function to transform cleaned data to session data
+        transform_data_func: Optional function to transform cleaned data to line item data
         
     Returns:
         Rendered response or JsonResponse (error)
     """
     try:
-        # Initialize order in session if it doesn't exist
-        if 'current_order' not in request.session:
-            request.session['current_order'] = {
-                'items': []
-            }
-            request.session.modified = True
-        
-        # Initialize items array if it doesn't exist
-        if 'items' not in request.session['current_order']:
-            request.session['current_order']['items'] = []
-            request.session.modified = True
-        
         # Use the form for validation
         form = form_class(request.POST)
         
@@ -262,14 +288,14 @@ def process_line_item_form(request, form_class, model_class, item_type, transfor
             # Return form with error message for price calculation issues
             return render_form_with_errors(request, form, item_type, f'Error calculating price: {str(e)}')
         
-        # Create session item data
+        # Create line item data
         try:
             if transform_data_func:
                 # Use custom transformation function if provided
-                session_item = transform_data_func(request, cleaned_data, item_model, item_type, custom_price, price)
+                item_data = transform_data_func(request, cleaned_data, item_model, item_type, custom_price, price)
             else:
                 # Default transformation (will need customization per item type)
-                session_item = {
+                item_data = {
                     'type': item_type,
                     'quantity': str(cleaned_data['quantity']),
                     'price_per_unit': str(item_model.price_per_unit),
@@ -280,18 +306,18 @@ def process_line_item_form(request, form_class, model_class, item_type, transfor
             # Return form with error message for data preparation issues
             return render_form_with_errors(request, form, item_type, f'Error preparing item data: {str(e)}')
         
-        # Add the item to the session order
+        # Add the item to the draft order
         try:
-            request.session['current_order']['items'].append(session_item)
-            # Mark session as modified
-            request.session.modified = True
+            draft = DraftOrderService.get(request, create=True)
+            item = DraftOrderService.add_item(draft, item_data)
         except Exception as e:
-            # Return form with error message for session update issues
+            # Return form with error message for draft update issues
             return render_form_with_errors(request, form, item_type, f'Error saving item to order: {str(e)}')
         
-        # Return updated line items table (success case - unmodified)
-        response = render(request, 'door/line_items_table.html', {
-            'items': request.session['current_order']['items']
+        # Return just the new row, appended to the table, and the new totals (success case - unmodified)
+        response = render(request, 'door/partials/line_item_change.html', {
+            'item': item,
+            'draft': draft
         })
         # No need to add retarget for success case as we'll use the default target
         return response
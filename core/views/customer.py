@@ -2,24 +2,21 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from ..forms import CustomerForm, CustomerDoorDefaultsForm, CustomerDrawerDefaultsForm
 from ..models import Customer
-from django.db import models
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from .common import paginate_queryset
 from ..services.door_defaults_service import DoorDefaultsService
+from ..services.drawer_defaults_service import DrawerDefaultsService
+from ..services.customer_search_service import CustomerSearchService
+
+# Sort key for customer lists
+CUSTOMER_LIST_ORDERING = ('-id',)
 
 def customers(request):
     customer_list = Customer.objects.all().order_by('-id')
     search_query = request.GET.get('search', '')
-    page = request.GET.get('page', 1)
-    
-    # Paginate results
-    paginator = Paginator(customer_list, 10)  # 10 customers per page
+    cursor = request.GET.get('cursor')
     
-    try:
-        all_customers = paginator.page(page)
-    except PageNotAnInteger:
-        all_customers = paginator.page(1)
-    except EmptyPage:
-        all_customers = paginator.page(paginator.num_pages)
+    # Paginate results, 10 customers per page, newest first
+    all_customers, paginator = paginate_queryset(customer_list, cursor, ordering=CUSTOMER_LIST_ORDERING)
     
     return render(request, 'customer/customers.html', {
         'customers': all_customers,
@@ -84,30 +81,17 @@ def delete_customer(request, customer_id):
 
 def customer_search(request):
     search_query = request.GET.get('search', '').strip().lower()
-    page = request.GET.get('page', 1)
+    cursor = request.GET.get('cursor')
     
     if not search_query:
         # If no search query, return all customers
         customer_list = Customer.objects.all().order_by('-id')
     else:
-        # Search across multiple fields
-        customer_list = Customer.objects.filter(
-            models.Q(company_name__icontains=search_query) |
-            models.Q(first_name__icontains=search_query) |
-            models.Q(last_name__icontains=search_query) |
-            models.Q(city__icontains=search_query) |
-            models.Q(phone__icontains=search_query)
-        ).order_by('-id')
+        # Ranked full-text search, falling back to icontains on other backends
+        customer_list = CustomerSearchService.search(search_query)
     
-    # Paginate results
-    paginator = Paginator(customer_list, 10)  # 10 customers per page
-    
-    try:
-        all_customers = paginator.page(page)
-    except PageNotAnInteger:
-        all_customers = paginator.page(1)
-    except EmptyPage:
-        all_customers = paginator.page(paginator.num_pages)
+    # Paginate results; ranked full-text results are paged by offset
+    all_customers, paginator = paginate_queryset(customer_list, cursor, ordering=CUSTOMER_LIST_ORDERING)
     
     # Return the paginated results with the appropriate template
     return render(request, 'customer/partials/customer_results.html', {
@@ -119,11 +103,12 @@ def customer_search(request):
 def customer_defaults(request, customer_id):
     customer = get_object_or_404(Customer, id=customer_id)
     door_defaults_service = DoorDefaultsService()
+    drawer_defaults_service = DrawerDefaultsService()
     
     if request.method == 'POST':
         if 'door_form' in request.POST:
             door_form = CustomerDoorDefaultsForm(request.POST)
-            drawer_form = CustomerDrawerDefaultsForm(initial=customer.get_drawer_defaults())
+            drawer_form = CustomerDrawerDefaultsForm(initial=drawer_defaults_service.get_defaults(customer))
             
             if door_form.is_valid():
                 # Use service to prepare data for storage
@@ -140,14 +125,8 @@ def customer_defaults(request, customer_id):
             drawer_form = CustomerDrawerDefaultsForm(request.POST)
             
             if drawer_form.is_valid():
-                # Convert model instances to IDs for JSON serialization
-                drawer_data = {}
-                for key, value in drawer_form.cleaned_data.items():
-                    if value is not None:
-                        if hasattr(value, 'pk'):  # If it's a model instance
-                            drawer_data[key] = value.pk
-                        else:  # For boolean fields and other primitives
-                            drawer_data[key] = value
+                # Use service to prepare data for storage
+                drawer_data = drawer_defaults_service.prepare_defaults_for_storage(drawer_form.cleaned_data)
                 
                 # Update customer's drawer_defaults
                 customer.drawer_defaults = drawer_data
@@ -157,7 +136,7 @@ def customer_defaults(request, customer_id):
     else:
         # For GET request, initialize the forms
         door_form = CustomerDoorDefaultsForm(initial=door_defaults_service.apply_defaults_to_form(customer))
-        drawer_form = CustomerDrawerDefaultsForm(initial=customer.get_drawer_defaults())
+        drawer_form = CustomerDrawerDefaultsForm(initial=drawer_defaults_service.get_defaults(customer))
     
     context = {
         'customer': customer,
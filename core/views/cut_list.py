@@ -0,0 +1,69 @@
+import csv
+
+from django.http import HttpResponse
+from django.shortcuts import render
+
+from ..models import Order
+from ..services.cut_list_service import CutListService
+from ..services.cutting_stock_service import CuttingStockService
+from .common import search_and_filter_orders
+
+# Search parameters that select the orders of a cut list
+FILTER_PARAMS = ('ids', 'min_id', 'max_id', 'start_date', 'end_date', 'customer_search')
+
+
+def cut_list(request):
+    """
+    Show the door cut list of the orders matching the search filters, or
+    download it as CSV with ``format=csv``.
+    """
+    filters = {name: request.GET.get(name, '') for name in FILTER_PARAMS}
+
+    # Only build a cut list once some orders have been picked
+    pieces = None
+    if any(filters.values()):
+        orders = search_and_filter_orders(Order.confirmed.all(), filters)
+        pieces = CutListService().for_orders(orders)
+
+        if request.GET.get('format') == 'csv':
+            response = HttpResponse(content_type='text/csv')
+            response['Content-Disposition'] = 'attachment; filename="cut_list.csv"'
+            csv.writer(response).writerows(pieces.csv_rows())
+            return response
+
+    query = request.GET.copy()
+    query['format'] = 'csv'
+    return render(request, 'order/cut_list.html', {
+        'title': 'Door Cut List',
+        'filters': filters,
+        'cut_list': pieces,
+        'csv_query': query.urlencode(),
+    })
+
+
+def cut_plan(request):
+    """
+    Show how the rails and stiles of the confirmed orders in a date window are
+    cut from boards, or download the board plans as CSV with ``format=csv``.
+    """
+    filters = {name: request.GET.get(name, '') for name in FILTER_PARAMS}
+
+    plan = None
+    if any(filters.values()):
+        orders = search_and_filter_orders(Order.confirmed.all(), filters)
+        plan = CuttingStockService().for_orders(orders)
+
+        if request.GET.get('format') == 'csv':
+            response = HttpResponse(content_type='text/csv')
+            response['Content-Disposition'] = 'attachment; filename="cut_plan.csv"'
+            csv.writer(response).writerows(plan.csv_rows())
+            return response
+
+    query = request.GET.copy()
+    query['format'] = 'csv'
+    return render(request, 'order/cut_plan.html', {
+        'title': 'Board Cutting Plan',
+        'filters': filters,
+        'plan': plan,
+        'csv_query': query.urlencode(),
+    })
@@ -3,8 +3,9 @@ from django.views.decorators.http import require_http_methods
 from ..forms import DoorForm
 from ..models.door import DoorLineItem
 from .common import process_line_item_form, get_current_customer
-from ..models import Customer
+from ..services.catalog_cache import get_catalog
 from ..services.door_defaults_service import DoorDefaultsService
+from ..services.draft_order_service import DraftOrderService
 
 @require_http_methods(["GET", "POST"])
 def door_form(request):
@@ -16,7 +17,7 @@ def door_form(request):
     # Initial data for the form
     initial_data = {}
     
-    # Check if we have a customer in the session
+    # Check if we have a customer on the draft order
     customer = get_current_customer(request)
     
     # If we have a customer, get their defaults
@@ -37,8 +38,26 @@ def door_form(request):
         'title': 'Add Door'
     })
 
+@require_http_methods(["GET"])
+def door_price_preview(request):
+    """
+    Show the unit and total price of the style and wood stock picked in the
+    door form, looked up in the catalog's price matrix.
+    """
+    unit_price = get_catalog().door_prices.price(request.GET.get('style'), request.GET.get('wood_stock'))
+    try:
+        quantity = max(int(request.GET.get('quantity', 1)), 1)
+    except (TypeError, ValueError):
+        quantity = 1
+
+    return render(request, 'door/partials/price_preview.html', {
+        'unit_price': unit_price,
+        'quantity': quantity,
+        'total_price': unit_price * quantity if unit_price is not None else None,
+    })
+
 def transform_door_data(request, cleaned_data, door_model, item_type, custom_price, price):
-    """Transform door form data to session format"""
+    """Transform door form data to draft line item format"""
     # Get customer defaults if available
     customer = get_current_customer(request)
     door_defaults_service = DoorDefaultsService()
@@ -72,7 +91,7 @@ def transform_door_data(request, cleaned_data, door_model, item_type, custom_pri
 def add_door(request):
     """
     View to handle adding a door.
-    Receives payload with door specifications and adds to session-based order.
+    Receives payload with door specifications and adds to the draft order.
     """
     return process_line_item_form(
         request, 
@@ -84,7 +103,7 @@ def add_door(request):
 
 def get_current_customer(request):
     """
-    Get the current customer from session or order
+    Get the customer of the current draft order
     
     Args:
         request: HTTP request object
@@ -92,14 +111,8 @@ def get_current_customer(request):
     Returns:
         Customer object or None
     """
-    # If we have a current order in the session
-    if 'current_order' in request.session:
-        # Check for customer key in the current_order
-        if 'customer' in request.session['current_order']:
-            customer_id = request.session['current_order']['customer']
-            try:
-                return Customer.objects.get(pk=customer_id)
-            except Customer.DoesNotExist:
-                pass
+    draft = DraftOrderService.get(request)
+    if draft is not None and draft.customer_id is not None:
+        return draft.customer
     
-    return None
\ No newline at end of file
+    return None
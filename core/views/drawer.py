@@ -4,6 +4,7 @@ from ..models.drawer import DrawerLineItem, DrawerWoodStock, DrawerEdgeType, Dra
 from ..forms import DrawerForm
 from .common import process_line_item_form
 from .door import get_current_customer
+from ..services.drawer_defaults_service import DrawerDefaultsService
 
 def drawer_form(request):
     """Render the drawer form partial template."""
@@ -14,42 +15,12 @@ def drawer_form(request):
     # Initial data for the form
     initial_data = {}
     
-    # Check if we have a customer in the session
+    # Check if we have a customer on the draft order
     customer = get_current_customer(request)
     
     # If we have a customer, get their defaults
     if customer:
-        drawer_defaults = customer.get_drawer_defaults()
-        
-        # Apply known defaults from JSON
-        if 'wood_stock' in drawer_defaults:
-            try:
-                wood_stock_id = drawer_defaults['wood_stock']
-                if isinstance(wood_stock_id, (int, str)):  # Ensure we have an ID
-                    initial_data['wood_stock'] = DrawerWoodStock.objects.get(pk=wood_stock_id)
-            except (DrawerWoodStock.DoesNotExist, ValueError, TypeError):
-                pass
-                
-        if 'edge_type' in drawer_defaults:
-            try:
-                edge_type_id = drawer_defaults['edge_type']
-                if isinstance(edge_type_id, (int, str)):  # Ensure we have an ID
-                    initial_data['edge_type'] = DrawerEdgeType.objects.get(pk=edge_type_id)
-            except (DrawerEdgeType.DoesNotExist, ValueError, TypeError):
-                pass
-                
-        if 'bottom' in drawer_defaults:
-            try:
-                bottom_id = drawer_defaults['bottom']
-                if isinstance(bottom_id, (int, str)):  # Ensure we have an ID
-                    initial_data['bottom'] = DrawerBottomSize.objects.get(pk=bottom_id)
-            except (DrawerBottomSize.DoesNotExist, ValueError, TypeError):
-                pass
-        
-        # Apply boolean options
-        for option in ['undermount', 'finishing']:
-            if option in drawer_defaults:
-                initial_data[option] = drawer_defaults[option]
+        initial_data = DrawerDefaultsService().get_defaults(customer)
     
     # Create form with initial data
     form = DrawerForm(initial=initial_data)
@@ -64,7 +35,7 @@ def drawer_form(request):
     return render(request, 'drawer/drawer_form.html', context)
 
 def transform_drawer_data(request, cleaned_data, drawer_model, item_type, custom_price, price):
-    """Transform drawer form data to session format"""
+    """Transform drawer form data to draft line item format"""
     return {
         'type': item_type,
         'wood_stock': {'id': cleaned_data['wood_stock'].pk, 'name': cleaned_data['wood_stock'].name},
@@ -85,7 +56,7 @@ def transform_drawer_data(request, cleaned_data, drawer_model, item_type, custom
 def add_drawer(request):
     """
     View to handle adding a drawer.
-    Receives payload with drawer specifications and adds to session-based order.
+    Receives payload with drawer specifications and adds to the draft order.
     """
     return process_line_item_form(
         request, 
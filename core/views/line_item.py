@@ -3,6 +3,7 @@ from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from ..models.door import WoodStock, Design, PanelType, EdgeProfile, PanelRise, Style
 from ..forms import GenericItemForm
+from ..services.draft_order_service import DraftOrderService
 
 def settings(request):
     """
@@ -65,10 +66,11 @@ def generic_item_form(request):
 def add_generic_item(request):
     """
     View to handle adding a generic/miscellaneous item.
-    Receives payload with item specifications and adds to session-based order.
+    Receives payload with item specifications and adds to the draft order.
     """
     try:
-        if not request.session.get("current_order"):
+        draft = DraftOrderService.get(request)
+        if draft is None:
             return JsonResponse({"error": "Select a customer."}, status=401)
         
         # Use the GenericItemForm for validation
@@ -99,13 +101,12 @@ def add_generic_item(request):
             'total_price': str(total_price)
         }
         
-        # Add the item to the session order
-        request.session['current_order']['items'].append(generic_item)
-        # Mark session as modified
-        request.session.modified = True
+        # Add the item to the draft order
+        item = DraftOrderService.add_item(draft, generic_item)
         
-        return render(request, 'door/line_items_table.html', {
-            'items': request.session['current_order']['items']
+        return render(request, 'door/partials/line_item_change.html', {
+            'item': item,
+            'draft': draft
         })
         
     except Exception as e:
@@ -1,18 +1,15 @@
-import io
-
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
-from django.template.loader import render_to_string
-from xhtml2pdf import pisa
 
 from ..forms import OrderForm
-from ..models import Order, DoorLineItem
+from ..models import Order
 from django.http import HttpResponse, JsonResponse
 from ..models.customer import Customer
-from ..models.door import DoorLineItem
 from itertools import chain
+from ..services.draft_order_service import DraftOrderService
 from ..services.order_service import OrderService
-from .common import handle_entity_search, handle_entity_list
+from .common import handle_entity_search, handle_entity_list, get_priced_line_items, search_and_filter_orders
+from .pdf import serve_order_pdf, start_batch_print
 
 
 def orders(request):
@@ -29,24 +26,9 @@ def orders(request):
 def order_detail(request, order_id):
     order = get_object_or_404(Order.confirmed, id=order_id)
 
-    # Get all door line items related to this order
-    door_items = DoorLineItem.objects.filter(order=order).select_related(
-        'wood_stock', 'edge_profile', 'panel_rise', 'style'
-    )
-
-    # Get all drawer line items related to this order
-    drawer_items = order.drawer_items.all().select_related(
-        'wood_stock', 'edge_type', 'bottom'
-    )
-
-    # Get all generic line items related to this order
-    generic_items = order.generic_items.all()
-
     return render(request, 'order/order_detail.html', {
         'order': order,
-        'door_items': door_items,
-        'drawer_items': drawer_items,
-        'generic_items': generic_items,
+        **get_priced_line_items(order),
         'title': f'Order {order.order_number}'
     })
 
@@ -55,30 +37,31 @@ def create_order(request):
         form = OrderForm(request.POST)
         if form.is_valid():
             # Check if there are items in the order
-            session_data = request.session.get('current_order', {})
-            items = session_data.get('items', [])
+            draft = DraftOrderService.get(request)
 
-            if not items:
+            if draft is None or not draft.items.exists():
                 messages.error(request, "You need to add at least one item to create an order.")
-                return render(request, 'order/order_form.html', {'form': form, 'title': 'Create Order'}, status=422)
+                return render(request, 'order/order_form.html', {
+                    'form': form, 'title': 'Create Order', 'line_items': DraftOrderService.items(draft)
+                }, status=422)
 
             # Check if a customer is associated with the order
-            if 'customer' not in session_data:
+            if draft.customer_id is None:
                 messages.error(request, "Please select a customer for this order.")
-                return render(request, 'order/order_form.html', {'form': form, 'title': 'Create Order'}, status=422)
+                return render(request, 'order/order_form.html', {
+                    'form': form, 'title': 'Create Order', 'line_items': DraftOrderService.items(draft)
+                }, status=422)
 
             # Use OrderService to create the order
             success, order, error = OrderService.create_from_session(
                 form.cleaned_data,
-                session_data,
+                draft,
                 is_quote=False
             )
 
             if success:
-                # Clear session data
-                if 'current_order' in request.session:
-                    del request.session['current_order']
-                    request.session.modified = True
+                # Discard the draft it was created from
+                DraftOrderService.discard(request)
 
                 messages.success(request, 'Order created successfully!')
                 return redirect('order_detail', order_id=order.id)
@@ -91,7 +74,9 @@ def create_order(request):
                 else:
                     messages.error(request, error)
 
-                return render(request, 'order/order_form.html', {'form': form, 'title': 'Create Order'}, status=422)
+                return render(request, 'order/order_form.html', {
+                    'form': form, 'title': 'Create Order', 'line_items': DraftOrderService.items(draft)
+                }, status=422)
         else:
             # Form validation failed, display error messages
             for field, errors in form.errors.items():
@@ -102,12 +87,12 @@ def create_order(request):
                         messages.error(request, f"{form[field].label}: {error}")
 
             # Return the form with errors and 422 status code
-            return render(request, 'order/order_form.html', {'form': form, 'title': 'Create Order'}, status=422)
+            return render(request, 'order/order_form.html', {
+                'form': form, 'title': 'Create Order', 'line_items': DraftOrderService.items(DraftOrderService.get(request))
+            }, status=422)
     else:
-        # Clear session data when first accessing the page (GET request)
-        if 'current_order' in request.session:
-            del request.session['current_order']
-            request.session.modified = True
+        # Start with an empty draft when first accessing the page (GET request)
+        DraftOrderService.discard(request)
 
         form = OrderForm()
 
@@ -165,20 +150,9 @@ def get_customer_details(request):
             }
         }
 
-        # Preserve existing items when changing customers
-        existing_items = []
-        if 'current_order' in request.session and 'items' in request.session['current_order']:
-            existing_items = request.session['current_order']['items']
-
-        # Update order in session with new customer data but keep existing items
-        request.session['current_order'] = {
-            'customer': customer_id,
-            'billing_address1': billing_address1,
-            'billing_address2': billing_address2,
-            'items': existing_items
-        }
-
-        request.session.modified = True
+        # Point the draft at the new customer but keep its existing items
+        draft = DraftOrderService.get(request, create=True)
+        DraftOrderService.set_customer(draft, customer, billing_address1, billing_address2)
 
         return JsonResponse(response_data)
     except (Customer.DoesNotExist, ValueError):
@@ -207,30 +181,20 @@ def order_search(request):
 def remove_line_item(request, item_id):
     """
     Remove a line item from the current order
-    Handles both database-persisted items and session-based items
+    Handles both database-persisted items and draft order items
     """
     if request.method == 'DELETE':
-        # First, check if we're working with a session-based order
-        if 'current_order' in request.session:
-            # Handle session-based item deletion
-            try:
-                # In session, item_id is actually the index of the item in the array
-                index = int(item_id)
-                if 'items' in request.session['current_order'] and 0 <= index < len(request.session['current_order']['items']):
-                    # Remove the item at the specified index
-                    request.session['current_order']['items'].pop(index)
-                    # Mark session as modified
-                    request.session.modified = True
-                    # Return the updated line items table
-                    return render(request, 'door/line_items_table.html', {
-                        'items': request.session['current_order']['items']
-                    })
-                else:
-                    return HttpResponse("Item not found in session", status=404)
-            except (ValueError, IndexError):
-                return HttpResponse("Invalid item index", status=400)
-
-        # If not using session, handle database-persisted items
+        # First, check if we're working with a draft order
+        draft = DraftOrderService.get(request)
+        if draft is not None:
+            if not DraftOrderService.remove_item(draft, item_id):
+                return HttpResponse("Item not found in draft order", status=404)
+            # The row removes itself; return the new totals out of band
+            return render(request, 'door/partials/line_item_change.html', {
+                'draft': draft
+            })
+
+        # If not using a draft, handle database-persisted items
         order_id = request.session.get('order_id')
         if not order_id:
             return HttpResponse("No active order", status=400)
@@ -278,42 +242,14 @@ def generate_order_pdf(request, order_id):
     # Get the order and related data
     order = get_object_or_404(Order.confirmed, id=order_id)
 
-    # Get all door line items related to this order
-    door_items = DoorLineItem.objects.filter(order=order).select_related(
-        'wood_stock', 'edge_profile', 'panel_rise', 'style'
+    # Serve the cached PDF, or render it in the background PDF workers
+    return serve_order_pdf(
+        request, order, 'pdf/order_pdf.html', f'order_{order.order_number}.pdf',
+        lambda: {'order': order, **get_priced_line_items(order)}
     )
 
-    # Get all drawer line items related to this order
-    drawer_items = order.drawer_items.all().select_related(
-        'wood_stock', 'edge_type', 'bottom'
-    )
 
-    # Get all generic line items related to this order
-    generic_items = order.generic_items.all()
-
-    # Prepare context for the template
-    context = {
-        'order': order,
-        'door_items': door_items,
-        'drawer_items': drawer_items,
-        'generic_items': generic_items,
-    }
-
-    # Render the HTML template
-    html_string = render_to_string('pdf/order_pdf.html', context)
-
-    # Create a file-like buffer to receive PDF data
-    result = io.BytesIO()
-
-    # Convert HTML to PDF
-    pdf = pisa.pisaDocument(io.BytesIO(html_string.encode("UTF-8")), result)
-
-    # Check if PDF generation was successful
-    if not pdf.err:
-        # Create HTTP response with PDF content
-        response = HttpResponse(result.getvalue(), content_type='application/pdf')
-        response['Content-Disposition'] = f'attachment; filename="order_{order.order_number}.pdf"'
-        return response
-    else:
-        # Return error response if PDF generation failed
-        return HttpResponse('Error generating PDF', status=500)
+def batch_print_orders(request):
+    """Print every order matching the search filters as one merged PDF or a ZIP."""
+    orders = search_and_filter_orders(Order.confirmed.all(), request.GET)
+    return start_batch_print(request, orders, is_quote=False)
@@ -0,0 +1,118 @@
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.shortcuts import render
+from django_htmx.http import HttpResponseClientRedirect
+
+from ..services.batch_print_service import FORMATS, BatchPrintService
+from ..services.pdf_cache_service import PdfCacheService
+from ..services.pdf_job_service import PdfJobService
+
+
+def serve_order_pdf(request, order, template_name, filename, get_context):
+    """
+    Serve the PDF of an order or quote from the PDF cache, rendering it in the
+    background on a miss.
+    
+    Args:
+        request: The HTTP request
+        order: The order or quote to print
+        template_name: The PDF template
+        filename: File name offered to the browser
+        get_context: Callable building the template context; only called on a miss
+        
+    Returns:
+        HttpResponse: The cached file, or the status of the render job
+    """
+    path = PdfCacheService.path_for(order, template_name)
+    if PdfCacheService.get(path):
+        if request.htmx:
+            # Let the browser fetch the file itself so it is saved as a download
+            return HttpResponseClientRedirect(request.get_full_path())
+        try:
+            return FileResponse(
+                open(path, 'rb'),
+                as_attachment=True,
+                filename=filename,
+                content_type='application/pdf'
+            )
+        except FileNotFoundError:
+            pass  # Evicted since the check; render it again
+
+    job = PdfJobService.submit(template_name, get_context(), filename, path=path)
+    job.future.add_done_callback(lambda f: PdfCacheService.evict())
+    return pdf_job_response(request, job)
+
+
+def start_batch_print(request, queryset, is_quote=False):
+    """
+    Print every order or quote of a queryset into one merged PDF, or a ZIP
+    of PDFs when ``format=zip`` is requested.
+    
+    Args:
+        request: The HTTP request
+        queryset: Filtered orders or quotes, in print order
+        is_quote: Whether the queryset holds quotes
+        
+    Returns:
+        HttpResponse: The status of the batch job, or a message if nothing can be printed
+    """
+    entity_name = 'quotes' if is_quote else 'orders'
+    file_format = request.GET.get('format', 'pdf')
+    if file_format not in FORMATS:
+        file_format = 'pdf'
+
+    count = queryset.count()
+    if not count:
+        return pdf_message_response(request, f"No {entity_name} match the current filters.")
+    if count > settings.PDF_BATCH_LIMIT:
+        return pdf_message_response(
+            request, f"{count} {entity_name} match; narrow the filters to at most {settings.PDF_BATCH_LIMIT}."
+        )
+
+    service = BatchPrintService(queryset, is_quote=is_quote)
+    job = service.submit(service.prepare(), file_format)
+    return pdf_job_response(request, job)
+
+
+def pdf_message_response(request, message):
+    """Render a message in place of a PDF job status."""
+    template = 'pdf/partials/pdf_message.html' if request.htmx else 'pdf/pdf_job.html'
+    return render(request, template, {'message': message, 'title': 'Print'})
+
+
+def pdf_job_response(request, job):
+    """
+    Render the status of a queued PDF job.
+    HTMX requests get the polling partial; plain requests get a full page around it.
+    """
+    template = 'pdf/partials/pdf_job_status.html' if request.htmx else 'pdf/pdf_job.html'
+    return render(request, template, {
+        'job': job,
+        'title': f'Preparing {job.filename}'
+    }, status=202)
+
+
+def pdf_job_status(request, job_id):
+    """Return the current status of a PDF job; polled by HTMX until it finishes."""
+    job = PdfJobService.get(job_id)
+    if job is None:
+        return HttpResponse("PDF job not found", status=404)
+
+    return render(request, 'pdf/partials/pdf_job_status.html', {'job': job})
+
+
+def pdf_job_download(request, job_id):
+    """Serve the finished file of a job."""
+    job = PdfJobService.get(job_id)
+    if job is None or job.status != 'done':
+        return HttpResponse("PDF not available", status=404)
+
+    try:
+        return FileResponse(
+            open(job.path, 'rb'),
+            as_attachment=True,
+            filename=job.filename,
+            content_type=job.content_type
+        )
+    except FileNotFoundError:
+        return HttpResponse("PDF no longer available, please print it again", status=410)
@@ -2,13 +2,11 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from ..forms import QuoteForm
 from ..models import Order
-from ..models.door import DoorLineItem
-from django.http import HttpResponse
-from django.template.loader import render_to_string
+from ..services.draft_order_service import DraftOrderService
 from ..services.order_service import OrderService
-from .common import handle_entity_search, handle_entity_list
-from xhtml2pdf import pisa
-import io
+from .common import handle_entity_search, handle_entity_list, get_priced_line_items, search_and_filter_orders
+from .pdf import serve_order_pdf, start_batch_print
+
 
 def quotes(request):
     """List all quotes with pagination."""
@@ -24,24 +22,9 @@ def quotes(request):
 def quote_detail(request, quote_id):
     quote = get_object_or_404(Order.quotes, id=quote_id)
 
-    # Get all door line items related to this quote
-    door_items = DoorLineItem.objects.filter(order=quote).select_related(
-        'wood_stock', 'edge_profile', 'panel_rise', 'style'
-    )
-
-    # Get all drawer line items related to this quote
-    drawer_items = quote.drawer_items.all().select_related(
-        'wood_stock', 'edge_type', 'bottom'
-    )
-
-    # Get all generic line items related to this quote
-    generic_items = quote.generic_items.all()
-
     return render(request, 'quote/quote_detail.html', {
         'quote': quote,
-        'door_items': door_items,
-        'drawer_items': drawer_items,
-        'generic_items': generic_items,
+        **get_priced_line_items(quote),
         'title': f'Quote {quote.order_number}'
     })
 
@@ -50,30 +33,31 @@ def create_quote(request):
         form = QuoteForm(request.POST)
         if form.is_valid():
             # Check if there are items in the quote
-            session_data = request.session.get('current_order', {})
-            items = session_data.get('items', [])
+            draft = DraftOrderService.get(request)
 
-            if not items:
+            if draft is None or not draft.items.exists():
                 messages.error(request, "You need to add at least one item to create a quote.")
-                return render(request, 'quote/quote_form.html', {'form': form, 'title': 'Create Quote'}, status=422)
+                return render(request, 'quote/quote_form.html', {
+                    'form': form, 'title': 'Create Quote', 'line_items': DraftOrderService.items(draft)
+                }, status=422)
 
             # Check if a customer is associated with the quote
-            if 'customer' not in session_data:
+            if draft.customer_id is None:
                 messages.error(request, "Please select a customer for this quote.")
-                return render(request, 'quote/quote_form.html', {'form': form, 'title': 'Create Quote'}, status=422)
+                return render(request, 'quote/quote_form.html', {
+                    'form': form, 'title': 'Create Quote', 'line_items': DraftOrderService.items(draft)
+                }, status=422)
 
             # Use OrderService to create the quote
             success, quote, error = OrderService.create_from_session(
                 form.cleaned_data,
-                session_data,
+                draft,
                 is_quote=True
             )
 
             if success:
-                # Clear session data
-                if 'current_order' in request.session:
-                    del request.session['current_order']
-                    request.session.modified = True
+                # Discard the draft it was created from
+                DraftOrderService.discard(request)
 
                 messages.success(request, 'Quote created successfully!')
                 return redirect('quote_detail', quote_id=quote.id)
@@ -86,7 +70,9 @@ def create_quote(request):
                 else:
                     messages.error(request, error)
 
-                return render(request, 'quote/quote_form.html', {'form': form, 'title': 'Create Quote'}, status=422)
+                return render(request, 'quote/quote_form.html', {
+                    'form': form, 'title': 'Create Quote', 'line_items': DraftOrderService.items(draft)
+                }, status=422)
         else:
             # Form validation failed, display error messages
             for field, errors in form.errors.items():
@@ -97,12 +83,12 @@ def create_quote(request):
                         messages.error(request, f"{form[field].label}: {error}")
 
             # Return the form with errors and 422 status code
-            return render(request, 'quote/quote_form.html', {'form': form, 'title': 'Create Quote'}, status=422)
+            return render(request, 'quote/quote_form.html', {
+                'form': form, 'title': 'Create Quote', 'line_items': DraftOrderService.items(DraftOrderService.get(request))
+            }, status=422)
     else:
-        # Clear session data when first accessing the page (GET request)
-        if 'current_order' in request.session:
-            del request.session['current_order']
-            request.session.modified = True
+        # Start with an empty draft when first accessing the page (GET request)
+        DraftOrderService.discard(request)
 
         form = QuoteForm()
 
@@ -151,42 +137,14 @@ def generate_quote_pdf(request, quote_id):
     # Get the quote and related data
     quote = get_object_or_404(Order.quotes, id=quote_id)
 
-    # Get all door line items related to this quote
-    door_items = DoorLineItem.objects.filter(order=quote).select_related(
-        'wood_stock', 'edge_profile', 'panel_rise', 'style'
-    )
-
-    # Get all drawer line items related to this quote
-    drawer_items = quote.drawer_items.all().select_related(
-        'wood_stock', 'edge_type', 'bottom'
+    # Serve the cached PDF, or render it in the background PDF workers
+    return serve_order_pdf(
+        request, quote, 'pdf/quote_pdf.html', f'quote_{quote.order_number}.pdf',
+        lambda: {'quote': quote, **get_priced_line_items(quote)}
     )
 
-    # Get all generic line items related to this quote
-    generic_items = quote.generic_items.all()
 
-    # Prepare context for the template
-    context = {
-        'quote': quote,
-        'door_items': door_items,
-        'drawer_items': drawer_items,
-        'generic_items': generic_items,
-    }
-
-    # Render the HTML template
-    html_string = render_to_string('pdf/quote_pdf.html', context)
-
-    # Create a file-like buffer to receive PDF data
-    result = io.BytesIO()
-
-    # Convert HTML to PDF
-    pdf = pisa.pisaDocument(io.BytesIO(html_string.encode("UTF-8")), result)
-
-    # Check if PDF generation was successful
-    if not pdf.err:
-        # Create HTTP response with PDF content
-        response = HttpResponse(result.getvalue(), content_type='application/pdf')
-        response['Content-Disposition'] = f'attachment; filename="quote_{quote.order_number}.pdf"'
-        return response
-    else:
-        # Return error response if PDF generation failed
-        return HttpResponse('Error generating PDF', status=500)
+def batch_print_quotes(request):
+    """Print every quote matching the search filters as one merged PDF or a ZIP."""
+    quotes = search_and_filter_orders(Order.quotes.all(), request.GET)
+    return start_batch_print(request, quotes, is_quote=True)
@@ -0,0 +1,190 @@
+"""
+Benchmark SQLite under the concurrency of the waitress thread pool.
+
+Runs the same mixed workload from several threads against a scratch copy of
+the database, once with SQLite's stock settings and once with the tuning of
+settings.SQLITE_PRAGMAS and the IMMEDIATE transaction mode, and reports the
+throughput, latency and number of "database is locked" errors of each.
+
+Usage:
+    python scripts/sqlite_contention_benchmark.py
+    python scripts/sqlite_contention_benchmark.py --threads 6 --seconds 20 --source db.sqlite3
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import django
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Setup Django environment
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'DoorsAndDrawers.settings')
+django.setup()
+
+from django.conf import settings
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.management import call_command
+from django.db import OperationalError, connection, connections
+
+from core.models.draft import DraftOrder
+from core.services.draft_order_service import DraftOrderService
+
+# Share of operations that only read; the rest is split between session saves and
+# adding or removing draft line items
+READ_SHARE = 0.6
+SESSION_SHARE = 0.2
+
+ITEM = {
+    'type': 'door', 'width': '12.0000', 'height': '30.0000', 'quantity': 2,
+    'price_per_unit': '45.00', 'total_price': '90.00',
+}
+
+
+class WorkerStats:
+    """Results of one benchmark thread."""
+
+    def __init__(self):
+        self.latencies = []
+        self.locked = 0
+        self.errors = 0
+
+
+def use_database(path, options, pragmas):
+    """Point the default connection at ``path`` with the given OPTIONS and PRAGMAs."""
+    connection.close()
+    database = connections.settings['default']
+    database['NAME'] = path
+    database['OPTIONS'] = dict(options)
+    settings.SQLITE_PRAGMAS = dict(pragmas)
+
+
+def worker(seed, start, seconds, stats):
+    """Run the mixed workload on this thread's own connection for ``seconds``."""
+    rng = random.Random(seed)
+    session_key = None
+    draft = None
+    start.wait()
+    deadline = time.perf_counter() + seconds
+
+    while time.perf_counter() < deadline:
+        began = time.perf_counter()
+        try:
+            if draft is None:
+                draft = DraftOrder.objects.create()
+
+            choice = rng.random()
+            if choice < READ_SHARE:
+                # Page render: load the session, the draft and its items
+                SessionStore(session_key).load()
+                DraftOrder.objects.filter(pk=draft.pk).first()
+                DraftOrderService.items(draft)
+            elif choice < READ_SHARE + SESSION_SHARE:
+                session = SessionStore(session_key)
+                session['draft_order_id'] = draft.pk
+                session['last_seen'] = began
+                session.save()
+                session_key = session.session_key
+            elif draft.item_count >= 5:
+                # Reads the row before deleting it, in one transaction
+                oldest = draft.items.values_list('pk', flat=True).first()
+                DraftOrderService.remove_item(draft, oldest)
+            else:
+                DraftOrderService.add_item(draft, ITEM)
+        except OperationalError as exc:
+            if 'locked' in str(exc):
+                stats.locked += 1
+            else:
+                stats.errors += 1
+            continue
+        stats.latencies.append(time.perf_counter() - began)
+
+    connection.close()
+
+
+def run(path, threads, seconds):
+    """Run the workload against ``path`` from ``threads`` threads; returns the merged stats."""
+    results = [WorkerStats() for _ in range(threads)]
+    start = threading.Barrier(threads + 1)
+    pool = [
+        threading.Thread(target=worker, args=(seed, start, seconds, stats))
+        for seed, stats in enumerate(results)
+    ]
+    for thread in pool:
+        thread.start()
+    start.wait()
+    began = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - began
+
+    merged = WorkerStats()
+    for stats in results:
+        merged.latencies.extend(stats.latencies)
+        merged.locked += stats.locked
+        merged.errors += stats.errors
+    merged.latencies.sort()
+    merged.elapsed = elapsed
+    return merged
+
+
+def percentile(values, share):
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * share))] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--threads', type=int, default=6, help='Concurrent threads, as waitress runs (default 6)')
+    parser.add_argument('--seconds', type=float, default=10, help='Duration of each run (default 10)')
+    parser.add_argument('--source', help='Copy this database instead of migrating an empty one')
+    args = parser.parse_args()
+
+    tuned_options = dict(connections.settings['default'].get('OPTIONS', {}))
+    tuned_pragmas = dict(getattr(settings, 'SQLITE_PRAGMAS', {}))
+    modes = [
+        ('stock', {}, {}),
+        ('tuned', tuned_options, tuned_pragmas),
+    ]
+
+    workdir = tempfile.mkdtemp(prefix='sqlite_bench_')
+    try:
+        template = os.path.join(workdir, 'template.sqlite3')
+        if args.source:
+            shutil.copyfile(args.source, template)
+        else:
+            use_database(template, {}, {})
+            call_command('migrate', verbosity=0)
+        connection.close()
+
+        print(f"{args.threads} threads, {args.seconds:g}s per run, "
+              f"{READ_SHARE:.0%} reads / {SESSION_SHARE:.0%} session saves / "
+              f"{1 - READ_SHARE - SESSION_SHARE:.0%} draft item writes")
+        print(f"{'mode':<8}{'ops':>8}{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'locked':>8}{'other':>7}")
+        for name, options, pragmas in modes:
+            path = os.path.join(workdir, f'{name}.sqlite3')
+            shutil.copyfile(template, path)
+            use_database(path, options, pragmas)
+            stats = run(path, args.threads, args.seconds)
+            ops = len(stats.latencies)
+            print(
+                f"{name:<8}{ops:>8}{ops / stats.elapsed:>10.1f}"
+                f"{percentile(stats.latencies, 0.50):>10.1f}"
+                f"{percentile(stats.latencies, 0.95):>10.1f}"
+                f"{percentile(stats.latencies, 0.99):>10.1f}"
+                f"{stats.locked:>8}{stats.errors:>7}"
+            )
+    finally:
+        connection.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()